@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Direct ABI decoding untuk field `data` attestation EAS
+
+Schema string (mis. "uint64 twitterUserId, uint64 yapScaledPoints, ...") di-compile
+sekali jadi decoder; hex `data` langsung di-parse per 32-byte word, tanpa perlu
+request dan json.loads decodedDataJson.
+"""
+
+import functools
+import re
+
+WORD_HEX = 64
+
+_FIELD_RE = re.compile(r'^\s*([A-Za-z0-9_]+(?:\[\d*\])*)\s+([A-Za-z0-9_]+)\s*$')
+
+
+class ABIDecodeError(ValueError):
+    """Schema tidak didukung atau data tidak valid"""
+
+
+def _static_decoder(type_name):
+    """Return fungsi word_hex -> value untuk static scalar type, atau None"""
+    if '[' in type_name:
+        # Array (termasuk fixed-size T[N]) bukan scalar satu word
+        return None
+    if type_name.startswith('uint'):
+        return lambda word: int(word, 16)
+    if type_name.startswith('int'):
+        bits = int(type_name[3:] or 256)
+
+        def decode_int(word):
+            value = int(word, 16) & ((1 << bits) - 1)
+            return value - (1 << bits) if value >> (bits - 1) else value
+        return decode_int
+    if type_name == 'bool':
+        return lambda word: int(word, 16) != 0
+    if type_name == 'address':
+        return lambda word: '0x' + word[-40:]
+    match = re.fullmatch(r'bytes(\d+)', type_name)
+    if match:
+        size = int(match.group(1))
+        return lambda word: '0x' + word[:size * 2]
+    return None
+
+
+def parse_schema(schema):
+    """Schema string -> list (name, type)"""
+    fields = []
+    for part in schema.split(','):
+        match = _FIELD_RE.match(part)
+        if not match:
+            raise ABIDecodeError(f"Field tidak dikenali: {part!r}")
+        fields.append((match.group(2), match.group(1)))
+    return fields
+
+
+class SchemaDecoder:
+    """Compiled decoder untuk satu EAS schema string"""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.fields = parse_schema(schema)
+
+        self.names = tuple(name for name, _ in self.fields)
+        self.types = tuple(type_name for _, type_name in self.fields)
+        # (kind, decoder): kind 'static' = nilai di head, 'string'/'bytes'/'array' = offset di head
+        self._plan = []
+        for type_name in self.types:
+            if type_name == 'string':
+                self._plan.append(('string', None))
+            elif type_name == 'bytes':
+                self._plan.append(('bytes', None))
+            elif re.search(r'\[\d+\]', type_name):
+                raise ABIDecodeError(f"Fixed-size array tidak didukung: {type_name}")
+            elif type_name.endswith('[]'):
+                element = _static_decoder(type_name[:-2])
+                if element is None:
+                    raise ABIDecodeError(f"Array type tidak didukung: {type_name}")
+                self._plan.append(('array', element))
+            else:
+                decoder = _static_decoder(type_name)
+                if decoder is None:
+                    raise ABIDecodeError(f"Type tidak didukung: {type_name}")
+                self._plan.append(('static', decoder))
+
+        self.all_static = all(kind == 'static' for kind, _ in self._plan)
+        self._static_decoders = tuple(decoder for _, decoder in self._plan) if self.all_static else None
+
+    def decode_values(self, data):
+        """Hex data (0x...) -> tuple values sesuai urutan field"""
+        if not data:
+            raise ABIDecodeError("Data kosong")
+        hex_data = data[2:] if data.startswith('0x') else data
+        if len(hex_data) < WORD_HEX * len(self.fields):
+            raise ABIDecodeError("Data lebih pendek dari jumlah field")
+        try:
+            return self._decode_hex(hex_data)
+        except (ValueError, IndexError) as e:
+            # Hex tidak valid / offset dynamic di luar data
+            raise ABIDecodeError(f"Data tidak valid: {e}") from e
+
+    def _read_word(self, hex_data, start):
+        word = hex_data[start:start + WORD_HEX]
+        if len(word) < WORD_HEX:
+            raise ABIDecodeError("Data terpotong")
+        return word
+
+    def _decode_hex(self, hex_data):
+        if self.all_static:
+            # Fast path schema fixed-width: satu slice + int() per field
+            return tuple(
+                decoder(hex_data[i * WORD_HEX:(i + 1) * WORD_HEX])
+                for i, decoder in enumerate(self._static_decoders)
+            )
+
+        values = []
+        for i, (kind, decoder) in enumerate(self._plan):
+            word = hex_data[i * WORD_HEX:(i + 1) * WORD_HEX]
+            if kind == 'static':
+                values.append(decoder(word))
+                continue
+            start = int(word, 16) * 2
+            length = int(self._read_word(hex_data, start), 16)
+            body_start = start + WORD_HEX
+            if kind == 'array':
+                if body_start + length * WORD_HEX > len(hex_data):
+                    raise ABIDecodeError("Array terpotong")
+                values.append([
+                    decoder(hex_data[body_start + j * WORD_HEX:body_start + (j + 1) * WORD_HEX])
+                    for j in range(length)
+                ])
+                continue
+            raw = hex_data[body_start:body_start + length * 2]
+            if len(raw) < length * 2:
+                raise ABIDecodeError("String / bytes terpotong")
+            if kind == 'string':
+                values.append(bytes.fromhex(raw).decode('utf-8', errors='replace'))
+            else:
+                values.append('0x' + raw)
+        return tuple(values)
+
+    def decode(self, data):
+        """Hex data -> dict {field name: value}"""
+        return dict(zip(self.names, self.decode_values(data)))
+
+    def decode_typed(self, data):
+        """Hex data -> list (name, type, value), pengganti decodedDataJson"""
+        return list(zip(self.names, self.types, self.decode_values(data)))
+
+
+@functools.lru_cache(maxsize=256)
+def compile_schema(schema):
+    """Compile schema string sekali (cached)"""
+    return SchemaDecoder(schema)
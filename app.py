@@ -4,20 +4,64 @@ YAPS Content Generator - AI-powered content generator untuk maximize YAPS points
 Bahasa Indonesia
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, g, render_template, request, jsonify, stream_with_context
+import hashlib
+import json
 import os
-from openai import OpenAI
-import requests
+import http_client
+import llm_client
+import metrics
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import queue
+from singleflight import upstream_flight, request_key
+from content_pool import ContentPool
+import batch_scoring
+from scoring import analyze_yaps_score, build_content_analysis
+import eas
+from live_tail import AttestationTail
+from yaps_index import UserScoreIndex
 
 app = Flask(__name__)
 
-def fetch_kaito_projects():
-    """Fetch top 20 projects dari Kaito Pre-TGE realtime"""
+KAITO_PRE_TGE_URL = "https://yaps.kaito.ai/pre-tge"
+KAITO_CACHE_TTL = float(os.getenv('KAITO_CACHE_TTL', '300'))
+# Jeda minimal antar scrape setelah scrape gagal / kosong
+KAITO_FAILURE_BACKOFF = float(os.getenv('KAITO_FAILURE_BACKOFF', '30'))
+
+# Process-wide cache untuk project list Kaito (stale-while-revalidate)
+_projects_cache = {
+    'projects': None,
+    'fetched_at': 0.0,
+    'failed_at': 0.0,
+    'fallback': False,
+    'refreshing': False,
+    'hits': 0,
+    'stale_hits': 0,
+    'misses': 0,
+    'refreshes': 0,
+    'refresh_errors': 0,
+}
+_projects_lock = threading.Lock()
+
+def scrape_kaito_projects():
+    """Scrape top 20 projects dari Kaito Pre-TGE, return None jika gagal.
+    Concurrent scrape (cold miss / cache expiry) di-coalesce jadi satu request."""
+    return upstream_flight.do(request_key(KAITO_PRE_TGE_URL), _scrape_kaito_projects)
+
+def _scrape_kaito_projects():
     try:
-        response = requests.get("https://yaps.kaito.ai/pre-tge", timeout=10)
+        with metrics.UPSTREAM_LATENCY.time(upstream='kaito', operation='pre_tge'):
+            try:
+                response = http_client.get(KAITO_PRE_TGE_URL, timeout=(3.05, 10), retries=1)
+            except Exception as e:
+                metrics.UPSTREAM_ERRORS.inc(upstream='kaito', operation='pre_tge', reason=type(e).__name__)
+                raise
         if response.status_code != 200:
-            return get_fallback_projects()
+            metrics.UPSTREAM_ERRORS.inc(upstream='kaito', operation='pre_tge', reason=f'http_{response.status_code}')
+            return None
         
         html = response.text
         projects = []
@@ -37,10 +81,69 @@ def fetch_kaito_projects():
                 })
                 seen.add(match)
         
-        return projects if projects else get_fallback_projects()
+        return projects or None
         
-    except:
-        return get_fallback_projects()
+    except Exception:
+        return None
+
+def _store_projects(projects):
+    """Simpan hasil scrape ke cache; hasil gagal tidak menimpa data lama.
+    Jika belum ada data sama sekali, fallback list di-cache sebagai data stale,
+    jadi request berikutnya tidak scrape inline lagi (refresh di background)."""
+    with _projects_lock:
+        _projects_cache['refreshing'] = False
+        _projects_cache['refreshes'] += 1
+        if projects:
+            _projects_cache['projects'] = projects
+            _projects_cache['fetched_at'] = time.time()
+            _projects_cache['fallback'] = False
+        else:
+            _projects_cache['refresh_errors'] += 1
+            _projects_cache['failed_at'] = time.time()
+            if _projects_cache['projects'] is None:
+                _projects_cache['projects'] = get_fallback_projects()
+                _projects_cache['fallback'] = True
+
+def _refresh_projects_background():
+    """Refresh cache di background thread"""
+    _store_projects(scrape_kaito_projects())
+
+def fetch_kaito_projects():
+    """Fetch top 20 projects dari Kaito Pre-TGE (cached, stale-while-revalidate)"""
+    with _projects_lock:
+        projects = _projects_cache['projects']
+        if projects is not None:
+            age = time.time() - _projects_cache['fetched_at']
+            if age < KAITO_CACHE_TTL:
+                _projects_cache['hits'] += 1
+                return projects
+            
+            # Stale: langsung serve data lama, refresh di background
+            # (setelah scrape gagal, tunggu KAITO_FAILURE_BACKOFF dulu)
+            _projects_cache['stale_hits'] += 1
+            backing_off = time.time() - _projects_cache['failed_at'] < KAITO_FAILURE_BACKOFF
+            if not _projects_cache['refreshing'] and not backing_off:
+                _projects_cache['refreshing'] = True
+                threading.Thread(target=_refresh_projects_background, daemon=True).start()
+            return projects
+        
+        _projects_cache['misses'] += 1
+    
+    # Cold miss (sekali per proses): fetch sinkron, gagal = fallback ikut di-cache
+    projects = scrape_kaito_projects()
+    _store_projects(projects)
+    return projects if projects else get_fallback_projects()
+
+def get_projects_cache_stats():
+    """Statistik cache project list (umur cache & hit/miss counters)"""
+    with _projects_lock:
+        stats = {k: v for k, v in _projects_cache.items() if k != 'projects'}
+        stats['cached_projects'] = len(_projects_cache['projects'] or [])
+    stats['ttl'] = KAITO_CACHE_TTL
+    stats['age'] = round(time.time() - stats['fetched_at'], 3) if stats['fetched_at'] else None
+    lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+    stats['hit_ratio'] = round((stats['hits'] + stats['stale_hits']) / lookups, 4) if lookups else None
+    return stats
 
 def get_fallback_projects():
     """Fallback jika fetch gagal"""
@@ -147,41 +250,83 @@ LENGTH: 150-280 karakter optimal"""
     }
 }
 
+# Metrics per route (/metrics, Prometheus text format)
+HTTP_LATENCY = metrics.histogram(
+    'yaps_http_request_duration_seconds', 'Latency request per route (SSE: sampai response headers)',
+    ('route', 'method')
+)
+HTTP_REQUESTS = metrics.counter(
+    'yaps_http_requests_total', 'Jumlah request per route dan status', ('route', 'method', 'status')
+)
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def _record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        # Label pakai rule (/api/yaps/<twitter_id>), bukan path mentah, supaya cardinality terbatas
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_LATENCY.observe(time.perf_counter() - started, route=route, method=request.method)
+        HTTP_REQUESTS.inc(route=route, method=request.method, status=response.status_code)
+    return response
+
+@app.route('/metrics')
+def metrics_endpoint():
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
 @app.route('/')
 def index():
     projects = fetch_kaito_projects()
     return render_template('index.html', projects=projects, prompts=PROMPT_TEMPLATES)
 
-@app.route('/generate', methods=['POST'])
-def generate_content():
-    try:
-        data = request.json
-        if not data:
-            return jsonify({'error': 'Invalid request'}), 400
-        
-        project_name = data.get('project')
-        prompt_type = data.get('prompt_type')
-        
-        projects = fetch_kaito_projects()
-        project = next((p for p in projects if p['name'] == project_name), None)
-        if not project:
-            return jsonify({'error': 'Project tidak ditemukan'}), 400
-        
-        if prompt_type not in PROMPT_TEMPLATES:
-            return jsonify({'error': 'Prompt type tidak valid'}), 400
-        
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            return jsonify({
-                'error': 'OpenAI API Key belum diset',
-                'message': 'Silakan set OPENAI_API_KEY di Secrets'
-            }), 400
-        
-        client = OpenAI(api_key=api_key)
-        
-        prompt_template = PROMPT_TEMPLATES[prompt_type]
-        
-        user_message = f"""Generate konten Twitter untuk project: {project_name}
+@app.route('/cache/stats')
+def cache_stats():
+    return jsonify({
+        'kaito_projects': get_projects_cache_stats(),
+        'upstream_singleflight': upstream_flight.stats()
+    })
+
+@app.route('/pool/stats')
+def pool_stats():
+    return jsonify(content_pool.stats())
+
+@app.route('/llm/stats')
+def llm_stats():
+    return jsonify(llm_client.get_latency_stats())
+
+def validate_generate_request(data):
+    """Validate payload generate, return (project, prompt_type, api_key, error_response)"""
+    if not data:
+        return None, None, None, (jsonify({'error': 'Invalid request'}), 400)
+    
+    project_name = data.get('project')
+    prompt_type = data.get('prompt_type')
+    
+    projects = fetch_kaito_projects()
+    project = next((p for p in projects if p['name'] == project_name), None)
+    if not project:
+        return None, None, None, (jsonify({'error': 'Project tidak ditemukan'}), 400)
+    
+    if prompt_type not in PROMPT_TEMPLATES:
+        return None, None, None, (jsonify({'error': 'Prompt type tidak valid'}), 400)
+    
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        return None, None, None, (jsonify({
+            'error': 'OpenAI API Key belum diset',
+            'message': 'Silakan set OPENAI_API_KEY di Secrets'
+        }), 400)
+    
+    return project, prompt_type, api_key, None
+
+def build_generation_messages(project, prompt_type):
+    """Build chat messages untuk generate tweet"""
+    prompt_template = PROMPT_TEMPLATES[prompt_type]
+    
+    user_message = f"""Generate konten Twitter untuk project: {project['name']}
 
 Category: {project['category']}
 Current Mindshare: {project['mindshare']}
@@ -195,34 +340,229 @@ Buat 1 tweet berkualitas tinggi yang:
 6. 150-280 karakter
 
 Generate HANYA konten tweet-nya. Jangan include penjelasan atau metadata."""
+    
+    return [
+        {"role": "system", "content": prompt_template['system']},
+        {"role": "user", "content": user_message}
+    ]
 
+GENERATION_PARAMS = {
+    "model": "gpt-4o-mini",
+    "temperature": 0.8,
+    "max_tokens": 500
+}
+
+def generate_tweet(project, prompt_type, api_key):
+    """Generate + score satu tweet untuk (project, prompt_type)"""
+    client = llm_client.get_openai_client(api_key)
+    
+    with llm_client.timed_call('generate') as timing:
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": prompt_template['system']},
-                {"role": "user", "content": user_message}
-            ],
-            temperature=0.8,
-            max_tokens=500
+            messages=build_generation_messages(project, prompt_type),
+            **GENERATION_PARAMS
         )
+        timing['usage'] = response.usage
+    
+    generated_content = response.choices[0].message.content
+    if generated_content:
+        generated_content = generated_content.strip()
+    else:
+        generated_content = ""
+    
+    return {
+        'content': generated_content,
+        'project': project,
+        'prompt_type': prompt_type,
+        'scoring': analyze_yaps_score(generated_content)
+    }
+
+# Pool hasil generate siap pakai (opt-in): setiap refill = satu OpenAI call tambahan,
+# jadi default 0; set CONTENT_POOL_DEPTH=2 untuk mengaktifkan
+content_pool = ContentPool(
+    generate_tweet,
+    target_depth=int(os.getenv('CONTENT_POOL_DEPTH', '0')),
+    max_age=float(os.getenv('CONTENT_POOL_MAX_AGE', '3600')),
+    workers=int(os.getenv('CONTENT_POOL_WORKERS', '2'))
+)
+CONTENT_POOL_PREWARM = os.getenv('CONTENT_POOL_PREWARM', '0') == '1'
+
+@app.route('/generate', methods=['POST'])
+def generate_content():
+    try:
+        project, prompt_type, api_key, error = validate_generate_request(request.json)
+        if error:
+            return error
         
-        generated_content = response.choices[0].message.content
-        if generated_content:
-            generated_content = generated_content.strip()
-        else:
-            generated_content = ""
+        projects = fetch_kaito_projects()
+        content_pool.retain_projects(projects)
+        if CONTENT_POOL_PREWARM:
+            content_pool.prewarm(projects, PROMPT_TEMPLATES, api_key)
         
-        scoring = analyze_yaps_score(generated_content)
+        result = content_pool.pop(project, prompt_type, api_key)
+        if result is None:
+            result = generate_tweet(project, prompt_type, api_key)
         
-        return jsonify({
+        return jsonify(result)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def sse_event(event, data):
+    """Format satu Server-Sent Event dengan JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/generate/stream', methods=['GET', 'POST'])
+def generate_content_stream():
+    """Streaming variant dari /generate: token dikirim sebagai SSE begitu diterima,
+    scoring dikirim sebagai event terakhir ('done').
+    POST dengan JSON body, atau GET ?project=...&prompt_type=... untuk EventSource."""
+    data = request.get_json(silent=True) if request.method == 'POST' else request.args.to_dict()
+    project, prompt_type, api_key, error = validate_generate_request(data)
+    if error:
+        return error
+    
+    messages = build_generation_messages(project, prompt_type)
+    
+    def stream():
+        # Event pertama langsung di-flush supaya TTFB tidak menunggu model
+        yield sse_event('start', {'project': project, 'prompt_type': prompt_type})
+        
+        chunks = []
+        try:
+            client = llm_client.get_openai_client(api_key)
+            with llm_client.timed_call('generate_stream') as timing:
+                # timed_call men-close stream saat keluar, termasuk saat client disconnect
+                # (GeneratorExit di yield), supaya koneksi kembali ke pool shared client
+                timing['stream'] = completion = client.chat.completions.create(
+                    messages=messages,
+                    stream=True,
+                    # Chunk terakhir (tanpa choices) membawa token usage
+                    stream_options={'include_usage': True},
+                    **GENERATION_PARAMS
+                )
+                for chunk in completion:
+                    if not chunk.choices:
+                        if getattr(chunk, 'usage', None) is not None:
+                            timing['usage'] = chunk.usage
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        if not chunks:
+                            timing['first_token'] = time.perf_counter()
+                        chunks.append(delta)
+                        yield sse_event('token', {'text': delta})
+        except Exception as e:
+            yield sse_event('error', {'error': str(e)})
+            return
+        
+        generated_content = "".join(chunks).strip()
+        yield sse_event('done', {
             'content': generated_content,
             'project': project,
             'prompt_type': prompt_type,
-            'scoring': scoring
+            'scoring': analyze_yaps_score(generated_content)
         })
-        
+    
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+# Default = batas koneksi shared OpenAI client: lebih dari itu hanya antre di pool httpx
+GENERATE_BATCH_CONCURRENCY = int(os.getenv('GENERATE_BATCH_CONCURRENCY', str(llm_client.MAX_CONNECTIONS)))
+GENERATE_BATCH_MAX_ITEMS = 100
+
+def _generate_batch_item(index, item, projects_by_name, api_key):
+    """Generate satu item batch; error per item tidak menggagalkan seluruh batch"""
+    project_name = item.get('project') if isinstance(item, dict) else None
+    prompt_type = item.get('prompt_type') if isinstance(item, dict) else None
+    
+    project = projects_by_name.get(project_name)
+    if not project:
+        return {'index': index, 'project': project_name, 'prompt_type': prompt_type, 'error': 'Project tidak ditemukan'}
+    if prompt_type not in PROMPT_TEMPLATES:
+        return {'index': index, 'project': project_name, 'prompt_type': prompt_type, 'error': 'Prompt type tidak valid'}
+    
+    try:
+        result = generate_tweet(project, prompt_type, api_key)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return {'index': index, 'project': project_name, 'prompt_type': prompt_type, 'error': str(e)}
+    result['index'] = index
+    return result
+
+@app.route('/generate/batch', methods=['POST'])
+def generate_batch():
+    """Generate banyak (project, prompt_type) sekaligus secara concurrent.
+    Body: {"items": [{"project": ..., "prompt_type": ...}], "concurrency": 20, "stream": false}
+    atau {"all": true} untuk semua project × semua prompt type.
+    Dengan "stream": true, hasil dikirim sebagai SSE 'result' begitu selesai."""
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({'error': 'Invalid request'}), 400
+    
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        return jsonify({
+            'error': 'OpenAI API Key belum diset',
+            'message': 'Silakan set OPENAI_API_KEY di Secrets'
+        }), 400
+    
+    projects = fetch_kaito_projects()
+    projects_by_name = {p['name']: p for p in projects}
+    
+    if data.get('all'):
+        items = [{'project': p['name'], 'prompt_type': t} for p in projects for t in PROMPT_TEMPLATES]
+    else:
+        items = data.get('items')
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'items harus berupa list (project, prompt_type)'}), 400
+    if len(items) > GENERATE_BATCH_MAX_ITEMS:
+        return jsonify({'error': f'Maksimal {GENERATE_BATCH_MAX_ITEMS} items per batch'}), 400
+    
+    try:
+        concurrency = int(data.get('concurrency', GENERATE_BATCH_CONCURRENCY))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'concurrency harus integer'}), 400
+    concurrency = max(1, min(concurrency, GENERATE_BATCH_CONCURRENCY, len(items)))
+    
+    def run():
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        futures = [
+            executor.submit(_generate_batch_item, i, item, projects_by_name, api_key)
+            for i, item in enumerate(items)
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        except GeneratorExit:
+            # Client disconnect: jangan tunggu semua LLM call, batalkan yang belum jalan
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+    
+    if data.get('stream'):
+        def stream():
+            yield sse_event('start', {'total': len(items), 'concurrency': concurrency})
+            failed = 0
+            for result in run():
+                failed += 'error' in result
+                yield sse_event('result', result)
+            yield sse_event('done', {'total': len(items), 'failed': failed})
+        
+        return Response(stream_with_context(stream()), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+    
+    started = time.perf_counter()
+    results = sorted(run(), key=lambda r: r['index'])
+    return jsonify({
+        'results': results,
+        'total': len(results),
+        'failed': sum(1 for r in results if 'error' in r),
+        'concurrency': concurrency,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+    })
 
 @app.route('/analyze', methods=['POST'])
 def analyze_content():
@@ -234,296 +574,212 @@ def analyze_content():
         if not content:
             return jsonify({"error": "Content required"}), 400
         
-        # === KAITO YAPS ANALYSIS ===
-        char_count = len(content)
-        optimal_length = 150 <= char_count <= 280
-        min_length = char_count >= 50
-        
-        # Crypto keywords detection
-        crypto_keywords = ['defi', 'layer', 'l2', 'ai', 'rwa', 'tvl', 'airdrop', 'protocol', 'chain', 'token', 'nft', 'dao', 'staking', 'yield', 'bridge', 'zk', 'rollup', 'evm', 'smart contract']
-        content_lower = content.lower()
-        keyword_count = sum(1 for kw in crypto_keywords if kw in content_lower)
-        has_crypto_focus = keyword_count >= 1
-        
-        # Keyword stuffing detection
-        keyword_stuffing = keyword_count > 5
-        
-        # Original insight
-        generic_phrases = ['to the moon', 'lfg', 'gm', 'ser', 'ngmi', 'wagmi', 'bullish', 'bearish']
-        generic_count = sum(1 for phrase in generic_phrases if phrase in content_lower)
-        is_original = generic_count < 2
-        
-        # 1. CONTENT OPTIMIZATION (30%)
-        content_opt_score = 0
-        if min_length: content_opt_score += 2
-        if optimal_length: content_opt_score += 3
-        if has_crypto_focus: content_opt_score += 3
-        if is_original: content_opt_score += 2
-        content_opt_score = min(10, content_opt_score)
-        
-        # 2. ENGAGEMENT STRATEGY (50%)
-        has_question = '?' in content
-        has_data = any(char.isdigit() for char in content)
-        has_cta = any(word in content_lower for word in ['what', 'how', 'why', 'thoughts', 'think', 'opinion', 'apa', 'bagaimana', 'mengapa', 'gimana'])
-        
-        engagement_score = 0
-        if has_question: engagement_score += 4
-        if has_data: engagement_score += 3
-        if has_cta: engagement_score += 3
-        engagement_score = min(10, engagement_score)
-        
-        # 3. CONTENT QUALITY (20%)
-        has_metrics = bool(re.search(r'\d+[%$MBK]|\$\d+|\d+x', content))
-        has_analysis = len(content.split()) > 15
-        no_spam_pattern = not bool(re.search(r'(.)\1{3,}', content))
-        
-        quality_score = 0
-        if has_metrics: quality_score += 4
-        if has_analysis: quality_score += 3
-        if no_spam_pattern: quality_score += 3
-        quality_score = min(10, quality_score)
-        
-        # === TWITTER ALGORITHM ANALYSIS ===
-        # Based on Twitter's engagement weights
-        twitter_score = 0
-        twitter_factors = []
-        
-        # Reply potential (75x weight in Twitter algo)
-        if has_question:
-            twitter_score += 35
-            twitter_factors.append("✅ Question drives replies (75x Twitter weight)")
-        
-        # Conversation starter (27-30x weight)
-        if has_cta or '?' in content:
-            twitter_score += 25
-            twitter_factors.append("✅ Conversation starter (30x weight)")
-        
-        # Rich content (higher engagement)
-        if has_data or has_metrics:
-            twitter_score += 15
-            twitter_factors.append("✅ Data-rich content (better retention)")
-        
-        # Optimal length for engagement
-        if 50 <= char_count <= 280:
-            twitter_score += 15
-            twitter_factors.append("✅ Optimal length (not cut off)")
-        else:
-            twitter_factors.append("⚠️ Length not optimal for feed")
-        
-        # Recency/velocity potential (first 30 mins critical)
-        if not any(spam in content_lower for spam in ['follow', 'rt', 'like if']):
-            twitter_score += 10
-            twitter_factors.append("✅ No engagement farming (avoid penalty)")
-        else:
-            twitter_score -= 20
-            twitter_factors.append("❌ Engagement farming detected (-74x penalty risk)")
-        
-        # Twitter penalties check
-        twitter_penalties = []
-        if keyword_stuffing:
-            twitter_score -= 15
-            twitter_penalties.append("⚠️ Keyword stuffing may trigger spam filter")
-        
-        if content_lower.count('http') > 1:
-            twitter_score -= 10
-            twitter_penalties.append("⚠️ Multiple links reduce reach by ~30%")
-        
-        if '@' in content and content.count('@') > 3:
-            twitter_score -= 10
-            twitter_penalties.append("⚠️ Too many mentions may reduce distribution")
-        
-        twitter_score = max(0, min(100, twitter_score))
-        
-        # === HIGH-SCORING CONTENT TYPES ===
-        content_types = []
-        if 'tvl' in content_lower or 'revenue' in content_lower:
-            content_types.append("📊 Protocol analysis")
-        if has_metrics and ('vs' in content_lower or 'compare' in content_lower):
-            content_types.append("⚖️ Comparison analysis")
-        if 'airdrop' in content_lower and 'risk' in content_lower:
-            content_types.append("💰 Airdrop strategy")
-        if re.search(r'thread|1/', content_lower):
-            content_types.append("🧵 Thread format")
-        
-        # === KAITO PENALTIES ===
-        kaito_penalties = []
-        if keyword_stuffing:
-            kaito_penalties.append("⚠️ Keyword stuffing detected")
-        if 'kaito' in content_lower and '@' in content:
-            kaito_penalties.append("⚠️ Avoid tagging Kaito")
-        if generic_count >= 3:
-            kaito_penalties.append("⚠️ Too many generic phrases")
-        if char_count < 50:
-            kaito_penalties.append("⚠️ Too short (min 50 chars)")
-        if not has_crypto_focus:
-            kaito_penalties.append("⚠️ No crypto-specific topic")
-        
-        # === OPTIMIZATION SUGGESTIONS ===
-        suggestions = []
-        if not has_question:
-            suggestions.append("💡 Add question untuk drive discussion (75x Twitter boost)")
-        if not has_data:
-            suggestions.append("💡 Include metrics/data untuk credibility")
-        if char_count < 150:
-            suggestions.append("💡 Expand to 150-280 chars (optimal range)")
-        if not content_types:
-            suggestions.append("💡 Try protocol deep-dive atau comparison format")
-        if not is_original:
-            suggestions.append("💡 Add personal analysis/unique insight")
-        if not has_cta:
-            suggestions.append("💡 Add call-to-action untuk conversation")
-        
-        # === WEIGHTED SCORES ===
-        kaito_total = (content_opt_score * 0.3) + (engagement_score * 0.5) + (quality_score * 0.2)
-        kaito_total = round(kaito_total, 1)
-        
-        # Estimated YAPS Points
-        estimated_yaps = int(kaito_total * 0.7 * 75)
-        
-        # Ratings
-        if kaito_total >= 9:
-            kaito_rating = "⭐⭐⭐⭐⭐ Excellent - High YAPS potential!"
-        elif kaito_total >= 7:
-            kaito_rating = "⭐⭐⭐⭐ Good - Solid content"
-        elif kaito_total >= 5:
-            kaito_rating = "⭐⭐⭐ Fair - Needs improvement"
-        else:
-            kaito_rating = "⭐⭐ Poor - Optimize further"
-        
-        if twitter_score >= 80:
-            twitter_rating = "🚀 Viral Potential - High engagement expected"
-        elif twitter_score >= 60:
-            twitter_rating = "📈 Good Reach - Above average distribution"
-        elif twitter_score >= 40:
-            twitter_rating = "📊 Moderate Reach - Standard distribution"
-        else:
-            twitter_rating = "📉 Low Reach - Needs optimization"
-        
         return jsonify({
             "success": True,
-            "analysis": {
-                "kaito_yaps": {
-                    "total_score": kaito_total,
-                    "rating": kaito_rating,
-                    "estimated_yaps": estimated_yaps,
-                    "breakdown": {
-                        "content_optimization": {
-                            "score": content_opt_score,
-                            "weight": "30%",
-                            "details": {
-                                "length": f"{char_count} chars" + (" ✅ optimal" if optimal_length else " ⚠️ adjust to 150-280"),
-                                "crypto_focus": "✅ Yes" if has_crypto_focus else "❌ No crypto topic",
-                                "originality": "✅ Original" if is_original else "⚠️ Too generic",
-                                "keywords": f"{keyword_count} keywords" + (" ✅" if 1 <= keyword_count <= 3 else " ⚠️")
-                            }
-                        },
-                        "engagement_strategy": {
-                            "score": engagement_score,
-                            "weight": "50%",
-                            "details": {
-                                "question": "✅ Yes" if has_question else "❌ No",
-                                "data_driven": "✅ Yes" if has_data else "❌ No data/metrics",
-                                "cta": "✅ Yes" if has_cta else "❌ No call-to-action"
-                            }
-                        },
-                        "content_quality": {
-                            "score": quality_score,
-                            "weight": "20%",
-                            "details": {
-                                "metrics": "✅ Includes metrics" if has_metrics else "❌ No specific metrics",
-                                "depth": "✅ Detailed analysis" if has_analysis else "⚠️ Surface-level",
-                                "spam_check": "✅ Clean" if no_spam_pattern else "⚠️ Spam pattern"
-                            }
-                        }
-                    },
-                    "penalties": kaito_penalties if kaito_penalties else ["✅ No penalties detected"]
-                },
-                "twitter_algorithm": {
-                    "score": twitter_score,
-                    "rating": twitter_rating,
-                    "engagement_factors": twitter_factors if twitter_factors else ["ℹ️ Basic content"],
-                    "penalties": twitter_penalties if twitter_penalties else ["✅ No Twitter penalties"],
-                    "algorithm_notes": [
-                        "📊 Reply weight: 75x (most powerful)",
-                        "🔄 Retweet weight: 10x",
-                        "❤️ Like weight: 1x",
-                        "⏰ First 30 mins critical for velocity",
-                        "🚫 Avoid: keyword stuffing, external links, engagement farming"
-                    ]
-                },
-                "content_types": content_types if content_types else ["ℹ️ Standard tweet format"],
-                "suggestions": suggestions if suggestions else ["✅ Content is well-optimized!"]
-            }
+            "analysis": build_content_analysis(content)
         })
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-def analyze_yaps_score(content):
-    """Simple scoring analysis untuk generate endpoint"""
-    score = {
-        'crypto_relevance': 0,
-        'engagement_potential': 0,
-        'semantic_quality': 0,
-        'total': 0,
-        'feedback': []
-    }
-    
-    if len(content) >= 50:
-        score['crypto_relevance'] += 3
-        score['feedback'].append('✅ Length optimal (50+ chars)')
-    
-    crypto_keywords = ['DeFi', 'L2', 'TVL', 'funding', 'protocol', 'AI', 'crypto', 'blockchain']
-    if any(kw.lower() in content.lower() for kw in crypto_keywords):
-        score['crypto_relevance'] += 4
-        score['feedback'].append('✅ Crypto-relevant topics')
-    
-    if any(char.isdigit() for char in content):
-        score['crypto_relevance'] += 3
-        score['feedback'].append('✅ Contains data/metrics')
-    else:
-        score['feedback'].append('⚠️ Tidak ada data numerik')
-    
-    tags_count = content.count('@')
-    if tags_count <= 2:
-        score['engagement_potential'] += 5
-        score['feedback'].append(f'✅ Tags optimal ({tags_count} tags)')
+ANALYZE_BATCH_MAX_ITEMS = int(os.getenv('ANALYZE_BATCH_MAX_ITEMS', '200000'))
+
+def _parse_batch_texts():
+    """Ambil list teks dari JSON (array / {"texts": [...]}), NDJSON, atau text/plain (satu teks per baris).
+    Options (mis. aggregate) dari query string; key di JSON body object menang."""
+    options = request.args.to_dict()
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        items = [json.loads(line) for line in request.get_data(as_text=True).splitlines() if line.strip()]
+    elif request.mimetype == 'text/plain':
+        # Baris mentah, bukan JSON: kutip / backslash di teks tidak di-decode
+        items = [line for line in request.get_data(as_text=True).splitlines() if line.strip()]
     else:
-        score['engagement_potential'] += 2
-        score['feedback'].append(f'⚠️ Terlalu banyak tags ({tags_count})')
-    
-    if '?' in content:
-        score['engagement_potential'] += 3
-        score['feedback'].append('✅ Ada question untuk engagement')
+        # JSON rusak -> ValueError (400 "Invalid JSON"), bukan "texts harus berupa list"
+        data = json.loads(request.get_data(as_text=True)) if request.is_json else None
+        if isinstance(data, dict):
+            options.update(data)
+            items = data.get('texts')
+        else:
+            items = data
     
-    if len(content) <= 280:
-        score['engagement_potential'] += 2
-        score['feedback'].append('✅ Twitter-friendly length')
+    if not isinstance(items, list):
+        return None, options
+    texts = []
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get('content', item.get('text', ''))
+        texts.append(item if isinstance(item, str) else '')
+    return texts, options
+
+@app.route('/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """Bulk analyze: JSON array / {"texts": [...], "aggregate": true}, NDJSON atau text/plain (satu teks per baris).
+    Response compact: satu row per teks dengan kolom sesuai "fields" (null untuk teks kosong)."""
+    try:
+        texts, options = _parse_batch_texts()
+    except ValueError:
+        return jsonify({"error": "Invalid JSON / NDJSON"}), 400
+    if texts is None:
+        return jsonify({"error": "texts harus berupa list"}), 400
+    if len(texts) > ANALYZE_BATCH_MAX_ITEMS:
+        return jsonify({"error": f"Maksimal {ANALYZE_BATCH_MAX_ITEMS} teks per batch"}), 400
     
-    if any(word in content.lower() for word in ['kenapa', 'bagaimana', 'mengapa', 'analisis', 'thesis']):
-        score['semantic_quality'] += 3
-        score['feedback'].append('✅ Analytical tone')
+    started = time.perf_counter()
+    rows = batch_scoring.score_texts(texts)
     
-    if not any(spam in content.lower() for spam in ['gm', 'gn', 'lfg', 'wagmi']):
-        score['semantic_quality'] += 4
-        score['feedback'].append('✅ Tidak ada spam phrases')
+    result = {
+        "success": True,
+        "fields": batch_scoring.SCORE_FIELDS,
+        "results": rows,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+    if str(options.get('aggregate', '')).lower() in ('1', 'true'):
+        result["aggregate"] = batch_scoring.aggregate_scores(rows)
+    return jsonify(result)
+
+# Live tail attestations YAPS: satu poller dibagi ke semua SSE subscriber
+LIVE_TAIL_SCHEMAS = [s.strip() for s in os.getenv('LIVE_TAIL_SCHEMAS', '517,546,525').split(',') if s.strip()]
+LIVE_TAIL_KEEPALIVE = 15
+live_tail = AttestationTail([eas.resolve_schema(s) for s in LIVE_TAIL_SCHEMAS])
+
+@app.route('/yaps/live')
+def yaps_live():
+    """SSE stream attestation baru (event 'attestation' berisi decoded fields + delta points).
+    Filter opsional: ?schema=517 dan/atau ?user=<twitterUserId>."""
+    schema_uid = None
+    if request.args.get('schema'):
+        try:
+            schema_uid = eas.resolve_schema(request.args['schema'])
+        except (eas.EASQueryError, ValueError):
+            return jsonify({'error': 'Schema tidak dikenal'}), 400
+        if schema_uid not in live_tail.schema_uids:
+            return jsonify({'error': 'Schema tidak di-tail', 'schemas': live_tail.schema_uids}), 400
+    user_id = request.args.get('user')
     
-    if len(content.split()) > 15:
-        score['semantic_quality'] += 3
-        score['feedback'].append('✅ Depth content (15+ words)')
+    def stream():
+        subscriber = live_tail.subscribe()
+        try:
+            yield sse_event('start', {'schemas': [schema_uid] if schema_uid else live_tail.schema_uids})
+            while True:
+                try:
+                    event = subscriber.get(timeout=LIVE_TAIL_KEEPALIVE)
+                except queue.Empty:
+                    # Comment line menjaga koneksi tetap hidup & mendeteksi client yang sudah putus
+                    yield ": keepalive\n\n"
+                    continue
+                if schema_uid and event['schema_uid'] != schema_uid:
+                    continue
+                if user_id and event.get('twitter_user_id') != user_id:
+                    continue
+                yield sse_event('attestation', event)
+        finally:
+            live_tail.unsubscribe(subscriber)
     
-    score['total'] = score['crypto_relevance'] + score['engagement_potential'] + score['semantic_quality']
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/yaps/live/stats')
+def yaps_live_stats():
+    return jsonify(live_tail.stats())
+
+# Lookup YAPS per user: in-memory index dengan TTL per entry + ETag
+YAPS_API_SCHEMAS = ('517', '546', '525')
+YAPS_API_MAX_IDS = 100
+yaps_index = UserScoreIndex({label: eas.YAPS_SCHEMAS[int(label)] for label in YAPS_API_SCHEMAS})
+
+def _yaps_entry_payload(entry):
+    """Body yang divalidasi ETag: hanya data yang ikut di-hash.
+    Umur data (fetched_at) dikirim lewat header Age / Last-Modified, bukan di body."""
+    if 'error' in entry:
+        return entry
+    return {
+        'twitter_user_id': entry['twitter_user_id'],
+        'schemas': entry['schemas'],
+    }
+
+def _set_yaps_freshness(response, entries):
+    """Age / Last-Modified / max-age dari entry tertua"""
+    fetched = [e['fetched_at'] for e in entries if 'etag' in e]
+    if fetched:
+        response.age = max(0, int(time.time() - min(fetched)))
+        response.last_modified = max(fetched)
+    response.cache_control.max_age = min((yaps_index.max_age(e) for e in entries if 'etag' in e), default=0)
+
+@app.route('/api/yaps/<twitter_id>')
+def api_yaps_user(twitter_id):
+    """Latest YAPS points satu user di schema #517/#546/#525 (support If-None-Match)"""
+    if not twitter_id.isdigit():
+        return jsonify({'error': 'twitter_id harus numeric'}), 400
+    try:
+        entry = yaps_index.get(twitter_id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 502
     
-    if score['total'] >= 18:
-        score['rating'] = 'EXCELLENT (High YAPS potential)'
-    elif score['total'] >= 14:
-        score['rating'] = 'GOOD (Medium-High YAPS)'
-    elif score['total'] >= 10:
-        score['rating'] = 'FAIR (Medium YAPS)'
-    else:
-        score['rating'] = 'NEEDS IMPROVEMENT'
+    response = jsonify(_yaps_entry_payload(entry))
+    response.set_etag(entry['etag'])
+    _set_yaps_freshness(response, [entry])
+    return response.make_conditional(request)
+
+@app.route('/api/yaps')
+def api_yaps_bulk():
+    """Bulk lookup: /api/yaps?ids=1,2,3 (maksimal YAPS_API_MAX_IDS)"""
+    ids = [i.strip() for i in request.args.get('ids', '').split(',') if i.strip()]
+    if not ids:
+        return jsonify({'error': 'Parameter ids wajib diisi'}), 400
+    if len(ids) > YAPS_API_MAX_IDS:
+        return jsonify({'error': f"Maksimal {YAPS_API_MAX_IDS} ids per request"}), 400
+    if not all(i.isdigit() for i in ids):
+        return jsonify({'error': 'Semua ids harus numeric'}), 400
     
-    return score
+    entries = yaps_index.get_many(ids)
+    results = {user_id: _yaps_entry_payload(entry) for user_id, entry in entries.items()}
+    response = jsonify({'results': results, 'count': len(results)})
+    # ETag gabungan: berubah jika salah satu entry (atau pesan error-nya) berubah
+    etags = [entry.get('etag') or f"error:{entry['error']}" for entry in entries.values()]
+    response.set_etag(hashlib.sha1(','.join(etags).encode()).hexdigest())
+    _set_yaps_freshness(response, entries.values())
+    return response.make_conditional(request)
+
+@app.route('/api/yaps/stats')
+def api_yaps_stats():
+    return jsonify(yaps_index.stats())
+
+def _cache_lookup_counts():
+    """(cache, hits, stale_hits, misses) dari stats masing-masing cache"""
+    kaito = get_projects_cache_stats()
+    pool = content_pool.stats()
+    index = yaps_index.stats()
+    flight = upstream_flight.stats()
+    return [
+        ('kaito_projects', kaito['hits'], kaito['stale_hits'], kaito['misses']),
+        ('content_pool', pool['hits'], 0, pool['misses']),
+        ('yaps_index', index['hits'], index['stale_hits'], index['misses']),
+        # Call yang di-share ke call in-flight lain dihitung sebagai hit
+        ('upstream_singleflight', flight['shared'], 0, flight['executed']),
+    ]
+
+def _cache_lookups_samples():
+    for cache, hits, stale_hits, misses in _cache_lookup_counts():
+        for result, value in (('hit', hits), ('stale_hit', stale_hits), ('miss', misses)):
+            yield {'cache': cache, 'result': result}, value
+
+def _cache_hit_ratio_samples():
+    for cache, hits, stale_hits, misses in _cache_lookup_counts():
+        lookups = hits + stale_hits + misses
+        yield {'cache': cache}, (hits + stale_hits) / lookups if lookups else None
+
+def _eas_limiter_stat(key, labels=None):
+    return lambda: [(labels or {}, http_client.graphql_limiter.stats()[key])]
+
+metrics.callback('yaps_cache_lookups_total', 'Lookup cache per hasil (hit / stale_hit / miss)',
+                 _cache_lookups_samples, type_name='counter')
+metrics.callback('yaps_cache_hit_ratio', 'Rasio hit (termasuk stale) sejak start', _cache_hit_ratio_samples)
+metrics.callback('yaps_eas_rate_limit', 'Rate adaptif ke easscan (request/detik)', _eas_limiter_stat('rate'))
+metrics.callback('yaps_eas_concurrency_limit', 'Concurrency limit adaptif ke easscan', _eas_limiter_stat('concurrency'))
+metrics.callback('yaps_eas_throttled_total', 'Response easscan 429 / 5xx / timeout',
+                 _eas_limiter_stat('throttled'), type_name='counter')
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
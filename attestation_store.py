@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Local SQLite attestation store dengan incremental sync dari base.easscan.org
+
+Attestations disimpan per (schema UID, attestation id) dengan kolom decoded
+(twitterUserId, yapPoints, yapScaledPoints, ...). Sync hanya mengambil
+attestations dengan timeCreated >= high-water mark yang tersimpan, plus
+revocations baru, jadi script analisis bisa baca dari disk dalam milliseconds.
+
+Usage:
+    python attestation_store.py sync                 # semua YAPS schemas
+    python attestation_store.py sync --schema 517
+    python attestation_store.py status
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import eas
+
+
+def _default_db_path():
+    """~/.cache/yaps jika home writable, selain itu temp dir (mis. Vercel: hanya /tmp writable)"""
+    cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'yaps')
+    existing = cache_dir
+    while not os.path.exists(existing) and os.path.dirname(existing) != existing:
+        existing = os.path.dirname(existing)
+    if not os.access(existing, os.W_OK):
+        cache_dir = os.path.join(tempfile.gettempdir(), 'yaps')
+    return os.path.join(cache_dir, 'attestations.sqlite3')
+
+
+DEFAULT_DB_PATH = os.getenv('YAPS_DB_PATH') or _default_db_path()
+SYNC_FIELDS = ("id", "attester", "recipient", "data", "timeCreated", "revoked")
+# Margin untuk clock skew antara mesin lokal dan block time
+REVOCATION_SKEW = 600
+# Row per fetchmany() saat iterasi, lock dilepas di antara chunk
+READ_CHUNK_SIZE = 500
+
+# decoded field name -> kolom
+DECODED_COLUMNS = {
+    'twitterUserId': 'twitter_user_id',
+    'twitterUsername': 'twitter_username',
+    'yapPoints': 'yap_points',
+    'yapScaledPoints': 'yap_scaled_points',
+    'yap24HScaledPoints': 'yap_24h_scaled_points',
+    'timestamp': 'timestamp',
+}
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS attestations (
+    schema_uid TEXT NOT NULL,
+    id TEXT NOT NULL,
+    attester TEXT,
+    recipient TEXT,
+    time_created INTEGER NOT NULL,
+    revoked INTEGER NOT NULL DEFAULT 0,
+    twitter_user_id TEXT,
+    twitter_username TEXT,
+    yap_points INTEGER,
+    yap_scaled_points INTEGER,
+    yap_24h_scaled_points INTEGER,
+    timestamp INTEGER,
+    fields_json TEXT,
+    PRIMARY KEY (schema_uid, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_attestations_user ON attestations (twitter_user_id, schema_uid, time_created);
+CREATE INDEX IF NOT EXISTS idx_attestations_time ON attestations (schema_uid, time_created);
+CREATE TABLE IF NOT EXISTS sync_state (
+    schema_uid TEXT PRIMARY KEY,
+    high_water INTEGER NOT NULL DEFAULT 0,
+    revocation_high_water INTEGER NOT NULL DEFAULT 0,
+    last_synced_at REAL
+);
+"""
+
+# Field attestation yang bisa dikembalikan dari store (lihat _attestation_from_row)
+STORE_FIELDS = {"id", "attester", "recipient", "timeCreated", "revoked", "fields"}
+
+COLUMNS = ("schema_uid", "id", "attester", "recipient", "time_created", "revoked") + tuple(DECODED_COLUMNS.values()) + ("fields_json",)
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _row_from_attestation(schema_uid, att):
+    fields = att.get('fields') or {}
+    row = {
+        'schema_uid': schema_uid,
+        'id': att['id'],
+        'attester': att.get('attester'),
+        'recipient': att.get('recipient'),
+        'time_created': int(att['timeCreated']),
+        'revoked': 1 if att.get('revoked') else 0,
+        'fields_json': json.dumps(fields, separators=(',', ':'), default=str),
+    }
+    for name, column in DECODED_COLUMNS.items():
+        value = fields.get(name)
+        if column in ('twitter_user_id', 'twitter_username'):
+            row[column] = str(value) if value is not None else None
+        else:
+            row[column] = _to_int(value)
+    return tuple(row[c] for c in COLUMNS)
+
+
+def _attestation_from_row(row):
+    """Row SQLite -> dict dengan shape yang sama seperti eas.iter_attestations()"""
+    return {
+        'id': row['id'],
+        'attester': row['attester'],
+        'recipient': row['recipient'],
+        'timeCreated': row['time_created'],
+        'revoked': bool(row['revoked']),
+        'fields': json.loads(row['fields_json']) if row['fields_json'] else {},
+    }
+
+
+class AttestationStore:
+    """SQLite-backed attestation store"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # Satu connection dipakai bersama oleh worker threads (live tail, index refresh);
+        # semua akses ke self.conn lewat lock ini
+        self._lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA_SQL)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # --- sync ---
+
+    def sync_state(self, schema_uid):
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM sync_state WHERE schema_uid = ?", (schema_uid,)).fetchone()
+        return dict(row) if row else None
+
+    def is_synced(self, schema_uid):
+        return self.sync_state(schema_uid) is not None
+
+    def upsert(self, schema_uid, attestations):
+        rows = [_row_from_attestation(schema_uid, att) for att in attestations]
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._lock:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO attestations ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows
+            )
+        return len(rows)
+
+    def sync(self, schema_uid, page_size=eas.DEFAULT_PAGE_SIZE, progress=None):
+        """Incremental sync: attestations baru (timeCreated >= high-water) + revocations baru.
+        High-water di-commit per page, jadi sync yang terputus bisa dilanjutkan."""
+        state = self.sync_state(schema_uid)
+        high_water = state['high_water'] if state else 0
+        # Revocation setelah sync ini dimulai akan diambil di sync berikutnya
+        revocation_high_water = int(time.time()) - REVOCATION_SKEW
+
+        # >= (bukan >) supaya attestation dengan timeCreated sama yang masuk setelah sync
+        # terakhir tidak terlewat; duplikat di-dedupe oleh primary key
+        where = {"timeCreated": {"gte": high_water}} if high_water else None
+        fetched = 0
+        batch = []
+        for att in eas.iter_attestations(schema_uid, fields=SYNC_FIELDS, where=where,
+                                         page_size=page_size, newest_first=False):
+            batch.append(att)
+            if len(batch) >= page_size:
+                fetched += self._commit_batch(schema_uid, batch, revocation_high_water)
+                batch = []
+                if progress:
+                    progress(fetched)
+        fetched += self._commit_batch(schema_uid, batch, revocation_high_water)
+
+        revoked_ids = []
+        if state:
+            revoked_ids = self._sync_revocations(schema_uid, state['revocation_high_water'], page_size)
+            with self._lock, self.conn:
+                self.conn.execute("UPDATE sync_state SET revocation_high_water = ? WHERE schema_uid = ?",
+                                  (revocation_high_water, schema_uid))
+        return {'schema_uid': schema_uid, 'fetched': fetched, 'revoked': len(revoked_ids),
+                'revoked_ids': revoked_ids, 'total': self.count(schema_uid)}
+
+    def _commit_batch(self, schema_uid, batch, revocation_high_water):
+        with self._lock, self.conn:
+            self.upsert(schema_uid, batch)
+            high_water = max((int(att['timeCreated']) for att in batch), default=None)
+            self.conn.execute(
+                """INSERT INTO sync_state (schema_uid, high_water, revocation_high_water, last_synced_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(schema_uid) DO UPDATE SET
+                     high_water = MAX(high_water, excluded.high_water),
+                     last_synced_at = excluded.last_synced_at""",
+                (schema_uid, high_water or 0, revocation_high_water, time.time())
+            )
+        return len(batch)
+
+    def _sync_revocations(self, schema_uid, since, page_size):
+        """Attestations lama yang di-revoke setelah sync terakhir; return list id yang baru di-revoke"""
+        where = {"revoked": {"equals": True}, "revocationTime": {"gte": since}}
+        # Fetch semua dulu supaya tidak ada write transaction yang terbuka selama paging network
+        ids = [att['id'] for att in eas.iter_attestations(schema_uid, fields=("id", "revocationTime"),
+                                                          where=where, page_size=page_size, decode=False)]
+        revoked_ids = []
+        for i in range(0, len(ids), page_size):
+            with self._lock, self.conn:
+                for att_id in ids[i:i + page_size]:
+                    cursor = self.conn.execute(
+                        "UPDATE attestations SET revoked = 1 WHERE schema_uid = ? AND id = ? AND revoked = 0",
+                        (schema_uid, att_id)
+                    )
+                    if cursor.rowcount:
+                        revoked_ids.append(att_id)
+        return revoked_ids
+
+    # --- reads ---
+
+    def count(self, schema_uid=None):
+        with self._lock:
+            if schema_uid is None:
+                return self.conn.execute("SELECT COUNT(*) FROM attestations").fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM attestations WHERE schema_uid = ?",
+                                     (schema_uid,)).fetchone()[0]
+
+    def iter_attestations(self, schema_uid, newest_first=True, limit=None, since=None):
+        """Attestations dari store, shape sama dengan eas.iter_attestations().
+        `since`: hanya time_created >= since (untuk consumer incremental)"""
+        order = "DESC" if newest_first else "ASC"
+        where = "schema_uid = ?" if since is None else "schema_uid = ? AND time_created >= ?"
+        sql = f"SELECT * FROM attestations WHERE {where} ORDER BY time_created {order}, id {order}"
+        params = [schema_uid] if since is None else [schema_uid, since]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            cursor = self.conn.execute(sql, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(READ_CHUNK_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield _attestation_from_row(row)
+
+    def user_attestations(self, schema_uid, twitter_user_id, limit=None):
+        """Attestations untuk satu twitterUserId (newest first), via index"""
+        sql = ("SELECT * FROM attestations WHERE twitter_user_id = ? AND schema_uid = ? "
+               "ORDER BY time_created DESC, id DESC")
+        params = [str(twitter_user_id), schema_uid]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [_attestation_from_row(row) for row in rows]
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_store():
+    """Shared store di DEFAULT_DB_PATH (lazy)"""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = AttestationStore()
+        return _default_store
+
+
+def _store_can_serve(where=None, fields=None, **kwargs):
+    """Store tidak punya filter `where` dan tidak menyimpan raw `data`"""
+    return not where and set(fields or ()) <= STORE_FIELDS
+
+
+def _network_fields(fields):
+    """'fields' (decoded values) di network path = request `data` lalu ABI decode"""
+    if fields is None:
+        return None
+    fields = tuple('data' if name == 'fields' else name for name in fields)
+    return tuple(dict.fromkeys(fields))
+
+
+def iter_attestations(schema_uid, limit=None, newest_first=True, **kwargs):
+    """Baca dari store jika schema sudah pernah di-sync dan filter / fields bisa
+    dijawab dari store, selain itu dari network.
+    Minta `fields=(..., "fields")` untuk decoded values supaya store bisa dipakai;
+    raw `data` hanya tersedia dari network."""
+    store = get_store()
+    if _store_can_serve(**kwargs) and store.is_synced(schema_uid):
+        return store.iter_attestations(schema_uid, newest_first=newest_first, limit=limit)
+    if kwargs.get('fields') is not None:
+        kwargs['fields'] = _network_fields(kwargs['fields'])
+    return eas.iter_attestations(schema_uid, limit=limit, newest_first=newest_first, **kwargs)
+
+
+def iter_user_attestations(schema_uid, twitter_user_id, **kwargs):
+    """Per-user lookup dari store jika sudah di-sync, selain itu server-side filter"""
+    store = get_store()
+    if store.is_synced(schema_uid):
+        return iter(store.user_attestations(schema_uid, twitter_user_id))
+    return eas.iter_user_attestations(schema_uid, twitter_user_id, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local YAPS attestation store")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Path SQLite database")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sync_parser = sub.add_parser('sync', help="Incremental sync dari base.easscan.org")
+    sync_parser.add_argument('--schema', action='append', help="Schema UID atau nomor (517/546/525); default semua")
+    sub.add_parser('status', help="Tampilkan jumlah row & high-water mark per schema")
+    args = parser.parse_args(argv)
+
+    store = AttestationStore(args.db)
+    if args.command == 'sync':
+        schema_uids = [eas.resolve_schema(s) for s in args.schema] if args.schema else list(eas.YAPS_SCHEMAS.values())
+        for schema_uid in schema_uids:
+            print(f"🔄 Syncing {schema_uid[:18]}...")
+            started = time.time()
+            result = store.sync(schema_uid, progress=lambda n: print(f"   {n:,} attestations...", end='\r'))
+            print(f"✅ +{result['fetched']:,} new, {result['revoked']:,} revoked, "
+                  f"{result['total']:,} total ({time.time() - started:.1f}s)")
+    else:
+        with store._lock:
+            states = store.conn.execute("SELECT * FROM sync_state ORDER BY schema_uid").fetchall()
+        for row in states:
+            print(f"📦 {row['schema_uid']}")
+            print(f"   Rows: {store.count(row['schema_uid']):,}")
+            print(f"   High-water timeCreated: {row['high_water']}")
+            print(f"   Last sync: {time.ctime(row['last_synced_at']) if row['last_synced_at'] else '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Bulk scoring untuk /analyze/batch
+
+Teks di-score per chunk: setiap teks di-extract sekali (features.extract_features)
+dan dipakai oleh kedua scorer. Batch besar dibagi ke process pool supaya scoring
+jalan paralel di semua core.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from features import extract_features
+from scoring import analyze_yaps_score, build_content_analysis
+
+PARALLEL_THRESHOLD = int(os.getenv('ANALYZE_BATCH_PARALLEL_THRESHOLD', '5000'))
+WORKERS = int(os.getenv('ANALYZE_BATCH_WORKERS', str(os.cpu_count() or 1)))
+CHUNK_SIZE = 2000
+
+# Urutan kolom per item di response
+SCORE_FIELDS = ('kaito_total', 'twitter_score', 'estimated_yaps', 'yaps_total')
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Pool dibuat lazily di proses Flask yang sudah punya background thread
+            # (live tail, yaps index, refresh Kaito): fork bisa deadlock di lock warisan,
+            # jadi worker di-spawn fresh (hanya import features + scoring)
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def score_chunk(texts):
+    """Compact scores untuk satu chunk teks (kolom sesuai SCORE_FIELDS, None untuk teks kosong)"""
+    rows = []
+    for content in texts:
+        content = content.strip()
+        if not content:
+            rows.append(None)
+            continue
+        features = extract_features(content)
+        analysis = build_content_analysis(content, features)
+        rows.append([
+            analysis['kaito_yaps']['total_score'],
+            analysis['twitter_algorithm']['score'],
+            analysis['kaito_yaps']['estimated_yaps'],
+            analyze_yaps_score(content, features)['total'],
+        ])
+    return rows
+
+
+def score_texts(texts):
+    """Score semua teks, paralel jika batch cukup besar. Urutan hasil = urutan input."""
+    chunks = [texts[i:i + CHUNK_SIZE] for i in range(0, len(texts), CHUNK_SIZE)]
+    if len(texts) < PARALLEL_THRESHOLD or WORKERS <= 1:
+        results = [score_chunk(chunk) for chunk in chunks]
+    else:
+        results = _get_pool().map(score_chunk, chunks)
+    return [row for chunk in results for row in chunk]
+
+
+def _percentile(sorted_values, p):
+    idx = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def aggregate_scores(rows, fields=SCORE_FIELDS):
+    """Aggregate statistics (mean/min/max/percentiles) per field"""
+    scored = [row for row in rows if row is not None]
+    stats = {'count': len(rows), 'scored': len(scored), 'empty': len(rows) - len(scored)}
+    for i, field in enumerate(fields):
+        values = sorted(row[i] for row in scored)
+        if not values:
+            stats[field] = None
+            continue
+        stats[field] = {
+            'mean': round(sum(values) / len(values), 3),
+            'min': values[0],
+            'max': values[-1],
+            'p50': _percentile(values, 50),
+            'p90': _percentile(values, 90),
+            'p99': _percentile(values, 99),
+        }
+    return stats
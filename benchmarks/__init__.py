@@ -0,0 +1 @@
+"""Offline benchmark suite untuk scoring & generation paths (python -m benchmarks.run)"""
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Synthetic tweet corpus generator (Bahasa Indonesia + English), deterministic per seed
+"""
+
+import random
+
+PROJECTS = ['Monad', 'Base', 'Polymarket', 'Sentient', 'Limitless', 'Berachain', 'Story', 'Allora', 'Cysic', 'Irys']
+
+ID_TEMPLATES = [
+    "{project} baru raise ${amount}M dan TVL naik {pct}% dalam {days} hari. Kenapa ini penting buat ekosistem {category}? Menurut gw {thesis}",
+    "Thread 1/ Analisis {project}: {metric}x growth user minggu ini, tapi risk-nya masih di {risk}. Bagaimana menurut kalian?",
+    "gm! {project} lfg 🚀 to the moon wagmi",
+    "{project} vs kompetitor di {category}: revenue {amount}M/bulan, fee lebih murah {pct}%. Mengapa belum banyak yang bahas?",
+    "Airdrop {project} kemungkinan besar berbasis aktivitas onchain. Risk: sybil filter ketat. Gimana strategi kalian?",
+    "Follow dan RT kalau kamu bullish sama {project}!!!! like if setuju",
+]
+
+EN_TEMPLATES = [
+    "{project} just crossed ${amount}M TVL, up {pct}% in {days} days. What does this mean for {category}? My thesis: {thesis}",
+    "Comparing {project} vs the rest of {category}: {metric}x cheaper fees and {pct}% faster finality. Thoughts?",
+    "Why is nobody talking about {project}'s revenue? ${amount}M annualized with {pct}% margin on a zk rollup stack.",
+    "gm ser, {project} is bullish af, ngmi if you fade this",
+    "The {project} airdrop risk nobody prices in: {risk}. How are you positioning?",
+    "@{handle} @{handle2} @{handle3} @{handle4} check {project} https://x.com/a https://x.com/b",
+]
+
+CATEGORIES = ['DeFi', 'Layer 1', 'Layer 2', 'AI Agents', 'Prediction Markets', 'ZK Infra', 'IP Protocol']
+THESES = [
+    'liquidity bakal pindah ke chain dengan UX paling simple',
+    'AI agents will be the main onchain users by next year',
+    'restaking yield akan compress dan protocol dengan real revenue menang',
+    'prediction markets are the next big consumer crypto app',
+]
+RISKS = ['token unlock besar', 'smart contract bug', 'centralized sequencer', 'regulatory pressure']
+
+
+def generate_corpus(size, seed=42, indonesian_ratio=0.6):
+    """Generate `size` synthetic tweets; campuran ID/EN sesuai indonesian_ratio"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        templates = ID_TEMPLATES if rng.random() < indonesian_ratio else EN_TEMPLATES
+        text = rng.choice(templates).format(
+            project=rng.choice(PROJECTS),
+            category=rng.choice(CATEGORIES),
+            amount=rng.randint(1, 900),
+            pct=rng.randint(1, 300),
+            days=rng.randint(1, 90),
+            metric=rng.randint(2, 50),
+            thesis=rng.choice(THESES),
+            risk=rng.choice(RISKS),
+            handle=rng.choice(PROJECTS).lower(),
+            handle2=rng.choice(PROJECTS).lower(),
+            handle3=rng.choice(PROJECTS).lower(),
+            handle4=rng.choice(PROJECTS).lower(),
+        )
+        corpus.append(text)
+    return corpus
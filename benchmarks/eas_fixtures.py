@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Dataset EAS untuk stand-in GraphQL server (benchmarks/eas_server.py)
+
+SyntheticAttestations membangkitkan row ke-i secara deterministik dari (seed,
+schema, i) tanpa menyimpan apa pun per row: id meng-encode posisi, timeCreated
+naik monoton, user = i % users dan points kumulatif per user. Jadi jutaan row
+tetap O(1) memory, dan filter timeCreated / data startsWith (per user) / id
+dijawab dengan aritmatika + bisect. RecordedAttestations memuat fixture hasil
+rekaman (`eas_server.py record`) dengan interface yang sama.
+"""
+
+import bisect
+import hashlib
+import json
+
+import eas
+from abi_decoder import parse_schema
+
+ZERO_ADDRESS = "0x" + "0" * 40
+SYNTHETIC_ATTESTER = "0x" + "7a" * 20
+START_TIME = 1735689600  # 2025-01-01 UTC
+DEFAULT_SPAN = 90 * 86400
+DEFAULT_USERS = 50000
+DEFAULT_REVOKE_RATE = 0.001
+DEFAULT_SCHEMATA = 600
+
+# twitterUserId sintetis = USER_BASE + u * USER_STRIDE (tidak berurutan, mirip id asli)
+USER_BASE = 10 ** 18
+USER_STRIDE = 7919
+
+# Schema YAPS yang diketahui; #546 belum diketahui definisinya, diasumsikan sama dengan #517
+# (#155/#156 lihat get_yaps_attestations.py)
+SYNTHETIC_SCHEMAS = {
+    517: (eas.YAPS_SCHEMAS[517], eas.SCHEMA_DEFINITIONS[eas.YAPS_SCHEMAS[517]]),
+    525: (eas.YAPS_SCHEMAS[525], eas.SCHEMA_DEFINITIONS[eas.YAPS_SCHEMAS[525]]),
+    546: (eas.YAPS_SCHEMAS[546], eas.SCHEMA_DEFINITIONS[eas.YAPS_SCHEMAS[517]]),
+    155: ("0x2d5c948c6fb42412de88dc8fba09abed76f948136f3628b55b8a9560f288e701",
+          eas.SCHEMA_DEFINITIONS[eas.YAPS_SCHEMAS[525]]),
+    156: ("0x2df5d9cbf7ed0cdc7ce5daa6e7aba03aa4e7f538aa515e5c56de053887938ddf",
+          eas.SCHEMA_DEFINITIONS[eas.YAPS_SCHEMAS[525]]),
+}
+
+# Schema pengisi registry (dirotasi per index)
+FILLER_DEFINITIONS = (
+    "uint256 score, address user",
+    "string name, bool verified",
+    "bytes32 projectId, uint64 twitterUserId, uint256 points",
+    "address wallet, uint64 timestamp, string handle",
+    "uint8 tier, uint64 twitterUserId",
+    "bytes32 hash, string uri",
+)
+
+
+def _mix(value):
+    """splitmix64: hash integer deterministik yang murah"""
+    value = (value + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+
+def _hex_hash(*parts):
+    return "0x" + hashlib.sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _encode_word(type_name, value):
+    if type_name == 'bool':
+        value = int(bool(value))
+    elif type_name == 'address' or type_name.startswith('bytes'):
+        raw = str(value)[2:]
+        return raw.rjust(64, '0') if type_name == 'address' else raw.ljust(64, '0')
+    return format(int(value) & ((1 << 256) - 1), '064x')
+
+
+def encode_abi(types, values):
+    """ABI encode values (static scalar + string/bytes) -> hex 0x..., kebalikan SchemaDecoder"""
+    head = []
+    tail = []
+    tail_offset = 32 * len(types)
+    for type_name, value in zip(types, values):
+        if type_name in ('string', 'bytes'):
+            raw = value.encode() if type_name == 'string' else bytes.fromhex(str(value)[2:])
+            body = format(len(raw), '064x') + raw.hex().ljust(-(-len(raw) // 32) * 64, '0')
+            head.append(format(tail_offset, '064x'))
+            tail.append(body)
+            tail_offset += len(body) // 2
+        else:
+            head.append(_encode_word(type_name, value))
+    return "0x" + "".join(head) + "".join(tail)
+
+
+def decoded_data_json(fields, values):
+    """decodedDataJson dengan format easscan"""
+    return json.dumps([
+        {"name": name, "type": type_name, "signature": f"{type_name} {name}",
+         "value": {"name": name, "type": type_name, "value": value}}
+        for (name, type_name), value in zip(fields, values)
+    ])
+
+
+class _TimeView:
+    """Sequence timeCreated(i) untuk bisect"""
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table)
+
+    def __getitem__(self, i):
+        return self.table.time(i)
+
+
+class _AttestationTable:
+    """Interface bersama: row(i), time(i), index_of(id), plus index opsional"""
+
+    def time_range(self, gte=None, gt=None, lte=None, lt=None):
+        """(lo, hi) posisi row dengan timeCreated dalam bound"""
+        times = _TimeView(self)
+        lo, hi = 0, len(self)
+        if gte is not None:
+            lo = max(lo, bisect.bisect_left(times, int(gte)))
+        if gt is not None:
+            lo = max(lo, bisect.bisect_right(times, int(gt)))
+        if lte is not None:
+            hi = min(hi, bisect.bisect_right(times, int(lte)))
+        if lt is not None:
+            hi = min(hi, bisect.bisect_left(times, int(lt)))
+        return lo, max(lo, hi)
+
+    def user_positions(self, prefix, lo, hi):
+        """Posisi row dengan data.startsWith(prefix) dalam [lo, hi), atau None jika tidak ter-index"""
+        return None
+
+    def revoked_positions(self, lo, hi):
+        return None
+
+
+class SyntheticAttestations(_AttestationTable):
+    """Attestations sintetis satu schema, di-generate per row saat dibaca"""
+
+    def __init__(self, schema_uid, definition, count, users=DEFAULT_USERS, seed=0,
+                 start_time=START_TIME, span=DEFAULT_SPAN, revoke_rate=DEFAULT_REVOKE_RATE):
+        self.schema_uid = schema_uid
+        self.fields = parse_schema(definition)
+        self.types = [type_name for _, type_name in self.fields]
+        self.count = count
+        self.users = max(1, min(users, count or 1))
+        self.seed = seed
+        self.start_time = start_time
+        self.span = span
+        self.revoke_threshold = int(revoke_rate * 2 ** 64)
+        self._id_prefix = "0x" + schema_uid[2:10]
+        self._salt = _mix(seed ^ int(schema_uid[2:18], 16))
+        self._revoked = None
+
+    def __len__(self):
+        return self.count
+
+    def time(self, i):
+        return self.start_time + i * self.span // self.count
+
+    def attestation_id(self, i):
+        return self._id_prefix + format(i, '056x')
+
+    def index_of(self, attestation_id):
+        if (not isinstance(attestation_id, str) or len(attestation_id) != 66
+                or not attestation_id.startswith(self._id_prefix)):
+            return None
+        try:
+            i = int(attestation_id[10:], 16)
+        except ValueError:
+            return None
+        return i if i < self.count else None
+
+    def user_id(self, u):
+        return USER_BASE + u * USER_STRIDE
+
+    def is_revoked(self, i):
+        return _mix(self._salt ^ (i * 2 + 1)) < self.revoke_threshold
+
+    def _values(self, i, timestamp):
+        u = i % self.users
+        rounds = i // self.users
+        user_hash = _mix(self._salt ^ (u * 2))
+        # Distribusi gain miring: sebagian kecil user mendapat gain besar
+        gain = 1 + (user_hash % 2000) * 1000 // (1 + (user_hash >> 32) % 100)
+        points = user_hash % 50000 + rounds * gain
+        values = []
+        for name, type_name in self.fields:
+            if name == 'twitterUserId':
+                values.append(self.user_id(u))
+            elif name == 'twitterUsername':
+                values.append(f"yapper{u}")
+            elif name == 'timestamp':
+                values.append(timestamp)
+            elif 'Points' in name:
+                scale = 10 ** 6 if 'Scaled' in name else 1
+                values.append((gain if '24H' in name else points) * scale)
+            elif type_name in ('string', 'bytes'):
+                values.append("" if type_name == 'string' else "0x")
+            elif type_name == 'address':
+                values.append(ZERO_ADDRESS)
+            else:
+                values.append(0)
+        return values
+
+    def row(self, i):
+        time_created = self.time(i)
+        revoked = self.is_revoked(i)
+        values = self._values(i, time_created)
+        return {
+            "id": self.attestation_id(i),
+            "schemaId": self.schema_uid,
+            "attester": SYNTHETIC_ATTESTER,
+            "recipient": ZERO_ADDRESS,
+            "refUID": "0x" + "0" * 64,
+            "revocable": True,
+            "revoked": revoked,
+            "revocationTime": time_created + 3600 if revoked else 0,
+            "expirationTime": 0,
+            "time": time_created,
+            "timeCreated": time_created,
+            "txid": _hex_hash(self.schema_uid, "tx", i),
+            "data": encode_abi(self.types, values),
+            "decodedDataJson": decoded_data_json(self.fields, values),
+            "isOffchain": False,
+        }
+
+    def user_positions(self, prefix, lo, hi):
+        if not self.fields or self.fields[0][0] != 'twitterUserId' or len(prefix) != 66:
+            return None
+        offset = int(prefix[2:], 16) - USER_BASE
+        u, remainder = divmod(offset, USER_STRIDE)
+        if offset < 0 or remainder or u >= self.users:
+            return range(0)
+        first = lo + (u - lo) % self.users
+        return range(first, max(first, hi), self.users)
+
+    def revoked_positions(self, lo, hi):
+        if self._revoked is None:
+            # Sekali O(n), setelah itu bisect
+            self._revoked = [i for i in range(self.count) if self.is_revoked(i)]
+        return self._revoked[bisect.bisect_left(self._revoked, lo):bisect.bisect_left(self._revoked, hi)]
+
+
+class RecordedAttestations(_AttestationTable):
+    """Attestations hasil rekaman (list dict), diurutkan timeCreated lalu id"""
+
+    def __init__(self, schema_uid, rows):
+        self.schema_uid = schema_uid
+        self.rows = sorted(rows, key=lambda row: (int(row['timeCreated']), row['id']))
+        for row in self.rows:
+            row.setdefault('schemaId', schema_uid)
+        self._times = [int(row['timeCreated']) for row in self.rows]
+        self._positions = {row['id']: i for i, row in enumerate(self.rows)}
+        self._by_word = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def time(self, i):
+        return self._times[i]
+
+    def row(self, i):
+        return self.rows[i]
+
+    def index_of(self, attestation_id):
+        return self._positions.get(attestation_id)
+
+    def user_positions(self, prefix, lo, hi):
+        if len(prefix) != 66:
+            return None
+        if self._by_word is None:
+            self._by_word = {}
+            for i, row in enumerate(self.rows):
+                self._by_word.setdefault((row.get('data') or '')[:66], []).append(i)
+        positions = self._by_word.get(prefix, [])
+        return positions[bisect.bisect_left(positions, lo):bisect.bisect_left(positions, hi)]
+
+
+def synthetic_schemata(count=DEFAULT_SCHEMATA, seed=0, start_time=START_TIME):
+    """List schema registry sintetis; schema YAPS ada di index aslinya"""
+    count = max(count, max(SYNTHETIC_SCHEMAS))
+    schemata = []
+    for index in range(1, count + 1):
+        uid, definition = SYNTHETIC_SCHEMAS.get(index, (None, None))
+        schemata.append({
+            "id": uid or _hex_hash("schema", seed, index),
+            "schema": definition or FILLER_DEFINITIONS[index % len(FILLER_DEFINITIONS)],
+            "creator": SYNTHETIC_ATTESTER if uid else _hex_hash("creator", index % 37)[:42],
+            "resolver": ZERO_ADDRESS,
+            "revocable": True,
+            "index": str(index),
+            "txid": _hex_hash("schema-tx", seed, index),
+            # Schema dibuat sebelum attestation pertama
+            "time": start_time - (count - index + 1) * 3600,
+        })
+    return schemata
+
+
+class EASDataset:
+    """Schemata + attestation table per schema UID"""
+
+    def __init__(self, schemata, attestations):
+        self.schemata = schemata
+        self.schemata_by_id = {schema['id']: schema for schema in schemata}
+        self.attestations = attestations
+
+    @classmethod
+    def synthetic(cls, attestations=1_000_000, users=DEFAULT_USERS, seed=0, schemata=DEFAULT_SCHEMATA,
+                  revoke_rate=DEFAULT_REVOKE_RATE, span=DEFAULT_SPAN):
+        """`attestations` row untuk setiap schema YAPS"""
+        tables = {
+            uid: SyntheticAttestations(uid, definition, attestations, users=users, seed=seed,
+                                       span=span, revoke_rate=revoke_rate)
+            for uid, definition in SYNTHETIC_SCHEMAS.values()
+        }
+        return cls(synthetic_schemata(schemata, seed), tables)
+
+    @classmethod
+    def load(cls, path):
+        """Fixture JSON hasil `eas_server.py record`"""
+        with open(path, encoding='utf-8') as f:
+            fixture = json.load(f)
+        tables = {uid: RecordedAttestations(uid, rows) for uid, rows in fixture.get('attestations', {}).items()}
+        return cls(fixture.get('schemata', []), tables)
+
+    def stats(self):
+        return {
+            'schemata': len(self.schemata),
+            'attestations': {uid: len(table) for uid, table in self.attestations.items()},
+        }
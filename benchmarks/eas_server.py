@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in untuk EAS GraphQL (base.easscan.org/graphql)
+
+Melayani query `schemata`, `schema`, `attestations` dan `attestation` dengan
+argumen where / take / skip / cursor / orderBy (subset Prisma yang dipakai
+script di repo ini) dari dataset sintetis (jutaan row, lihat eas_fixtures.py)
+atau fixture rekaman. Latency dan error rate (429/502/503) bisa diinjeksi
+dengan seed tetap, jadi consumer query_graphql() bisa di-profile secara
+deterministik tanpa menyentuh easscan.
+
+Usage:
+    python -m benchmarks.eas_server --port 8545 --attestations 2000000
+    python -m benchmarks.eas_server --latency-ms 80 --jitter-ms 40 --error-rate 0.02
+    python -m benchmarks.eas_server --rate-limit 20        # 429 + Retry-After di atas 20 req/s
+    python -m benchmarks.eas_server --fixture benchmarks/fixtures/eas_sample.json
+    python -m benchmarks.eas_server record --schema 517 --limit 5000 --out benchmarks/fixtures/eas_sample.json
+
+    EAS_GRAPHQL_URL=http://127.0.0.1:8545/graphql python yaps.py leaderboard --schema 517
+"""
+
+import argparse
+import bisect
+import json
+import random
+import re
+import sys
+import threading
+import time
+
+from benchmarks.eas_fixtures import DEFAULT_SCHEMATA, DEFAULT_USERS, EASDataset
+
+DEFAULT_PORT = 8545
+# take tanpa batas (query tanpa `take`) dipotong di sini
+MAX_TAKE = 1000
+ERROR_STATUSES = (429, 502, 503)
+
+_TOKEN_RE = re.compile(r'''
+    (?P<skip>[\s,]+|\#[^\n]*)
+  | (?P<string>"(?:[^"\\]|\\.)*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<variable>\$[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<punct>\.\.\.|[{}()\[\]:!=@])
+''', re.VERBOSE)
+
+
+class GraphQLError(Exception):
+    """Query tidak valid / tidak didukung (dikembalikan sebagai `errors`)"""
+
+
+# --- parser ---
+
+def _tokenize(source):
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = _TOKEN_RE.match(source, position)
+        if not match:
+            raise GraphQLError(f"Syntax error di posisi {position}: {source[position:position + 20]!r}")
+        position = match.end()
+        if match.lastgroup != 'skip':
+            tokens.append((match.lastgroup, match.group()))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent untuk subset GraphQL: satu operation, field + argumen + alias"""
+
+    def __init__(self, source, variables):
+        self.tokens = _tokenize(source)
+        self.position = 0
+        self.variables = variables or {}
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        kind, token = self.peek()
+        if kind is None or (value is not None and token != value):
+            raise GraphQLError(f"Expected {value or 'token'}, got {token!r}")
+        self.position += 1
+        return kind, token
+
+    def document(self):
+        kind, token = self.peek()
+        if token in ('query', 'mutation', 'subscription'):
+            if token != 'query':
+                raise GraphQLError(f"Operation {token} tidak didukung")
+            self.take()
+            if self.peek()[0] == 'name':
+                self.take()
+            if self.peek()[1] == '(':
+                self._skip_variable_definitions()
+        selections = self.selection_set()
+        if self.peek()[0] is not None:
+            raise GraphQLError("Hanya satu operation per request yang didukung")
+        return selections
+
+    def _skip_variable_definitions(self):
+        # ($name: Type! = default, ...) - type diabaikan, default dipakai jika variable kosong
+        self.take('(')
+        while self.peek()[1] != ')':
+            _, variable = self.take()
+            self.take(':')
+            depth = 0
+            while True:
+                _, token = self.peek()
+                if token == '[':
+                    depth += 1
+                elif token == ']':
+                    depth -= 1
+                elif depth == 0 and (token in ('=', ')') or (token or '').startswith('$')):
+                    break
+                self.take()
+            if self.peek()[1] == '=':
+                self.take('=')
+                default = self.value()
+                self.variables.setdefault(variable[1:], default)
+        self.take(')')
+
+    def selection_set(self):
+        self.take('{')
+        selections = []
+        while self.peek()[1] != '}':
+            selections.append(self.field())
+        self.take('}')
+        return selections
+
+    def field(self):
+        _, name = self.take()
+        alias = name
+        if self.peek()[1] == ':':
+            self.take(':')
+            _, name = self.take()
+        arguments = {}
+        if self.peek()[1] == '(':
+            self.take('(')
+            while self.peek()[1] != ')':
+                _, argument = self.take()
+                self.take(':')
+                arguments[argument] = self.value()
+            self.take(')')
+        children = self.selection_set() if self.peek()[1] == '{' else None
+        return alias, name, arguments, children
+
+    def value(self):
+        kind, token = self.take()
+        if kind == 'variable':
+            return self.variables.get(token[1:])
+        if kind == 'string':
+            return json.loads(token)
+        if kind == 'number':
+            return float(token) if any(c in token for c in '.eE') else int(token)
+        if kind == 'name':
+            # true/false/null, selain itu enum (asc/desc/insensitive)
+            return {'true': True, 'false': False, 'null': None}.get(token, token)
+        if token == '[':
+            items = []
+            while self.peek()[1] != ']':
+                items.append(self.value())
+            self.take(']')
+            return items
+        if token == '{':
+            obj = {}
+            while self.peek()[1] != '}':
+                _, key = self.take()
+                self.take(':')
+                obj[key] = self.value()
+            self.take('}')
+            return obj
+        raise GraphQLError(f"Value tidak valid: {token!r}")
+
+
+def parse_query(query, variables=None):
+    """Query string -> list (alias, field, arguments, children) root field"""
+    return _Parser(query, dict(variables or {})).document()
+
+
+# --- filtering (subset Prisma where) ---
+
+def _compare(value, operator, operand):
+    if operator == 'mode':
+        return True
+    if operator == 'equals':
+        return value == operand
+    if operator == 'not':
+        return not _match_condition(value, operand) if isinstance(operand, dict) else value != operand
+    if operator == 'in':
+        return value in (operand or [])
+    if operator == 'notIn':
+        return value not in (operand or [])
+    if value is None:
+        return False
+    if operator in ('lt', 'lte', 'gt', 'gte'):
+        value, operand = int(value), int(operand)
+        return {'lt': value < operand, 'lte': value <= operand,
+                'gt': value > operand, 'gte': value >= operand}[operator]
+    if operator in ('contains', 'startsWith', 'endsWith'):
+        return getattr(str(value), {'contains': '__contains__', 'startsWith': 'startswith',
+                                    'endsWith': 'endswith'}[operator])(operand)
+    raise GraphQLError(f"Filter operator tidak didukung: {operator}")
+
+
+def _match_condition(value, condition):
+    if not isinstance(condition, dict):
+        return value == condition
+    if condition.get('mode') == 'insensitive' and isinstance(value, str):
+        value = value.lower()
+        condition = {op: (v.lower() if isinstance(v, str) else v) for op, v in condition.items()}
+    return all(_compare(value, operator, operand) for operator, operand in condition.items())
+
+
+def matches(row, where):
+    """Evaluasi Prisma-style where terhadap satu row dict"""
+    for key, condition in (where or {}).items():
+        if key == 'AND':
+            if not all(matches(row, sub) for sub in _as_list(condition)):
+                return False
+        elif key == 'OR':
+            if not any(matches(row, sub) for sub in _as_list(condition)):
+                return False
+        elif key == 'NOT':
+            if any(matches(row, sub) for sub in _as_list(condition)):
+                return False
+        elif not _match_condition(row.get(key), condition):
+            return False
+    return True
+
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def _order_direction(order_by, default='asc'):
+    order_by = _as_list(order_by) if order_by else []
+    for item in order_by:
+        for direction in (item or {}).values():
+            return direction
+    return default
+
+
+def _project(row, selections):
+    if row is None:
+        return None
+    result = {}
+    for alias, name, _, _ in selections:
+        result[alias] = row.get(name)
+    return result
+
+
+class EASStandin:
+    """Executor GraphQL di atas EASDataset + fault injection"""
+
+    def __init__(self, dataset, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, seed=0, max_take=MAX_TAKE,
+                 rate_limit=None):
+        self.dataset = dataset
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.max_take = max_take
+        # Limit server-side (request/detik, burst 1 detik): kelebihan dibalas 429 + Retry-After
+        self.rate_limit = rate_limit
+        self._tokens = rate_limit or 0.0
+        self._tokens_updated = time.monotonic()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.injected_errors = 0
+        self.rate_limited = 0
+        self.rows_served = 0
+
+    # --- fault injection ---
+
+    def _over_rate_limit(self):
+        """Token bucket server-side; return detik sampai token berikutnya jika habis"""
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._tokens_updated) * self.rate_limit)
+        self._tokens_updated = now
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate_limit
+        self._tokens -= 1
+        return None
+
+    def next_fault(self):
+        """(delay detik, status error atau None); urutan deterministik per seed"""
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit and self._over_rate_limit() is not None:
+                self.rate_limited += 1
+                return 0.0, 429
+            delay = self.latency_ms
+            if self.jitter_ms:
+                delay += self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            status = None
+            if self.error_rate and self._random.random() < self.error_rate:
+                status = self._random.choice(ERROR_STATUSES)
+                self.injected_errors += 1
+        return max(0.0, delay) / 1000, status
+
+    def handle(self, payload):
+        """Satu request HTTP: return (status, body dict, headers) setelah latency + fault injection"""
+        delay, status = self.next_fault()
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            headers = {'Retry-After': '1'} if status == 429 else {}
+            return status, {"errors": [{"message": f"Injected error {status}"}]}, headers
+        if not isinstance(payload, dict) or not payload.get('query'):
+            return 400, {"errors": [{"message": "Body harus JSON {query, variables}"}]}, {}
+        return 200, self.execute(payload['query'], payload.get('variables')), {}
+
+    # --- execution ---
+
+    def execute(self, query, variables=None):
+        """Jalankan query; error dikembalikan sebagai {"errors": [...]} seperti GraphQL server"""
+        try:
+            data = {}
+            for alias, name, arguments, children in parse_query(query, variables):
+                resolver = getattr(self, f'_resolve_{name}', None)
+                if resolver is None:
+                    raise GraphQLError(f"Field {name} tidak didukung oleh stand-in")
+                data[alias] = resolver(arguments, children or [])
+            return {"data": data}
+        except (GraphQLError, TypeError, ValueError) as e:
+            return {"errors": [{"message": str(e)}]}
+
+    def _take(self, arguments):
+        take = arguments.get('take')
+        return self.max_take if take is None else min(abs(int(take)), self.max_take)
+
+    def _serve(self, rows, selections):
+        self.rows_served += len(rows)
+        return [_project(row, selections) for row in rows]
+
+    def _resolve_schema(self, arguments, selections):
+        schema_id = (arguments.get('where') or {}).get('id')
+        return _project(self.dataset.schemata_by_id.get(schema_id), selections)
+
+    def _resolve_schemata(self, arguments, selections):
+        # Registry kecil (ratusan row): filter + sort generic
+        rows = [row for row in self.dataset.schemata if matches(row, arguments.get('where'))]
+        order_by = _as_list(arguments.get('orderBy') or [])
+        for item in reversed(order_by):
+            for key, direction in item.items():
+                rows.sort(key=lambda row: (int(row[key]) if key in ('time', 'index') else row[key]),
+                          reverse=direction == 'desc')
+        start = 0
+        cursor = (arguments.get('cursor') or {}).get('id')
+        if cursor is not None:
+            start = next((i for i, row in enumerate(rows) if row['id'] == cursor), len(rows))
+        start += int(arguments.get('skip') or 0)
+        return self._serve(rows[start:start + self._take(arguments)], selections)
+
+    def _resolve_attestation(self, arguments, selections):
+        attestation_id = (arguments.get('where') or {}).get('id')
+        for table in self.dataset.attestations.values():
+            position = table.index_of(attestation_id)
+            if position is not None:
+                return _project(table.row(position), selections)
+        return None
+
+    def _resolve_attestations(self, arguments, selections):
+        where = dict(arguments.get('where') or {})
+        schema_condition = where.pop('schemaId', None)
+        schema_uid = schema_condition.get('equals') if isinstance(schema_condition, dict) else schema_condition
+        if schema_uid is None:
+            raise GraphQLError("Stand-in butuh filter schemaId: {equals: ...}")
+        table = self.dataset.attestations.get(schema_uid)
+        if table is None:
+            return []
+
+        positions, where = self._candidate_positions(table, where)
+        descending = _order_direction(arguments.get('orderBy')) == 'desc'
+        # Semua table urut (timeCreated, id), jadi orderBy timeCreated/id = urutan posisi
+        cursor = (arguments.get('cursor') or {}).get('id')
+        if cursor is not None:
+            cursor_position = table.index_of(cursor)
+            if cursor_position is None:
+                return []
+            if descending:
+                end = bisect.bisect_right(positions, cursor_position)
+                positions = positions[:end]
+            else:
+                positions = positions[bisect.bisect_left(positions, cursor_position):]
+
+        skip = int(arguments.get('skip') or 0)
+        take = self._take(arguments)
+        rows = []
+        ordered = reversed(range(len(positions))) if descending else range(len(positions))
+        for k in ordered:
+            if len(rows) >= take:
+                break
+            row = table.row(positions[k])
+            if where and not matches(row, where):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            rows.append(row)
+        return self._serve(rows, selections)
+
+    def _candidate_positions(self, table, where):
+        """Sequence posisi (ascending) yang lolos filter ter-index + where sisa"""
+        time_condition = where.get('timeCreated')
+        if isinstance(time_condition, dict) and set(time_condition) <= {'gte', 'gt', 'lte', 'lt'}:
+            lo, hi = table.time_range(**where.pop('timeCreated'))
+        else:
+            lo, hi = 0, len(table)
+
+        id_condition = where.get('id')
+        if isinstance(id_condition, dict) and set(id_condition) == {'equals'}:
+            where.pop('id')
+            position = table.index_of(id_condition['equals'])
+            return ([position] if position is not None and lo <= position < hi else []), where
+
+        data_condition = where.get('data')
+        if isinstance(data_condition, dict) and set(data_condition) == {'startsWith'}:
+            positions = table.user_positions(data_condition['startsWith'].lower(), lo, hi)
+            if positions is not None:
+                where.pop('data')
+                return positions, where
+
+        if where.get('revoked') in ({'equals': True}, True):
+            positions = table.revoked_positions(lo, hi)
+            if positions is not None:
+                where.pop('revoked')
+                return positions, where
+        return range(lo, hi), where
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'injected_errors': self.injected_errors,
+            'rate_limited': self.rate_limited,
+            'rate_limit': self.rate_limit,
+            'rows_served': self.rows_served,
+            'latency_ms': self.latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'error_rate': self.error_rate,
+            'dataset': self.dataset.stats(),
+        }
+
+
+def create_app(standin):
+    """Flask app dengan POST /graphql"""
+    from flask import Flask, jsonify, request
+
+    app = Flask(__name__)
+
+    @app.route('/graphql', methods=['POST'])
+    def graphql():
+        status, body, headers = standin.handle(request.get_json(silent=True))
+        return jsonify(body), status, headers
+
+    @app.route('/stats')
+    def stats():
+        return jsonify(standin.stats())
+
+    return app
+
+
+# --- recording ---
+
+RECORD_FIELDS = ("id", "attester", "recipient", "data", "timeCreated", "revoked", "revocationTime")
+
+
+def record_fixture(schema_values, limit, out):
+    """Rekam attestations terbaru (+ schemata terkait) dari easscan ke fixture JSON"""
+    import eas
+
+    fixture = {'schemata': [], 'attestations': {}}
+    for value in schema_values:
+        schema_uid = eas.resolve_schema(value)
+        result = eas.query_graphql(
+            "query S($id: String!) { schema(where: {id: $id}) { id schema creator resolver revocable index txid time } }",
+            {"id": schema_uid},
+        )
+        schema = (result.get('data') or {}).get('schema')
+        if schema:
+            fixture['schemata'].append(schema)
+        rows = list(eas.iter_attestations(schema_uid, fields=RECORD_FIELDS, limit=limit, decode=False))
+        fixture['attestations'][schema_uid] = rows
+        print(f"📼 {schema_uid[:18]}...: {len(rows):,} attestations")
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(fixture, f)
+    print(f"💾 Saved to {out}")
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ['record']:
+        parser = argparse.ArgumentParser(prog="eas_server record", description="Rekam fixture dari easscan")
+        parser.add_argument('--schema', action='append', required=True, help="Schema UID atau nomor (boleh berulang)")
+        parser.add_argument('--limit', type=int, default=5000, help="Attestations terbaru per schema")
+        parser.add_argument('--out', required=True)
+        args = parser.parse_args(argv[1:])
+        record_fixture(args.schema, args.limit, args.out)
+        return 0
+
+    parser = argparse.ArgumentParser(description="Offline EAS GraphQL stand-in")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--fixture', help="Fixture JSON rekaman (default: dataset sintetis)")
+    parser.add_argument('--attestations', type=int, default=1_000_000, help="Row sintetis per schema YAPS")
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS)
+    parser.add_argument('--schemata', type=int, default=DEFAULT_SCHEMATA)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraksi request yang dibalas 429/502/503")
+    parser.add_argument('--rate-limit', type=float, help="Request/detik sebelum dibalas 429 (simulasi throttling easscan)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-take', type=int, default=MAX_TAKE)
+    args = parser.parse_args(argv)
+
+    if args.fixture:
+        dataset = EASDataset.load(args.fixture)
+    else:
+        dataset = EASDataset.synthetic(args.attestations, users=args.users, seed=args.seed, schemata=args.schemata)
+    standin = EASStandin(dataset, args.latency_ms, args.jitter_ms, args.error_rate, args.seed, args.max_take,
+                         rate_limit=args.rate_limit)
+
+    print(f"🧪 EAS stand-in: http://{args.host}:{args.port}/graphql")
+    print(f"   Dataset: {json.dumps(dataset.stats())}")
+    create_app(standin).run(host=args.host, port=args.port, threaded=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
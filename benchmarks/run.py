@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite untuk scoring, generation & EAS paths (offline, reproducible)
+
+Usage:
+    python -m benchmarks.run                         # jalankan semua
+    python -m benchmarks.run --only score            # filter nama benchmark
+    python -m benchmarks.run --save baseline.json    # simpan hasil
+    python -m benchmarks.run --baseline baseline.json --fail-on-regression
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.eas_fixtures import USER_BASE, USER_STRIDE, EASDataset
+from benchmarks.stubs import install_eas_standin, install_kaito_fixture, install_openai_stub
+from features import extract_features
+from rate_limiter import AdaptiveLimiter
+
+DEFAULT_CORPUS_SIZE = 2000
+EAS_ATTESTATIONS = 200_000
+EAS_USERS = 5000
+REGRESSION_THRESHOLD = 0.10
+
+
+def _setup_app():
+    install_kaito_fixture()
+    install_openai_stub()
+    import app
+
+    # Content pool di-disable supaya /generate mengukur path LLM (stub) sebenarnya;
+    # Kaito cache tetap aktif (kaito.scrape_parse mengukur scrape tanpa cache)
+    app.content_pool.target_depth = 0
+    return app
+
+
+def build_benchmarks(corpus):
+    """Return list (name, ops_per_iteration, fn, iterations)"""
+    app = _setup_app()
+    client = app.app.test_client()
+    projects = app.fetch_kaito_projects()
+    generate_payload = {'project': projects[0]['name'], 'prompt_type': 'data_driven'}
+    texts = iter(corpus * 1000)
+    batch = corpus[:1000]
+
+    def next_text():
+        return next(texts)
+
+    import eas
+    install_eas_standin(EASDataset.synthetic(EAS_ATTESTATIONS, users=EAS_USERS))
+    schema_uid = eas.YAPS_SCHEMAS[517]
+    users = iter(range(10 ** 9))
+
+    def lookup_user():
+        user_id = USER_BASE + next(users) % EAS_USERS * USER_STRIDE
+        return list(eas.iter_user_attestations(schema_uid, user_id, limit=40))
+
+    limiter = AdaptiveLimiter(1e9)
+
+    def acquire_release():
+        limiter.acquire()
+        limiter.release()
+
+    return [
+        ('features.extract', 1, lambda: extract_features(next_text()), len(corpus)),
+        ('score.analyze_yaps_score', 1, lambda: app.analyze_yaps_score(next_text()), len(corpus)),
+        ('score.build_content_analysis', 1, lambda: app.build_content_analysis(next_text()), len(corpus)),
+        ('http./analyze', 1, lambda: client.post('/analyze', json={'content': next_text()}), 500),
+        ('http./analyze/batch[1000]', len(batch), lambda: client.post('/analyze/batch', json={'texts': batch}), 20),
+        ('kaito.scrape_parse', 1, app._scrape_kaito_projects, 200),
+        ('kaito.fetch_cached', 1, app.fetch_kaito_projects, 5000),
+        ('http./generate[stub]', 1, lambda: client.post('/generate', json=generate_payload), 300),
+        ('http./generate/stream[stub]', 1, lambda: client.post('/generate/stream', json=generate_payload).get_data(), 300),
+        ('eas.iter_attestations[2000]', 2000, lambda: list(eas.iter_attestations(schema_uid, limit=2000)), 30),
+        ('eas.user_lookup[stand-in]', 1, lookup_user, 300),
+        ('eas.limiter.acquire_release', 1, acquire_release, 20000),
+    ]
+
+
+def percentile(sorted_values, p):
+    idx = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def run_benchmark(fn, iterations, ops, warmup=10):
+    for _ in range(min(warmup, iterations)):
+        fn()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - t0)
+    elapsed = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        'iterations': iterations,
+        'throughput_ops': round(iterations * ops / elapsed, 1),
+        'p50_us': round(percentile(samples, 50) / 1000, 2),
+        'p95_us': round(percentile(samples, 95) / 1000, 2),
+        'p99_us': round(percentile(samples, 99) / 1000, 2),
+        'max_us': round(samples[-1] / 1000, 2),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Tambahkan delta vs baseline; return list benchmark yang regress"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            continue
+        throughput_delta = (result['throughput_ops'] - base['throughput_ops']) / base['throughput_ops']
+        p50_delta = (result['p50_us'] - base['p50_us']) / base['p50_us'] if base['p50_us'] else 0.0
+        result['vs_baseline'] = {
+            'throughput': round(throughput_delta, 4),
+            'p50': round(p50_delta, 4),
+        }
+        if throughput_delta < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+def print_report(results, regressions):
+    header = f"{'benchmark':<32} {'ops/s':>12} {'p50 µs':>10} {'p95 µs':>10} {'p99 µs':>10} {'vs base':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        delta = r.get('vs_baseline')
+        delta_text = f"{delta['throughput']:+.1%}" if delta else '-'
+        flag = '  ❌ REGRESSION' if name in regressions else ''
+        print(f"{name:<32} {r['throughput_ops']:>12,.1f} {r['p50_us']:>10,.2f} {r['p95_us']:>10,.2f} {r['p99_us']:>10,.2f} {delta_text:>10}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="YAPS scoring & generation benchmarks (offline)")
+    parser.add_argument('--only', help="Jalankan benchmark yang namanya mengandung string ini")
+    parser.add_argument('--corpus-size', type=int, default=DEFAULT_CORPUS_SIZE)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--save', help="Simpan hasil ke file JSON")
+    parser.add_argument('--baseline', help="Bandingkan dengan hasil JSON sebelumnya")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="Throughput drop yang dianggap regression (default 0.10)")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args(argv)
+
+    corpus = generate_corpus(args.corpus_size, seed=args.seed)
+    results = {}
+    for name, ops, fn, iterations in build_benchmarks(corpus):
+        if args.only and args.only not in name:
+            continue
+        results[name] = run_benchmark(fn, iterations, ops)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    print_report(results, regressions)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'corpus_size': args.corpus_size,
+                'seed': args.seed,
+                'results': results,
+            }, f, indent=2)
+        print(f"\n💾 Saved to {args.save}")
+
+    if regressions and args.fail_on_regression:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
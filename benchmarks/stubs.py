@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Offline stubs: Kaito HTML fixture, OpenAI client palsu dan EAS GraphQL stand-in (tanpa network)
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+KAITO_FIXTURE = os.path.join(FIXTURES_DIR, 'kaito_pre_tge.html')
+
+STUB_COMPLETION = (
+    "Monad TVL naik 45% dalam 30 hari, tapi volume DEX baru 12% dari Solana. "
+    "Kenapa gap ini penting? Parallel EVM baru kepakai kalau app-nya native. "
+    "Thesis gw: 6 bulan ke depan yang menang adalah DeFi yang desain ulang orderbook. Setuju?"
+)
+
+
+class StubHTTPResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+
+def load_kaito_fixture():
+    with open(KAITO_FIXTURE, encoding='utf-8') as f:
+        return f.read()
+
+
+def install_kaito_fixture(latency=0.0):
+    """Ganti http_client.get dengan fixture lokal (optional simulated latency)"""
+    import http_client
+
+    html = load_kaito_fixture()
+
+    def fake_get(url, **kwargs):
+        if latency:
+            time.sleep(latency)
+        return StubHTTPResponse(html)
+
+    http_client.get = fake_get
+    return html
+
+
+class _StubCompletions:
+    def __init__(self, latency, token_latency):
+        self.latency = latency
+        self.token_latency = token_latency
+        self.last_stream = None
+
+    def create(self, messages=None, stream=False, stream_options=None, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        usage = SimpleNamespace(prompt_tokens=350, completion_tokens=90, total_tokens=440)
+        if not stream:
+            message = SimpleNamespace(role='assistant', content=STUB_COMPLETION)
+            return SimpleNamespace(choices=[SimpleNamespace(index=0, message=message, finish_reason='stop')], usage=usage)
+        self.last_stream = StubStream(self.token_latency, usage if (stream_options or {}).get('include_usage') else None)
+        return self.last_stream
+
+
+class StubStream:
+    """Meniru openai.Stream: iterable chunk, context manager, close() melepas koneksi"""
+
+    def __init__(self, token_latency=0.0, usage=None):
+        self.token_latency = token_latency
+        self.usage = usage
+        self.closed = False
+
+    def __iter__(self):
+        for word in STUB_COMPLETION.split(' '):
+            if self.token_latency:
+                time.sleep(self.token_latency)
+            delta = SimpleNamespace(content=word + ' ')
+            yield SimpleNamespace(choices=[SimpleNamespace(index=0, delta=delta, finish_reason=None)], usage=None)
+        if self.usage is not None:
+            # Seperti OpenAI: chunk terakhir tanpa choices, hanya usage
+            yield SimpleNamespace(choices=[], usage=self.usage)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class StubOpenAI:
+    """Meniru OpenAI().chat.completions.create untuk non-stream dan stream"""
+
+    def __init__(self, latency=0.0, token_latency=0.0):
+        self.chat = SimpleNamespace(completions=_StubCompletions(latency, token_latency))
+
+
+def install_openai_stub(latency=0.0, token_latency=0.0):
+    """Ganti llm_client.get_openai_client dengan stub client"""
+    import llm_client
+
+    client = StubOpenAI(latency, token_latency)
+    llm_client.get_openai_client = lambda api_key: client
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-benchmark-stub')
+    return client
+
+
+class _StandinResponse:
+    def __init__(self, status_code, body, headers):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def close(self):
+        pass
+
+
+class StandinSession:
+    """Pengganti requests.Session: POST GraphQL dijawab in-process oleh EASStandin.
+    Path retry / backoff http_client tetap dilewati, tanpa socket."""
+
+    def __init__(self, standin):
+        self.standin = standin
+
+    def request(self, method, url, timeout=None, json=None, **kwargs):
+        return _StandinResponse(*self.standin.handle(json))
+
+
+def install_eas_standin(dataset=None, client_rate_limit=None, **kwargs):
+    """Arahkan http_client ke EAS stand-in in-process; return EASStandin.
+    Tanpa client_rate_limit, limiter client dibuat praktis tak terbatas supaya
+    yang diukur adalah CPU path client, bukan budget request/detik."""
+    import http_client
+    from benchmarks.eas_fixtures import EASDataset
+    from benchmarks.eas_server import EASStandin
+    from rate_limiter import AdaptiveLimiter
+
+    standin = EASStandin(dataset or EASDataset.synthetic(), **kwargs)
+    session = StandinSession(standin)
+    http_client.get_session = lambda: session
+    http_client.graphql_limiter = AdaptiveLimiter(client_rate_limit or 1e9, max_concurrency=http_client.POOL_MAXSIZE)
+    return standin
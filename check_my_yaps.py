@@ -3,87 +3,57 @@
 Check YAPS score for specific Twitter user from on-chain attestations
 """
 
-import requests
-import json
+import time
+
+from attestation_store import iter_user_attestations
+from eas import YAPS_SCHEMAS, fetch_schemas
+from score_timeseries import DAY, UserTimeSeriesIndex
 
-GRAPHQL_URL = "https://base.easscan.org/graphql"
 TWITTER_USER_ID = "1422186185196113922"
 
-def query_graphql(query, variables=None):
-    """Execute GraphQL query"""
-    payload = {"query": query, "variables": variables or {}}
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(GRAPHQL_URL, json=payload, headers=headers)
-    return response.json()
+# Schema UIDs we need to check
+DEFAULT_SCHEMAS = {
+    "Schema #517 (Scaled Points)": "0x30c23ae07a72d6c4cafbe3c7a24f6b85427b9dacde030366376c8f87d794a802",
+    "Schema #546 (Monthly Points)": "0x69a0626ec645ae8c2429f9190782f396ce64e5ce0a82096d09891b9515e67fa7"
+}
+# Gained / daily deltas hanya bermakna untuk points kumulatif; #546 reset tiap bulan,
+# jadi window yang melewati reset akan terlihat sebagai "gain" negatif
+CUMULATIVE_SCHEMAS = {YAPS_SCHEMAS[517]}
+
+def _format_day(timestamp):
+    return time.strftime('%Y-%m-%d', time.gmtime(timestamp))
 
-def check_yaps_score():
-    """Check YAPS score for user"""
+def check_yaps_score(twitter_user_id=TWITTER_USER_ID, schemas=None, days=30):
+    """Check YAPS score for user (schemas: {label: schema UID}), plus daily deltas `days` hari terakhir"""
+    schemas = schemas or DEFAULT_SCHEMAS
     
-    print(f"🔍 Checking YAPS score for Twitter ID: {TWITTER_USER_ID}")
-    print(f"Username: @dgkorojr (KoroJR)")
+    print(f"🔍 Checking YAPS score for Twitter ID: {twitter_user_id}")
+    if twitter_user_id == TWITTER_USER_ID:
+        print(f"Username: @dgkorojr (KoroJR)")
     print("="*80)
     
-    # Schema UIDs we need to check
-    schemas = {
-        "Schema #517 (Scaled Points)": "0x30c23ae07a72d6c4cafbe3c7a24f6b85427b9dacde030366376c8f87d794a802",
-        "Schema #546 (Monthly Points)": "0x69a0626ec645ae8c2429f9190782f396ce64e5ce0a82096d09891b9515e67fa7"
-    }
+    def fetch_user_attestations(schema_uid):
+        # Dari local store jika schema sudah di-sync, selain itu filter twitterUserId di server
+        return [
+            {
+                'fields': att['fields'],
+                'timestamp': att['timeCreated'],
+                'revoked': att['revoked']
+            }
+            for att in iter_user_attestations(schema_uid, twitter_user_id)
+        ]
     
-    for schema_name, schema_uid in schemas.items():
+    # Semua schema di-query paralel, hasil ditampilkan sesuai urutan schemas
+    names = {schema_uid: schema_name for schema_name, schema_uid in schemas.items()}
+    for schema_uid, user_attestations, error in fetch_schemas(schemas.values(), fetch_user_attestations):
+        schema_name = names[schema_uid]
         print(f"\n📊 {schema_name}")
         print("-"*80)
         
-        # Query attestations for this schema
-        query = """
-        query GetUserAttestations($schemaId: String!) {
-          attestations(
-            where: { schemaId: { equals: $schemaId } },
-            take: 1000,
-            orderBy: [{ timeCreated: desc }]
-          ) {
-            id
-            data
-            decodedDataJson
-            timeCreated
-            revoked
-          }
-        }
-        """
-        
-        variables = {"schemaId": schema_uid}
-        result = query_graphql(query, variables)
-        
-        if 'data' not in result or 'attestations' not in result['data']:
-            print(f"❌ Error querying: {result}")
+        if error is not None:
+            print(f"❌ Error querying: {error}")
             continue
         
-        attestations = result['data']['attestations']
-        
-        # Find attestations for this Twitter user
-        user_attestations = []
-        
-        for att in attestations:
-            if not att['decodedDataJson']:
-                continue
-                
-            try:
-                decoded = json.loads(att['decodedDataJson'])
-                
-                # Check if this attestation is for our user
-                for field in decoded:
-                    if 'twitterUserId' in field['name']:
-                        twitter_id = str(field['value']['value'] if 'value' in field['value'] else field['value'])
-                        
-                        if twitter_id == TWITTER_USER_ID:
-                            user_attestations.append({
-                                'decoded': decoded,
-                                'timestamp': att['timeCreated'],
-                                'revoked': att['revoked']
-                            })
-                            break
-            except (json.JSONDecodeError, KeyError):
-                continue
-        
         if not user_attestations:
             print(f"❌ No attestations found for this user in {schema_name}")
             continue
@@ -97,11 +67,7 @@ def check_yaps_score():
         print(f"   Revoked: {latest['revoked']}")
         print(f"\n   Data:")
         
-        for field in latest['decoded']:
-            name = field['name']
-            value = field['value']['value'] if 'value' in field['value'] else field['value']
-            field_type = field['type']
-            
+        for name, value in latest['fields'].items():
             # Format display
             if 'Points' in name or 'points' in name:
                 if str(value).isdigit():
@@ -110,6 +76,29 @@ def check_yaps_score():
                     print(f"   • {name}: {value}")
             else:
                 print(f"   • {name}: {value}")
+        
+        # Time series semua snapshot user ini (bisect, tanpa scan ulang)
+        series = UserTimeSeriesIndex.from_attestations(user_attestations)
+        snapshots = series.snapshots(twitter_user_id)
+        if len(snapshots) < 2:
+            continue
+        
+        if schema_uid not in CUMULATIVE_SCHEMAS:
+            print(f"\n📈 History: {len(snapshots)} snapshot(s) (points tidak kumulatif, delta tidak dihitung)")
+            continue
+        
+        now = snapshots[-1][0]
+        history_start = snapshots[0][0]
+        print(f"\n📈 History: {len(snapshots)} snapshot(s)")
+        for window in (7, days):
+            # Window yang mulai sebelum snapshot pertama hanya dihitung sejak history dimulai
+            since = f" (history starts {_format_day(history_start)})" if history_start > now - window * DAY else ""
+            print(f"   Gained last {window} days: {series.gained(twitter_user_id, now - window * DAY, now):+,}{since}")
+        active_days = [(day, delta) for day, delta in series.daily_deltas(twitter_user_id, days, now) if delta]
+        if active_days:
+            print(f"\n   Daily deltas ({days} hari terakhir):")
+            for day, delta in active_days:
+                print(f"   • {day}: {delta:+,}")
     
     print("\n" + "="*80)
     print("✨ YAPS Score Check Complete!")
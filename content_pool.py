@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Pre-generated content pool per (project, prompt_type) dengan background refill
+
+/generate pop entry yang sudah jadi (dan sudah di-score) dari pool, lalu worker di
+background mengisi ulang pool sampai target depth. Project yang keluar dari
+Kaito top 20 di-evict.
+"""
+
+import collections
+import queue
+import threading
+import time
+
+
+class ContentPool:
+    """Bounded pool hasil generate yang siap pakai, keyed by (project name, prompt_type)"""
+
+    def __init__(self, generate_fn, target_depth=2, max_age=3600, workers=2):
+        # generate_fn(project, prompt_type, api_key) -> dict hasil generate + scoring
+        self.generate_fn = generate_fn
+        self.target_depth = target_depth
+        self.max_age = max_age
+        self.workers = workers
+
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._projects = {}
+        self._pending = set()
+        self._queue = queue.Queue()
+        self._threads = []
+        self._api_key = None
+
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.errors = 0
+        self.evicted = 0
+
+    @property
+    def enabled(self):
+        return self.target_depth > 0
+
+    def _start_workers(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"content-pool-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def pop(self, project, prompt_type, api_key):
+        """Ambil satu entry siap pakai (atau None), lalu jadwalkan refill"""
+        if not self.enabled:
+            return None
+
+        key = (project['name'], prompt_type)
+        entry = None
+        now = time.time()
+        with self._lock:
+            self._api_key = api_key
+            self._projects[project['name']] = project
+            entries = self._entries.setdefault(key, collections.deque())
+            while entries:
+                created_at, candidate = entries.popleft()
+                if now - created_at <= self.max_age:
+                    entry = candidate
+                    break
+                self.evicted += 1
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        self.schedule_refill(key)
+        return entry
+
+    def schedule_refill(self, key):
+        """Masukkan key ke antrian refill (dedupe jika sudah pending)"""
+        with self._lock:
+            if key in self._pending or key[0] not in self._projects:
+                return
+            if len(self._entries.get(key, ())) >= self.target_depth:
+                return
+            self._pending.add(key)
+            self._start_workers()
+        self._queue.put(key)
+
+    def prewarm(self, projects, prompt_types, api_key):
+        """Jadwalkan refill untuk semua kombinasi (project, prompt_type)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._api_key = api_key
+            for project in projects:
+                self._projects[project['name']] = project
+        for project in projects:
+            for prompt_type in prompt_types:
+                self.schedule_refill((project['name'], prompt_type))
+
+    def retain_projects(self, projects):
+        """Evict entries untuk project yang sudah tidak ada di Kaito top 20"""
+        names = {p['name'] for p in projects}
+        with self._lock:
+            for name in list(self._projects):
+                if name not in names:
+                    del self._projects[name]
+            for key in list(self._entries):
+                if key[0] not in names:
+                    self.evicted += len(self._entries.pop(key))
+            for project in projects:
+                if project['name'] in self._projects:
+                    self._projects[project['name']] = project
+
+    def _worker(self):
+        while True:
+            key = self._queue.get()
+            try:
+                self._refill(key)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+
+    def _refill(self, key):
+        name, prompt_type = key
+        while True:
+            with self._lock:
+                project = self._projects.get(name)
+                api_key = self._api_key
+                if project is None or len(self._entries.get(key, ())) >= self.target_depth:
+                    return
+            try:
+                entry = self.generate_fn(project, prompt_type, api_key)
+            except Exception:
+                with self._lock:
+                    self.errors += 1
+                return
+            with self._lock:
+                # Project bisa saja di-evict selama generate berjalan
+                if name not in self._projects:
+                    return
+                self._entries.setdefault(key, collections.deque()).append((time.time(), entry))
+                self.generated += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'target_depth': self.target_depth,
+                'keys': len(self._entries),
+                'ready_entries': sum(len(e) for e in self._entries.values()),
+                'pending_refills': len(self._pending),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'generated': self.generated,
+                'errors': self.errors,
+                'evicted': self.evicted,
+            }
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+EAS attestation helpers: cursor-paginated iterator + ABI decoding field `data`
+
+iter_attestations() mem-page attestations satu schema dengan cursor (urut
+timeCreated lalu id) dan yield record satu per satu, jadi seluruh history
+schema bisa di-scan dengan memory konstan (tidak terpotong di take: 1000).
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from abi_decoder import ABIDecodeError, compile_schema
+
+# Schema YAPS yang sudah diketahui (lihat yaps_scoring_parameters.py)
+YAPS_SCHEMAS = {
+    517: "0x30c23ae07a72d6c4cafbe3c7a24f6b85427b9dacde030366376c8f87d794a802",
+    546: "0x69a0626ec645ae8c2429f9190782f396ce64e5ce0a82096d09891b9515e67fa7",
+    525: "0xcb66276cf243e78fad68dd5e633f7bb56814b49ac9a91256615340591577a0e8",
+}
+
+# Schema definition yang sudah diketahui; schema lain di-fetch sekali via get_schema_definition()
+SCHEMA_DEFINITIONS = {
+    YAPS_SCHEMAS[517]: "uint64 twitterUserId, uint64 yapScaledPoints, uint64 yap24HScaledPoints, uint64 timestamp",
+    YAPS_SCHEMAS[525]: "uint64 twitterUserId, string twitterUsername, uint64 yapPoints, uint64 timestamp",
+}
+_definitions_lock = threading.Lock()
+
+DEFAULT_PAGE_SIZE = 500
+# Maksimal schema yang di-fetch paralel (di bawah http_client.POOL_MAXSIZE)
+FETCH_WORKERS = int(os.getenv('EAS_FETCH_WORKERS', '4'))
+# `data` di-decode langsung (ABI), decodedDataJson tidak perlu di-request
+DEFAULT_FIELDS = ("id", "attester", "recipient", "data", "timeCreated", "revoked")
+# Field minimal untuk menampilkan score satu user
+USER_LOOKUP_FIELDS = ("id", "data", "timeCreated", "revoked")
+
+SCHEMA_DEFINITION_QUERY = """
+query SchemaDefinition($schemaId: String!) {
+  schema(where: { id: $schemaId }) {
+    schema
+  }
+}
+"""
+
+ATTESTATIONS_PAGE_QUERY = """
+query AttestationsPage($where: AttestationWhereInput, $take: Int!, $skip: Int, $cursor: AttestationWhereUniqueInput, $orderBy: [AttestationOrderByWithRelationInput!]) {
+  attestations(where: $where, take: $take, skip: $skip, cursor: $cursor, orderBy: $orderBy) {
+    %s
+  }
+}
+"""
+
+SCHEMA_FIELDS = ("id", "schema", "creator", "txid", "time", "index")
+
+SCHEMATA_PAGE_QUERY = """
+query SchemataPage($where: SchemaWhereInput, $take: Int!, $skip: Int, $cursor: SchemaWhereUniqueInput, $orderBy: [SchemaOrderByWithRelationInput!]) {
+  schemata(where: $where, take: $take, skip: $skip, cursor: $cursor, orderBy: $orderBy) {
+    %s
+  }
+}
+"""
+
+
+class EASQueryError(Exception):
+    """GraphQL response tanpa data yang diharapkan"""
+
+
+def query_graphql(query, variables=None):
+    """http_client.query_graphql, di-import saat pertama kali ke network
+    (requests cukup berat; lookup dari cache lokal tidak perlu memuatnya)"""
+    from http_client import query_graphql as _query_graphql
+    return _query_graphql(query, variables)
+
+
+def resolve_schema(value):
+    """Schema UID dari '0x...', '517' atau '#517' (YAPS_SCHEMAS, lalu schema registry)"""
+    value = str(value).strip()
+    if value.startswith('0x'):
+        return value
+    index = int(value.lstrip('#'))
+    if index in YAPS_SCHEMAS:
+        return YAPS_SCHEMAS[index]
+    from schema_registry import get_registry
+    schema = get_registry().by_index(index)
+    if schema is None:
+        raise EASQueryError(f"Schema #{index} tidak ditemukan")
+    return schema['id']
+
+
+def field_value(field):
+    """Ambil value dari satu entry decodedDataJson ({name, type, value: {value}})"""
+    value = field['value']
+    if isinstance(value, dict) and 'value' in value:
+        value = value['value']
+    # uint64 dsb kadang di-encode sebagai {"type": "BigNumber", "hex": "0x..."}
+    if isinstance(value, dict) and value.get('type') == 'BigNumber':
+        return int(value['hex'], 16)
+    return value
+
+
+def json_safe_fields(fields):
+    """Decoded fields untuk response JSON: integer (uint64 / int256) jadi string,
+    karena client JS kehilangan presisi di atas 2^53"""
+    def convert(value):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+        if isinstance(value, list):
+            return [convert(item) for item in value]
+        return value
+    return {name: convert(value) for name, value in (fields or {}).items()}
+
+
+def decode_fields(decoded_data_json):
+    """decodedDataJson string -> dict {field name: value}"""
+    if not decoded_data_json:
+        return {}
+    try:
+        decoded = json.loads(decoded_data_json)
+        return {field['name']: field_value(field) for field in decoded}
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return {}
+
+
+def get_schema_definition(schema_uid):
+    """Schema string untuk schema_uid (cached per proses)"""
+    definition = SCHEMA_DEFINITIONS.get(schema_uid)
+    if definition is not None:
+        return definition
+
+    # Import di sini: schema_registry sendiri memakai eas
+    from schema_registry import get_registry
+    cached = get_registry().get(schema_uid)
+    if cached is not None:
+        with _definitions_lock:
+            SCHEMA_DEFINITIONS[schema_uid] = cached['schema']
+        return cached['schema']
+
+    result = query_graphql(SCHEMA_DEFINITION_QUERY, {"schemaId": schema_uid})
+    schema = (result.get('data') or {}).get('schema')
+    if not schema:
+        raise EASQueryError(result.get('errors') or f"Schema {schema_uid} tidak ditemukan")
+    with _definitions_lock:
+        SCHEMA_DEFINITIONS[schema_uid] = schema['schema']
+    return schema['schema']
+
+
+def get_decoder(schema_uid):
+    """Compiled ABI decoder untuk schema_uid"""
+    return compile_schema(get_schema_definition(schema_uid))
+
+
+def decode_attestation(att, decoder=None):
+    """Decoded fields satu attestation: ABI decode `data`, fallback ke decodedDataJson"""
+    data = att.get('data')
+    if data and decoder is not None:
+        try:
+            return decoder.decode(data)
+        except ABIDecodeError:
+            pass
+    return decode_fields(att.get('decodedDataJson'))
+
+
+def iter_pages(collection, query, variables, page_size=DEFAULT_PAGE_SIZE, limit=None):
+    """Generator record dari satu GraphQL collection, di-page dengan cursor {id}.
+
+    `query` harus menerima variables take/skip/cursor; orderBy di `variables`
+    harus deterministik (diakhiri id) supaya cursor tidak melewatkan record.
+    """
+    cursor = None
+    yielded = 0
+    while True:
+        take = page_size if limit is None else min(page_size, limit - yielded)
+        if take <= 0:
+            return
+        page_variables = dict(variables, take=take)
+        if cursor is not None:
+            page_variables.update(cursor={"id": cursor}, skip=1)
+
+        result = query_graphql(query, page_variables)
+        data = result.get('data') or {}
+        page = data.get(collection)
+        if page is None:
+            raise EASQueryError(result.get('errors') or result)
+
+        yield from page
+        yielded += len(page)
+
+        if len(page) < take:
+            return
+        cursor = page[-1]['id']
+
+
+def iter_attestations(schema_uid, fields=DEFAULT_FIELDS, where=None, page_size=DEFAULT_PAGE_SIZE,
+                      newest_first=True, limit=None, decode=True):
+    """Generator semua attestations untuk schema_uid, di-page dengan cursor.
+
+    Record yang di-yield adalah dict dari GraphQL, plus key 'fields' (hasil
+    ABI decode `data`, atau decodedDataJson jika itu yang di-request) jika
+    decode=True. `where` di-merge dengan filter schemaId; `limit` membatasi
+    total record yang di-yield.
+    """
+    fields = tuple(fields)
+    if 'id' not in fields:
+        fields = ('id',) + fields
+    decoder = None
+    if decode and 'data' in fields:
+        try:
+            decoder = get_decoder(schema_uid)
+        except ABIDecodeError:
+            # Type yang tidak didukung ABI decoder (tuple, string[], T[N]): decode oleh server
+            if 'decodedDataJson' not in fields:
+                fields += ('decodedDataJson',)
+    query = ATTESTATIONS_PAGE_QUERY % "\n    ".join(fields)
+
+    direction = "desc" if newest_first else "asc"
+    variables = {
+        "where": dict(where or {}, schemaId={"equals": schema_uid}),
+        "orderBy": [{"timeCreated": direction}, {"id": direction}],
+    }
+
+    for att in iter_pages('attestations', query, variables, page_size=page_size, limit=limit):
+        if decode:
+            att['fields'] = decode_attestation(att, decoder)
+        yield att
+
+
+def iter_schemata(fields=SCHEMA_FIELDS, where=None, page_size=DEFAULT_PAGE_SIZE, limit=None):
+    """Generator schemata (urut time lalu id, oldest first), di-page dengan cursor"""
+    fields = tuple(fields)
+    if 'id' not in fields:
+        fields = ('id',) + fields
+    query = SCHEMATA_PAGE_QUERY % "\n    ".join(fields)
+    variables = {"where": where or {}, "orderBy": [{"time": "asc"}, {"id": "asc"}]}
+    return iter_pages('schemata', query, variables, page_size=page_size, limit=limit)
+
+
+def abi_uint_word(value):
+    """ABI encoding satu uint (32-byte word) sebagai hex string 0x..."""
+    return "0x" + format(int(value), '064x')
+
+
+def iter_user_attestations(schema_uid, twitter_user_id, fields=USER_LOOKUP_FIELDS, limit=None,
+                           page_size=DEFAULT_PAGE_SIZE):
+    """Attestations milik satu twitterUserId, difilter di server.
+
+    Semua schema YAPS diawali `uint64 twitterUserId`, jadi word pertama dari
+    field `data` (ABI encoded) = twitterUserId. Filter `data: {startsWith}`
+    membuat server hanya mengembalikan row milik user ini (newest first).
+    """
+    where = {"data": {"startsWith": abi_uint_word(twitter_user_id)}}
+    twitter_user_id = str(twitter_user_id)
+    for att in iter_attestations(schema_uid, fields=fields, where=where, limit=limit, page_size=page_size):
+        # Guard: hanya row dengan decoded twitterUserId yang terbukti sama; row yang gagal
+        # di-decode / tanpa twitterUserId tidak bisa dicek, jadi ikut di-skip
+        decoded_id = next((str(v) for k, v in att['fields'].items() if 'twitterUserId' in k), None)
+        if decoded_id == twitter_user_id:
+            yield att
+
+
+def fetch_schemas(schema_uids, fetch, max_workers=FETCH_WORKERS):
+    """Jalankan fetch(schema_uid) untuk semua schema secara concurrent.
+
+    Return list (schema_uid, result, error) dengan urutan sama seperti input;
+    error berisi exception jika fetch schema itu gagal, jadi satu schema yang
+    gagal tidak membatalkan yang lain. Wall time ~ schema paling lambat.
+    """
+    schema_uids = list(schema_uids)
+
+    def run(schema_uid):
+        try:
+            return schema_uid, fetch(schema_uid), None
+        except Exception as e:
+            return schema_uid, None, e
+
+    if len(schema_uids) <= 1 or max_workers <= 1:
+        return [run(schema_uid) for schema_uid in schema_uids]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(schema_uids))) as executor:
+        return list(executor.map(run, schema_uids))
@@ -3,24 +3,18 @@
 Explore new YAPS schema to find scoring parameters
 """
 
-import requests
-import json
+import bisect
+from http_client import query_graphql
+from attestation_store import iter_attestations
+from eas import EASQueryError, get_decoder
 from datetime import datetime
 
-GRAPHQL_URL = "https://base.easscan.org/graphql"
 SCHEMA_UID = "0xcb66276cf243e78fad68dd5e633f7bb56814b49ac9a91256615340591577a0e8"
 
-def query_graphql(query, variables=None):
-    """Execute GraphQL query"""
-    payload = {"query": query, "variables": variables or {}}
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(GRAPHQL_URL, json=payload, headers=headers)
-    return response.json()
-
-def explore_schema():
+def explore_schema(schema_uid=SCHEMA_UID):
     """Get schema details and structure"""
     
-    print(f"🔍 Exploring Schema: {SCHEMA_UID}")
+    print(f"🔍 Exploring Schema: {schema_uid}")
     print("="*100)
     
     # Get schema details
@@ -39,7 +33,7 @@ def explore_schema():
     }
     """
     
-    result = query_graphql(query, {"schemaId": SCHEMA_UID})
+    result = query_graphql(query, {"schemaId": schema_uid})
     
     if 'data' in result and 'schema' in result['data']:
         schema = result['data']['schema']
@@ -51,7 +45,7 @@ def explore_schema():
         print(f"\n   Schema Structure: {schema['schema']}")
         print("-"*100)
 
-def get_attestations():
+def get_attestations(schema_uid=SCHEMA_UID):
     """Get recent attestations from this schema"""
     
     print("\n📊 RECENT ATTESTATIONS:")
@@ -68,14 +62,13 @@ def get_attestations():
         attester
         recipient
         data
-        decodedDataJson
         timeCreated
         revoked
       }
     }
     """
     
-    result = query_graphql(query, {"schemaId": SCHEMA_UID})
+    result = query_graphql(query, {"schemaId": schema_uid})
     
     if 'data' not in result or 'attestations' not in result['data']:
         print(f"❌ Error: {result}")
@@ -91,16 +84,12 @@ def get_attestations():
         print(f"   Time: {datetime.fromtimestamp(att['timeCreated'])}")
         print(f"   Recipient: {att['recipient']}")
         
-        if att['decodedDataJson']:
+        if att['data']:
             try:
-                decoded = json.loads(att['decodedDataJson'])
+                decoded = get_decoder(schema_uid).decode_typed(att['data'])
                 print(f"   Fields:")
                 
-                for field in decoded:
-                    name = field['name']
-                    value = field['value']['value'] if 'value' in field['value'] else field['value']
-                    field_type = field['type']
-                    
+                for name, field_type, value in decoded:
                     # Format based on type
                     if isinstance(value, (int, float)) and 'point' in name.lower():
                         print(f"      • {name} ({field_type}): {int(value):,}")
@@ -110,83 +99,66 @@ def get_attestations():
             except Exception as e:
                 print(f"   ⚠️  Decode error: {e}")
 
-def analyze_scoring_patterns():
+def analyze_scoring_patterns(schema_uid=SCHEMA_UID):
     """Analyze all attestations to find scoring patterns"""
     
     print("\n\n🎯 SCORING PATTERN ANALYSIS:")
     print("="*100)
     
-    query = """
-    query GetAllAttestations($schemaId: String!) {
-      attestations(
-        where: { schemaId: { equals: $schemaId } },
-        take: 500,
-        orderBy: [{ timeCreated: desc }]
-      ) {
-        decodedDataJson
-        timeCreated
-      }
-    }
-    """
-    
-    result = query_graphql(query, {"schemaId": SCHEMA_UID})
-    
-    if 'data' not in result or 'attestations' not in result['data']:
-        print(f"❌ Error: {result}")
-        return
-    
-    attestations = result['data']['attestations']
-    
-    # Collect all field names and their ranges
+    # Collect all field names and their ranges (running stats, memory konstan)
     field_stats = {}
+    scanned = 0
     
-    for att in attestations:
-        if not att['decodedDataJson']:
-            continue
+    try:
+        for att in iter_attestations(schema_uid, fields=("id", "timeCreated", "fields")):
+            scanned += 1
             
-        try:
-            decoded = json.loads(att['decodedDataJson'])
-            
-            for field in decoded:
-                name = field['name']
-                value = field['value']['value'] if 'value' in field['value'] else field['value']
-                
+            for name, value in att['fields'].items():
                 if name not in field_stats:
                     field_stats[name] = {
-                        'type': field['type'],
-                        'values': [],
+                        'count': 0,
                         'min': None,
                         'max': None,
-                        'avg': None
+                        'sum': 0,
+                        'smallest': []
                     }
                 
                 # Collect numeric values
-                if isinstance(value, (int, float)):
-                    field_stats[name]['values'].append(value)
-                elif isinstance(value, str) and value.isdigit():
-                    field_stats[name]['values'].append(int(value))
-                    
-        except Exception:
-            continue
+                if isinstance(value, str) and value.isdigit():
+                    value = int(value)
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+                
+                stats = field_stats[name]
+                stats['count'] += 1
+                stats['sum'] += value
+                stats['min'] = value if stats['min'] is None else min(stats['min'], value)
+                stats['max'] = value if stats['max'] is None else max(stats['max'], value)
+                
+                # 10 nilai distinct terkecil untuk distribution
+                smallest = stats['smallest']
+                if value not in smallest and (len(smallest) < 10 or value < smallest[-1]):
+                    bisect.insort(smallest, value)
+                    del smallest[10:]
+    except EASQueryError as e:
+        print(f"❌ Error: {e}")
+        return
     
     # Calculate statistics
-    print("\n📈 FIELD STATISTICS:\n")
+    print(f"\n📈 FIELD STATISTICS ({scanned:,} attestations):\n")
     
     for field_name, stats in field_stats.items():
-        if stats['values']:
-            values = stats['values']
-            stats['min'] = min(values)
-            stats['max'] = max(values)
-            stats['avg'] = sum(values) / len(values)
+        if stats['count']:
+            avg = stats['sum'] / stats['count']
             
-            print(f"🔸 {field_name} ({stats['type']}):")
-            print(f"   Samples: {len(values)}")
+            print(f"🔸 {field_name}:")
+            print(f"   Samples: {stats['count']:,}")
             print(f"   Range: {int(stats['min']):,} - {int(stats['max']):,}")
-            print(f"   Average: {int(stats['avg']):,}")
+            print(f"   Average: {int(avg):,}")
             
             # Show distribution for point fields
             if 'point' in field_name.lower() or 'score' in field_name.lower():
-                print(f"   Distribution: {sorted(set(values))[:10]}")
+                print(f"   Distribution: {stats['smallest']}")
             print()
 
 if __name__ == "__main__":
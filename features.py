@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared feature extraction engine untuk /analyze dan analyze_yaps_score
+
+Semua keyword list dari kedua scorer di-compile jadi satu vocabulary (deduplicated),
+teks di-lowercase sekali dan setiap term dicek sekali. Hasilnya feature vector
+(dict) yang dipakai kedua scorer, jadi hasil keduanya selalu konsisten.
+"""
+
+import re
+
+# /analyze - Kaito YAPS analysis
+CRYPTO_KEYWORDS = ['defi', 'layer', 'l2', 'ai', 'rwa', 'tvl', 'airdrop', 'protocol', 'chain', 'token', 'nft', 'dao', 'staking', 'yield', 'bridge', 'zk', 'rollup', 'evm', 'smart contract']
+GENERIC_PHRASES = ['to the moon', 'lfg', 'gm', 'ser', 'ngmi', 'wagmi', 'bullish', 'bearish']
+CTA_WORDS = ['what', 'how', 'why', 'thoughts', 'think', 'opinion', 'apa', 'bagaimana', 'mengapa', 'gimana']
+ENGAGEMENT_FARMING = ['follow', 'rt', 'like if']
+CONTENT_TYPE_TERMS = ['tvl', 'revenue', 'vs', 'compare', 'airdrop', 'risk', 'thread', '1/', 'kaito']
+THREAD_MARKERS = ['thread', '1/']
+
+# analyze_yaps_score - generate endpoint
+YAPS_CRYPTO_KEYWORDS = ['defi', 'l2', 'tvl', 'funding', 'protocol', 'ai', 'crypto', 'blockchain']
+ANALYTICAL_WORDS = ['kenapa', 'bagaimana', 'mengapa', 'analisis', 'thesis']
+YAPS_SPAM_PHRASES = ['gm', 'gn', 'lfg', 'wagmi']
+
+STRUCTURAL_TERMS = ['?', '@', 'http']
+
+# \d ditambah karakter yang str.isdigit() == True tapi tidak match \d (superscript, circled digits, dll)
+DIGIT_CLASS = r'[\d\u00b2-\u00b3\u00b9\u1369-\u1371\u19da\u2070\u2074-\u2079\u2080-\u2089\u2460-\u2468\u2474-\u247c\u2488-\u2490\u24ea\u24f5-\u24fd\u24ff\u2776-\u277e\u2780-\u2788\u278a-\u2792\U00010a40-\U00010a43\U00010e60-\U00010e68\U00011052-\U0001105a\U0001f100-\U0001f10a]'
+
+METRICS_PATTERN = re.compile(r'\d+[%$MBK]|\$\d+|\d+x')
+SPAM_REPEAT_PATTERN = re.compile(r'(.)\1{3,}')
+
+
+class FeatureExtractor:
+    """Compiled vocabulary matcher.
+
+    Untuk teks seukuran tweet, substring search CPython (C-level) per term lebih
+    cepat daripada satu regex alternation yang dicoba di setiap posisi, jadi
+    vocabulary cukup di-dedupe dan setiap term dicek sekali. Digit dicek dengan
+    compiled regex (setara `any(c.isdigit() for c in text)`, tanpa loop Python).
+    """
+
+    def __init__(self, terms):
+        self.terms = tuple(sorted(set(terms)))
+        self.digit_pattern = re.compile(DIGIT_CLASS)
+
+    def scan(self, text_lower):
+        """Return (term yang ditemukan, has_digit)"""
+        found = frozenset(t for t in self.terms if t in text_lower)
+        return found, self.digit_pattern.search(text_lower) is not None
+
+    def extract(self, content):
+        """Feature vector untuk satu teks"""
+        content_lower = content.lower()
+        found, has_digit = self.scan(content_lower)
+
+        return {
+            'char_count': len(content),
+            'word_count': len(content.split()),
+            'has_digit': has_digit,
+            'question_count': content.count('?') if '?' in found else 0,
+            'mention_count': content.count('@') if '@' in found else 0,
+            'http_count': content_lower.count('http') if 'http' in found else 0,
+            'terms': found,
+            'crypto_keyword_count': len(found.intersection(CRYPTO_KEYWORDS)),
+            'generic_count': len(found.intersection(GENERIC_PHRASES)),
+            'has_cta': not found.isdisjoint(CTA_WORDS),
+            'has_engagement_farming': not found.isdisjoint(ENGAGEMENT_FARMING),
+            'has_yaps_crypto_keyword': not found.isdisjoint(YAPS_CRYPTO_KEYWORDS),
+            'has_analytical_tone': not found.isdisjoint(ANALYTICAL_WORDS),
+            'has_yaps_spam': not found.isdisjoint(YAPS_SPAM_PHRASES),
+            'has_thread': not found.isdisjoint(THREAD_MARKERS),
+            'has_metrics': bool(METRICS_PATTERN.search(content)),
+            'has_spam_pattern': bool(SPAM_REPEAT_PATTERN.search(content)),
+        }
+
+
+default_extractor = FeatureExtractor(
+    CRYPTO_KEYWORDS + GENERIC_PHRASES + CTA_WORDS + ENGAGEMENT_FARMING + CONTENT_TYPE_TERMS
+    + YAPS_CRYPTO_KEYWORDS + ANALYTICAL_WORDS + YAPS_SPAM_PHRASES + STRUCTURAL_TERMS
+)
+
+
+def extract_features(content):
+    """Feature vector untuk content menggunakan default extractor"""
+    return default_extractor.extract(content)
@@ -3,70 +3,37 @@
 Find YAPS advanced schemas (517-520) with yap24HScaledPoints and yapScaledPoints
 """
 
-import requests
-import json
-
-GRAPHQL_URL = "https://base.easscan.org/graphql"
-
-def query_graphql(query, variables=None):
-    """Execute GraphQL query"""
-    payload = {"query": query, "variables": variables or {}}
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(GRAPHQL_URL, json=payload, headers=headers)
-    return response.json()
+from abi_decoder import ABIDecodeError, compile_schema
+from http_client import query_graphql
+from schema_registry import get_registry, print_schema
 
 def find_schemas_by_position():
-    """Find schemas 517-520 by querying all schemas and finding by position"""
-    query = """
-    query GetSchemas {
-      schemata(orderBy: [{ id: asc }], take: 600) {
-        id
-        schema
-        creator
-        txid
-        time
-        index
-      }
-    }
-    """
+    """Find schemas 517-520 by EAS index via the local schema registry"""
+    registry = get_registry()
+    registry.ensure_fresh()
+    print(f"Registry has {registry.count()} schemas")
     
-    result = query_graphql(query)
-    if 'data' in result and 'schemata' in result['data']:
-        schemas = result['data']['schemata']
-        print(f"Found {len(schemas)} total schemas")
-        
-        # Check schemas 517-520
-        target_positions = [517, 518, 519, 520]
-        found_schemas = {}
-        
-        for target in target_positions:
-            if target <= len(schemas):
-                schema = schemas[target-1]  # Array is 0-indexed
-                found_schemas[target] = schema
-                
-                print(f"\n{'='*60}")
-                print(f"SCHEMA #{target}")
-                print(f"{'='*60}")
-                print(f"UID: {schema['id']}")
-                print(f"Schema: {schema['schema']}")
-                print(f"Creator: {schema['creator']}")
-                print(f"Time: {schema['time']}")
-                print(f"TxID: {schema['txid']}")
+    # Check schemas 517-520
+    target_positions = [517, 518, 519, 520]
+    found_schemas = {}
+    
+    for target in target_positions:
+        schema = registry.by_index(target)
+        if schema:
+            found_schemas[target] = schema
+            print_schema(schema, details=True)
+            
+            # Check if it contains YAPS-related fields
+            schema_lower = schema['schema'].lower()
+            if any(keyword in schema_lower for keyword in ['yap', 'scaled', '24h']):
+                print("🎯 POTENTIAL YAPS SCHEMA DETECTED!")
                 
-                # Check if it contains YAPS-related fields
-                schema_lower = schema['schema'].lower()
-                if any(keyword in schema_lower for keyword in ['yap', 'scaled', '24h']):
-                    print("🎯 POTENTIAL YAPS SCHEMA DETECTED!")
-                    
-                    if 'yap24hscaled' in schema_lower:
-                        print("✅ Contains yap24HScaledPoints")
-                    if 'yapscaled' in schema_lower:
-                        print("✅ Contains yapScaledPoints")
-        
-        return found_schemas
-    else:
-        print(f"Error querying schemas: {result}")
-        return {}
+                if 'yap24hscaled' in schema_lower:
+                    print("✅ Contains yap24HScaledPoints")
+                if 'yapscaled' in schema_lower:
+                    print("✅ Contains yapScaledPoints")
+    
+    return found_schemas
 
 def analyze_advanced_yaps_schema(schema_uid, schema_structure):
     """Analyze attestations from advanced YAPS schema"""
@@ -84,7 +51,6 @@ def analyze_advanced_yaps_schema(schema_uid, schema_structure):
         attester
         recipient
         data
-        decodedDataJson
         timeCreated
         revoked
       }
@@ -100,26 +66,23 @@ def analyze_advanced_yaps_schema(schema_uid, schema_structure):
         
         if attestations:
             print("\n📊 SAMPLE ATTESTATIONS FOR ALGORITHM ANALYSIS:")
+            decoder = compile_schema(schema_structure)
             
             for i, att in enumerate(attestations[:3]):
                 print(f"\n--- Attestation {i+1} ---")
                 print(f"Time: {att['timeCreated']}")
                 print(f"Attester: {att['attester']}")
                 
-                if att['decodedDataJson']:
+                if att['data']:
                     try:
-                        decoded = json.loads(att['decodedDataJson'])
+                        decoded = decoder.decode_typed(att['data'])
                         
                         yap_scaled = None
                         yap_24h = None
                         twitter_id = None
                         
                         print("Decoded fields:")
-                        for field in decoded:
-                            name = field['name']
-                            value = field['value']['value'] if 'value' in field['value'] else field['value']
-                            field_type = field['type']
-                            
+                        for name, field_type, value in decoded:
                             print(f"  {name} ({field_type}): {value}")
                             
                             # Extract key values for analysis
@@ -147,8 +110,8 @@ def analyze_advanced_yaps_schema(schema_uid, schema_structure):
                                 # Look for scaling patterns
                                 print(f"  Potential scaling factor detected")
                         
-                    except json.JSONDecodeError as e:
-                        print(f"JSON decode error: {e}")
+                    except ABIDecodeError as e:
+                        print(f"ABI decode error: {e}")
         else:
             print("No attestations found")
     else:
@@ -3,17 +3,9 @@
 Get YAPS attestations from specific schemas to analyze algorithm parameters
 """
 
-import requests
-import json
-
-GRAPHQL_URL = "https://base.easscan.org/graphql"
-
-def query_graphql(query, variables=None):
-    """Execute GraphQL query"""
-    payload = {"query": query, "variables": variables or {}}
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(GRAPHQL_URL, json=payload, headers=headers)
-    return response.json()
+from abi_decoder import ABIDecodeError, compile_schema
+from eas import fetch_schemas
+from http_client import query_graphql
 
 def analyze_yaps_attestations():
     """Get and analyze YAPS attestations from known schemas"""
@@ -34,38 +26,44 @@ def analyze_yaps_attestations():
         }
     }
     
-    for schema_name, schema_info in yaps_schemas.items():
+    # Query attestations for all schemas concurrently
+    query = """
+    query GetYAPSAttestations($schemaId: String!) {
+      attestations(
+        where: { schemaId: { equals: $schemaId } },
+        take: 20,
+        orderBy: [{ timeCreated: desc }]
+      ) {
+        id
+        attester
+        recipient  
+        data
+        timeCreated
+        revoked
+      }
+    }
+    """
+    
+    results = fetch_schemas(
+        [schema_info["uid"] for schema_info in yaps_schemas.values()],
+        lambda schema_uid: query_graphql(query, {"schemaId": schema_uid})
+    )
+    
+    for (schema_name, schema_info), (_, result, error) in zip(yaps_schemas.items(), results):
         print(f"\n{'='*60}")
         print(f"Analyzing {schema_name}")  
         print(f"UID: {schema_info['uid']}")
         print(f"Fields: {schema_info['fields']}")
         print(f"{'='*60}")
         
-        # Query attestations for this schema
-        query = """
-        query GetYAPSAttestations($schemaId: String!) {
-          attestations(
-            where: { schemaId: { equals: $schemaId } },
-            take: 20,
-            orderBy: [{ timeCreated: desc }]
-          ) {
-            id
-            attester
-            recipient  
-            data
-            decodedDataJson
-            timeCreated
-            revoked
-          }
-        }
-        """
-        
-        variables = {"schemaId": schema_info["uid"]}
-        result = query_graphql(query, variables)
+        if error is not None:
+            print(f"Error querying attestations: {error}")
+            continue
         
         if 'data' in result and 'attestations' in result['data']:
             attestations = result['data']['attestations']
             print(f"Found {len(attestations)} attestations\n")
+            decoder = compile_schema(schema_info["fields"])
             
             if attestations:
                 # Analyze first few attestations for parameters
@@ -76,15 +74,12 @@ def analyze_yaps_attestations():
                     print(f"Recipient: {att['recipient']}")
                     
                     # Decode and analyze the data
-                    if att['decodedDataJson']:
+                    if att['data']:
                         try:
-                            decoded = json.loads(att['decodedDataJson'])
+                            decoded = decoder.decode_typed(att['data'])
                             print("Decoded Parameters:")
                             
-                            for field in decoded:
-                                field_name = field['name']
-                                field_value = field['value']['value'] if 'value' in field['value'] else field['value']
-                                field_type = field['type']
+                            for field_name, field_type, field_value in decoded:
                                 print(f"  {field_name} ({field_type}): {field_value}")
                                 
                                 # Extract specific YAPS parameters
@@ -93,9 +88,9 @@ def analyze_yaps_attestations():
                                 elif 'twitter' in field_name.lower():
                                     print(f"    -> TWITTER ID: {field_value}")
                                     
-                        except json.JSONDecodeError as e:
-                            print(f"  Error decoding JSON: {e}")
-                            print(f"  Raw decodedDataJson: {att['decodedDataJson']}")
+                        except ABIDecodeError as e:
+                            print(f"  Error decoding data: {e}")
+                            print(f"  Raw data: {att['data']}")
                     
                     print()
                     
@@ -108,15 +103,9 @@ def analyze_yaps_attestations():
                     print("Fields: yapScaledPoints + yap24HScaledPoints")
                     
                     try:
-                        sample = json.loads(attestations[0]['decodedDataJson'])
-                        yap_scaled = None
-                        yap_24h = None
-                        
-                        for field in sample:
-                            if 'yapScaledPoints' in field['name']:
-                                yap_scaled = field['value']['value'] if 'value' in field['value'] else field['value']
-                            elif 'yap24HScaledPoints' in field['name']:
-                                yap_24h = field['value']['value'] if 'value' in field['value'] else field['value']
+                        sample = decoder.decode(attestations[0]['data'])
+                        yap_scaled = sample.get('yapScaledPoints')
+                        yap_24h = sample.get('yap24HScaledPoints')
                         
                         if yap_scaled and yap_24h:
                             ratio = float(yap_scaled) / float(yap_24h) if float(yap_24h) > 0 else 0
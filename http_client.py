@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Shared pooled HTTP client untuk app.py dan semua EAS scripts
+
+Satu requests.Session per proses: keep-alive + connection pooling (TCP/TLS reuse),
+connect/read timeouts, bounded retries dengan jittered backoff, dan gzip negotiation.
+Semua EAS GraphQL request lewat satu AdaptiveLimiter (token bucket + AIMD
+concurrency), jadi script / thread yang jalan paralel berbagi budget yang sama.
+"""
+
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import AdaptiveLimiter
+from singleflight import upstream_flight, request_key
+
+# Override untuk stand-in lokal (python -m benchmarks.eas_server)
+EAS_GRAPHQL_URL = os.getenv('EAS_GRAPHQL_URL', "https://base.easscan.org/graphql")
+
+# (connect, read) timeout dalam detik
+DEFAULT_TIMEOUT = (3.05, 20)
+DEFAULT_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+# Budget ke easscan: max request/detik (token bucket) dan max request in-flight;
+# keduanya turun otomatis saat di-throttle dan naik lagi saat sukses
+EAS_RATE_LIMIT = float(os.getenv('EAS_RATE_LIMIT', '10'))
+EAS_RATE_BURST = float(os.getenv('EAS_RATE_BURST', str(EAS_RATE_LIMIT)))
+EAS_MAX_CONCURRENCY = int(os.getenv('EAS_MAX_CONCURRENCY', '8'))
+
+graphql_limiter = AdaptiveLimiter(EAS_RATE_LIMIT, burst=EAS_RATE_BURST, max_concurrency=EAS_MAX_CONCURRENCY)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Lazily create shared requests.Session dengan connection pool"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retry di-handle sendiri (dengan jitter), adapter hanya untuk pooling
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive",
+                    "User-Agent": "yaps-tools/0.1",
+                })
+                _session = session
+    return _session
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff untuk attempt ke-n (mulai dari 0)"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def retry_after_seconds(response):
+    """Header Retry-After (detik) dari response, atau None"""
+    value = response.headers.get('Retry-After') if response.headers else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        # Format HTTP-date jarang dipakai; fallback ke backoff biasa
+        return None
+
+
+def request(method, url, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT, limiter=None, **kwargs):
+    """HTTP request via shared session dengan bounded retries.
+    Retry pada connection error/timeout dan status 429/5xx; response terakhir
+    dikembalikan apa adanya jika retries habis. Dengan `limiter`, setiap attempt
+    menunggu token + slot concurrency dan melaporkan hasilnya (AIMD)."""
+    session = get_session()
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        retry_after = None
+        try:
+            response = session.request(method, url, timeout=timeout, **kwargs)
+        except RETRY_EXCEPTIONS:
+            if limiter is not None:
+                limiter.release(throttled=True)
+            if attempt >= retries:
+                raise
+        except BaseException:
+            if limiter is not None:
+                limiter.cancel()
+            raise
+        else:
+            throttled = response.status_code in RETRY_STATUSES
+            if throttled:
+                retry_after = retry_after_seconds(response)
+            if limiter is not None:
+                limiter.release(throttled=throttled, retry_after=retry_after)
+            if not throttled or attempt >= retries:
+                return response
+            response.close()
+        time.sleep(max(backoff_delay(attempt), retry_after or 0))
+        attempt += 1
+
+
+def get(url, **kwargs):
+    """GET via shared session"""
+    return request("GET", url, **kwargs)
+
+
+def post_json(url, payload, **kwargs):
+    """POST JSON payload via shared session"""
+    return request("POST", url, json=payload, **kwargs)
+
+
+def query_graphql(query, variables=None, url=EAS_GRAPHQL_URL):
+    """Execute GraphQL query (identical in-flight queries di-coalesce)"""
+    return upstream_flight.do(request_key(url, query, variables), _post_graphql, query, variables, url)
+
+
+def _post_graphql(query, variables, url):
+    payload = {"query": query, "variables": variables or {}}
+    response = post_json(url, payload, headers={"Content-Type": "application/json"}, limiter=graphql_limiter)
+    if response.status_code in RETRY_STATUSES:
+        # Masih di-throttle / error setelah retries habis
+        response.raise_for_status()
+    try:
+        return response.json()
+    except ValueError:
+        # Body bukan JSON (mis. halaman error proxy); GraphQL error 4xx tetap JSON
+        response.raise_for_status()
+        raise
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Incrementally maintained YAPS leaderboard
+
+Hanya attestation terbaru per twitterUserId yang dihitung; attestation baru
+menggantikan entry lama user itu, dan revocation entry terbaru jatuh balik ke
+attestation non-revoked sebelumnya. Entry disimpan di _RankedList (bucketed
+sorted list + Fenwick tree atas ukuran bucket), jadi top-N, rank dan
+percentile dijawab dalam O(log n) tanpa sort ulang seluruh schema.
+
+Usage:
+    python leaderboard.py --schema 517 --top 20
+    python leaderboard.py --schema 517 --user 1422186185196113922
+"""
+
+import argparse
+import bisect
+import sys
+
+import eas
+from score_timeseries import snapshot
+
+BUCKET_LOAD = 512
+
+
+class _RankedList:
+    """Sorted list dengan count_less() / posisi O(log n).
+
+    Key disimpan di bucket terurut (masing-masing <= 2 * BUCKET_LOAD); Fenwick
+    tree atas panjang bucket memberi jumlah key sebelum bucket tertentu.
+    """
+
+    def __init__(self):
+        self._buckets = []
+        self._maxes = []
+        self._tree = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for bucket in self._buckets:
+            yield from bucket
+
+    def _rebuild_tree(self):
+        tree = [len(bucket) for bucket in self._buckets]
+        for i in range(len(tree)):
+            parent = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, position, delta):
+        tree = self._tree
+        while position < len(tree):
+            tree[position] += delta
+            position |= position + 1
+
+    def _tree_prefix(self, end):
+        """Jumlah key di bucket[0:end]"""
+        total = 0
+        end -= 1
+        while end >= 0:
+            total += self._tree[end]
+            end = (end & (end + 1)) - 1
+        return total
+
+    def add(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._rebuild_tree()
+            self._len = 1
+            return
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            position -= 1
+        bucket = self._buckets[position]
+        bisect.insort(bucket, key)
+        self._maxes[position] = bucket[-1]
+        self._len += 1
+        if len(bucket) > 2 * BUCKET_LOAD:
+            # Split; rebuild Fenwick O(jumlah bucket), amortized jarang
+            self._buckets[position:position + 1] = [bucket[:BUCKET_LOAD], bucket[BUCKET_LOAD:]]
+            self._maxes[position:position + 1] = [bucket[BUCKET_LOAD - 1], bucket[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(position, 1)
+
+    def remove(self, key):
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            raise KeyError(key)
+        bucket = self._buckets[position]
+        index = bisect.bisect_left(bucket, key)
+        if index == len(bucket) or bucket[index] != key:
+            raise KeyError(key)
+        del bucket[index]
+        self._len -= 1
+        if bucket:
+            self._maxes[position] = bucket[-1]
+            self._tree_add(position, -1)
+        else:
+            del self._buckets[position]
+            del self._maxes[position]
+            self._rebuild_tree()
+
+    def count_less(self, key):
+        """Jumlah key < key"""
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            return self._len
+        return self._tree_prefix(position) + bisect.bisect_left(self._buckets[position], key)
+
+    def head(self, n):
+        """n key terkecil"""
+        if n <= 0:
+            # bucket[:negatif] akan slice dari belakang
+            return []
+        result = []
+        for bucket in self._buckets:
+            result.extend(bucket[:n - len(result)])
+            if len(result) >= n:
+                break
+        return result
+
+
+class Leaderboard:
+    """Leaderboard satu schema: latest attestation per user, urut points desc"""
+
+    def __init__(self, schema_uid=None, points_field=None, resolve_previous=None):
+        self.schema_uid = schema_uid
+        self.points_field = points_field
+        # resolve_previous(user_id, exclude_id) -> attestation non-revoked terbaru lain, atau None
+        self.resolve_previous = resolve_previous
+        self.entries = {}
+        self._by_attestation = {}
+        self._ranked = _RankedList()
+        self.high_water = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _key(entry):
+        # Points desc, tie-break user id supaya urutan deterministik
+        return (-entry['points'], entry['twitter_user_id'])
+
+    def _remove(self, user_id):
+        entry = self.entries.pop(user_id)
+        self._by_attestation.pop(entry['id'], None)
+        self._ranked.remove(self._key(entry))
+        return entry
+
+    def apply(self, att):
+        """Proses satu attestation (dict dengan 'fields'); return True jika leaderboard berubah"""
+        if att.get('timeCreated'):
+            self.high_water = max(self.high_water, int(att['timeCreated']))
+        if att.get('revoked'):
+            return self.revoke(att['id'])
+        point = snapshot(att, self.points_field)
+        if point is None:
+            return False
+        user_id, timestamp, points = point
+        current = self.entries.get(user_id)
+        if current is not None:
+            if (timestamp, att['id']) <= (current['timestamp'], current['id']):
+                return False
+            self._remove(user_id)
+
+        entry = {
+            'id': att['id'],
+            'twitter_user_id': user_id,
+            'twitter_username': (att.get('fields') or {}).get('twitterUsername'),
+            'points': points,
+            'timestamp': timestamp,
+        }
+        self.entries[user_id] = entry
+        self._by_attestation[att['id']] = user_id
+        self._ranked.add(self._key(entry))
+        return True
+
+    def revoke(self, attestation_id):
+        """Revocation: jika itu entry terbaru user, jatuh balik ke attestation sebelumnya"""
+        user_id = self._by_attestation.get(attestation_id)
+        if user_id is None:
+            return False
+        self._remove(user_id)
+        if self.resolve_previous is not None:
+            previous = self.resolve_previous(user_id, attestation_id)
+            if previous is not None:
+                self.apply(previous)
+        return True
+
+    @classmethod
+    def build(cls, schema_uid, points_field=None, store=None):
+        """Leaderboard dari local store (oldest first)"""
+        from attestation_store import get_store
+        store = store or get_store()
+        board = cls(schema_uid, points_field, resolve_previous=_store_resolver(store, schema_uid))
+        for att in store.iter_attestations(schema_uid, newest_first=False):
+            board.apply(att)
+        return board
+
+    def sync(self, store=None):
+        """Incremental: sync store, lalu apply attestations baru + revocations baru"""
+        from attestation_store import get_store
+        store = store or get_store()
+        result = store.sync(self.schema_uid)
+        for att in store.iter_attestations(self.schema_uid, newest_first=False, since=self.high_water):
+            self.apply(att)
+        for attestation_id in result['revoked_ids']:
+            self.revoke(attestation_id)
+        return result
+
+    # --- queries ---
+
+    def top(self, n=10):
+        """n entry teratas, masing-masing dengan 'rank'"""
+        result = []
+        for _, user_id in self._ranked.head(n):
+            entry = self.entries[user_id]
+            result.append(dict(entry, rank=self.rank(user_id)))
+        return result
+
+    def rank(self, twitter_user_id):
+        """Rank 1-based (points sama = rank sama), atau None"""
+        entry = self.entries.get(str(twitter_user_id))
+        if entry is None:
+            return None
+        # Semua key dengan points lebih besar ada sebelum (-points, '')
+        return self._ranked.count_less((-entry['points'], '')) + 1
+
+    def percentile(self, twitter_user_id):
+        """Persentase user dengan points lebih rendah (0-100), atau None"""
+        entry = self.entries.get(str(twitter_user_id))
+        if entry is None:
+            return None
+        lower = len(self._ranked) - self._ranked.count_less((-entry['points'] + 1, ''))
+        return 100.0 * lower / len(self._ranked)
+
+
+def _store_resolver(store, schema_uid):
+    def resolve_previous(user_id, exclude_id):
+        for att in store.user_attestations(schema_uid, user_id):
+            if att['id'] != exclude_id and not att['revoked']:
+                return att
+        return None
+    return resolve_previous
+
+
+def print_leaderboard(board, top=20, users=()):
+    print(f"🏆 Leaderboard {board.schema_uid[:18]}... ({len(board):,} users)")
+    print("-" * 80)
+    for entry in board.top(top):
+        name = f"@{entry['twitter_username']}" if entry['twitter_username'] else entry['twitter_user_id']
+        print(f"{entry['rank']:>5}. {name:<30} {entry['points']:>16,}")
+    for user_id in users:
+        rank = board.rank(user_id)
+        if rank is None:
+            print(f"\n❌ {user_id} tidak ada di leaderboard")
+        else:
+            print(f"\n👤 {user_id}: rank #{rank:,} dari {len(board):,}, "
+                  f"lebih tinggi dari {board.percentile(user_id):.2f}% user")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="YAPS leaderboard dari local attestation store")
+    parser.add_argument('--schema', default='517', help="Schema UID atau nomor (default 517)")
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--user', action='append', help="Tampilkan rank & percentile twitterUserId ini")
+    parser.add_argument('--sync', action='store_true', help="Incremental sync dulu")
+    args = parser.parse_args(argv)
+
+    schema_uid = eas.resolve_schema(args.schema)
+    board = Leaderboard.build(schema_uid)
+    if args.sync or not len(board):
+        # Schema belum pernah di-sync: sync pertama mengambil seluruh history
+        board.sync()
+    print_leaderboard(board, args.top, args.user or [])
+    return 0
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Live tail attestation YAPS baru dari base.easscan.org
+
+Satu poller thread (per proses) mem-poll semua schema dengan interval adaptif:
+hanya attestations dengan timeCreated >= high-water terakhir yang di-request,
+interval mengecil saat ada data baru dan membesar saat idle / error. Setiap
+attestation di-decode jadi delta points per user dan di-fan-out ke semua
+subscriber (queue per subscriber), jadi banyak browser cukup satu upstream poller.
+Points sebelumnya untuk user yang belum pernah terlihat di-seed dari
+attestation_store (local store atau per-user lookup), jadi delta sudah tersedia
+sejak event pertama setelah start.
+"""
+
+import collections
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import eas
+from score_timeseries import snapshot
+
+MIN_INTERVAL = float(os.getenv('LIVE_TAIL_MIN_INTERVAL', '5'))
+MAX_INTERVAL = float(os.getenv('LIVE_TAIL_MAX_INTERVAL', '60'))
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Points terakhir per user untuk menghitung delta (LRU, memory terbatas)
+LAST_POINTS_SIZE = 100000
+TAIL_FIELDS = ("id", "data", "timeCreated", "revoked")
+# Seed previous points: maksimal lookup easscan per poll (sisanya delta None) dan paralelisme
+SEED_LOOKUPS_PER_POLL = 50
+SEED_WORKERS = 4
+SEED_PAGE_SIZE = 5
+# Schema tanpa attestation saat start: mulai dari now - window ini, bukan dari awal history
+START_WINDOW = 300
+
+
+def _previous_points(schema_uid, user_id, att, store=None):
+    """Points attestation valid terakhir user sebelum `att`, atau None.
+    `store`: local attestation store (schema sudah di-sync), selain itu lookup ke easscan"""
+    position = (int(att['timeCreated']), att['id'])
+    try:
+        if store is not None:
+            candidates = store.user_attestations(schema_uid, user_id)
+        else:
+            candidates = eas.iter_user_attestations(schema_uid, user_id, page_size=SEED_PAGE_SIZE)
+        for previous in candidates:
+            if previous.get('revoked') or (int(previous['timeCreated']), previous['id']) >= position:
+                continue
+            point = snapshot(previous)
+            return point[2] if point else None
+    except Exception:
+        # Seed hanya best-effort; delta None lebih baik daripada event hilang
+        return None
+    return None
+
+
+class AttestationTail:
+    """Shared poller + fan-out ke subscriber queues"""
+
+    def __init__(self, schema_uids, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+        self.schema_uids = list(schema_uids)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._thread = None
+        # schema_uid -> (high-water timeCreated, ids dengan timeCreated == high-water)
+        self._high_water = {}
+        self._last_points = collections.OrderedDict()
+
+        self.polls = 0
+        self.events = 0
+        self.errors = 0
+        self.dropped = 0
+        self.last_poll_at = None
+
+    # --- subscribers ---
+
+    def subscribe(self):
+        """Queue baru yang menerima event; poller di-start jika belum jalan"""
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if self._thread is None or not self._thread.is_alive():
+                # Restart: mulai dari attestation terbaru saat ini, backlog selama
+                # tidak ada subscriber tidak di-replay; points lama mungkin sudah usang
+                self._high_water = {}
+                self._last_points.clear()
+                self._thread = threading.Thread(target=self._run, name="live-tail", daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def _publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # Client lambat: buang event tertua, jangan blok poller
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    pass
+                self.dropped += 1
+                subscriber.put_nowait(event)
+        self.events += 1
+
+    # --- polling ---
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    # Tidak ada subscriber: poller berhenti, di-start lagi oleh subscribe()
+                    self._thread = None
+                    return
+            try:
+                found = self.poll()
+            except Exception:
+                self.errors += 1
+                self.interval = self.max_interval
+            else:
+                if found:
+                    self.interval = max(self.min_interval, self.interval / 2)
+                else:
+                    self.interval = min(self.max_interval, self.interval * 1.5)
+            time.sleep(self.interval)
+
+    def _init_high_water(self, schema_uid):
+        # Mulai dari attestation terbaru saat ini; history tidak di-replay
+        latest = next(eas.iter_attestations(schema_uid, fields=("id", "timeCreated"), limit=1, decode=False), None)
+        if latest is None:
+            return int(time.time()) - START_WINDOW, set()
+        return int(latest['timeCreated']), {latest['id']}
+
+    def _poll_schema(self, schema_uid):
+        state = self._high_water.get(schema_uid)
+        if state is None:
+            state = self._high_water[schema_uid] = self._init_high_water(schema_uid)
+            return []
+        high_water, seen = state
+        # >= supaya attestation dengan detik yang sama tidak terlewat; dedupe via `seen`
+        where = {"timeCreated": {"gte": high_water}}
+        new = [att for att in eas.iter_attestations(schema_uid, fields=TAIL_FIELDS, where=where, newest_first=False)
+               if att['id'] not in seen]
+        if new:
+            newest = max(int(att['timeCreated']) for att in new)
+            seen = {att['id'] for att in new if int(att['timeCreated']) == newest} | (seen if newest == high_water else set())
+            self._high_water[schema_uid] = (newest, seen)
+        return new
+
+    def poll(self):
+        """Satu putaran poll semua schema (paralel); return jumlah attestation baru"""
+        found = 0
+        first_error = None
+        results = eas.fetch_schemas(self.schema_uids, self._poll_schema)
+        self._seed_previous_points([(schema_uid, new) for schema_uid, new, error in results if error is None])
+        for schema_uid, new, error in results:
+            if error is not None:
+                first_error = first_error or error
+                continue
+            for att in new:
+                self._publish(self._event(schema_uid, att))
+            found += len(new)
+        self.polls += 1
+        self.last_poll_at = time.time()
+        if first_error is not None:
+            # Schema lain tetap di-publish; error membuat interval backoff
+            raise first_error
+        return found
+
+    def _seed_previous_points(self, batches):
+        """Isi _last_points untuk user yang belum dikenal (attestation baru pertamanya per poll).
+        Schema yang sudah di-sync ke local store di-seed semua; selain itu lookup ke
+        easscan dibatasi SEED_LOOKUPS_PER_POLL supaya poll tidak tertahan rate limit."""
+        try:
+            from attestation_store import get_store
+            store = get_store()
+            local_schemas = {schema_uid for schema_uid, _ in batches if store.is_synced(schema_uid)}
+        except Exception:
+            # Store tidak bisa dibuka (mis. filesystem read-only): seed via easscan saja
+            store, local_schemas = None, set()
+        pending = {}
+        network_lookups = 0
+        for schema_uid, new in batches:
+            local = schema_uid in local_schemas
+            for att in new:
+                point = snapshot(att)
+                if point is None:
+                    continue
+                key = (schema_uid, point[0])
+                if key in self._last_points or key in pending:
+                    continue
+                if not local:
+                    if network_lookups >= SEED_LOOKUPS_PER_POLL:
+                        continue
+                    network_lookups += 1
+                pending[key] = att
+        if not pending:
+            return
+
+        def lookup(item):
+            (schema_uid, user_id), att = item
+            local_store = store if schema_uid in local_schemas else None
+            return (schema_uid, user_id), _previous_points(schema_uid, user_id, att, local_store)
+
+        with ThreadPoolExecutor(max_workers=min(SEED_WORKERS, len(pending))) as executor:
+            for key, points in executor.map(lookup, pending.items()):
+                if points is not None and key not in self._last_points:
+                    self._last_points[key] = points
+        while len(self._last_points) > LAST_POINTS_SIZE:
+            self._last_points.popitem(last=False)
+
+    def _event(self, schema_uid, att):
+        event = {
+            'schema_uid': schema_uid,
+            'id': att['id'],
+            'time_created': int(att['timeCreated']),
+            'revoked': bool(att.get('revoked')),
+            'fields': eas.json_safe_fields(att['fields']),
+        }
+        point = snapshot(att)
+        if point is not None:
+            user_id, _, points = point
+            key = (schema_uid, user_id)
+            previous = self._last_points.pop(key, None)
+            self._last_points[key] = points
+            if len(self._last_points) > LAST_POINTS_SIZE:
+                self._last_points.popitem(last=False)
+            event.update(
+                twitter_user_id=user_id,
+                points=points,
+                previous_points=previous,
+                delta=points - previous if previous is not None else None,
+            )
+        return event
+
+    def stats(self):
+        with self._lock:
+            subscribers = len(self._subscribers)
+            running = self._thread is not None and self._thread.is_alive()
+        return {
+            'schemas': self.schema_uids,
+            'subscribers': subscribers,
+            'running': running,
+            'interval': round(self.interval, 2),
+            'polls': self.polls,
+            'events': self.events,
+            'errors': self.errors,
+            'dropped': self.dropped,
+            'last_poll_at': self.last_poll_at,
+        }
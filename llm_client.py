@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Process-wide OpenAI client dengan connection pooling + per-call latency tracking
+
+Client dibuat sekali (lazy, thread-safe) dan hanya di-rebuild jika API key berubah,
+jadi koneksi HTTP/TLS ke OpenAI di-reuse antar request. Setiap call mencatat
+waktu connection setup (TCP + TLS) vs waktu model (sampai response headers),
+plus metrics latency / error / token usage untuk /metrics.
+"""
+
+import collections
+import hashlib
+import threading
+import time
+
+import httpx
+from openai import OpenAI, DefaultHttpxClient
+
+import metrics
+
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60.0
+# connect cepat gagal, read cukup panjang untuk completion 500 tokens
+TIMEOUT = httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
+MAX_RETRIES = 2
+LATENCY_SAMPLES = 500
+
+# (key_hash, client) dalam satu tuple supaya fast path tanpa lock selalu konsisten
+_client_entry = None
+_client_lock = threading.Lock()
+
+_latencies = collections.deque(maxlen=LATENCY_SAMPLES)
+_latencies_lock = threading.Lock()
+_current = threading.local()
+
+OPENAI_TOKENS = metrics.counter(
+    'yaps_openai_tokens_total', 'Token OpenAI dari response.usage', ('operation', 'type')
+)
+OPENAI_CANCELLED = metrics.counter(
+    'yaps_openai_cancelled_total', 'Streaming call yang dihentikan karena client disconnect', ('operation',)
+)
+
+
+def _key_hash(api_key):
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _trace(event_name, info):
+    """httpcore trace callback: catat timestamp event ke call yang sedang aktif"""
+    timing = getattr(_current, 'timing', None)
+    if timing is not None:
+        timing['events'].append((event_name, time.perf_counter()))
+
+
+def _attach_trace(request):
+    if getattr(_current, 'timing', None) is not None:
+        request.extensions['trace'] = _trace
+
+
+def get_openai_client(api_key):
+    """Return shared OpenAI client; rebuild hanya jika API key berubah"""
+    global _client_entry
+    key_hash = _key_hash(api_key)
+    entry = _client_entry
+    if entry is not None and entry[0] == key_hash:
+        return entry[1]
+
+    with _client_lock:
+        entry = _client_entry
+        if entry is None or entry[0] != key_hash:
+            http_client = DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY
+                ),
+                timeout=TIMEOUT,
+                event_hooks={'request': [_attach_trace]}
+            )
+            client = OpenAI(api_key=api_key, http_client=http_client, timeout=TIMEOUT, max_retries=MAX_RETRIES)
+            # Client lama tidak di-close: mungkin masih dipakai call yang in-flight
+            entry = _client_entry = (key_hash, client)
+        return entry[1]
+
+
+def _phase_ms(events, name):
+    """Total durasi (ms) untuk pasangan <name>.started / <name>.complete"""
+    total = 0.0
+    started = None
+    for event_name, ts in events:
+        if event_name.endswith(f"{name}.started"):
+            started = ts
+        elif event_name.endswith(f"{name}.complete") and started is not None:
+            total += ts - started
+            started = None
+    return total * 1000
+
+
+class timed_call:
+    """Context manager untuk mencatat latency satu OpenAI call.
+
+    with timed_call('generate') as timing:
+        response = client.chat.completions.create(...)
+        timing['first_token'] = ...  # optional, untuk streaming
+        timing['usage'] = response.usage  # optional, token usage untuk metrics
+        timing['stream'] = stream  # optional, di-close saat keluar (juga saat GeneratorExit)
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.timing = {'label': label, 'events': []}
+
+    def __enter__(self):
+        self.timing['start'] = time.perf_counter()
+        _current.timing = self.timing
+        return self.timing
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.timing = None
+        end = time.perf_counter()
+        stream = self.timing.pop('stream', None)
+        try:
+            if stream is not None:
+                # Lepas koneksi ke pool, termasuk saat client disconnect di tengah streaming
+                stream.close()
+        finally:
+            self._record(exc_type, end)
+        return False
+
+    def _record(self, exc_type, end):
+        timing = self.timing
+        events = timing.pop('events')
+        start = timing.pop('start')
+
+        connect_ms = _phase_ms(events, 'connect_tcp') + _phase_ms(events, 'start_tls')
+        sent = next((ts for name, ts in events if name.endswith('send_request_headers.started')), None)
+        headers = next((ts for name, ts in events if name.endswith('receive_response_headers.complete')), None)
+        first_token = timing.pop('first_token', None)
+        record_usage(self.label, timing.pop('usage', None))
+
+        metrics.UPSTREAM_LATENCY.observe(end - start, upstream='openai', operation=self.label)
+        # GeneratorExit = client disconnect di tengah streaming, bukan error dari OpenAI
+        cancelled = exc_type is not None and issubclass(exc_type, GeneratorExit)
+        if cancelled:
+            OPENAI_CANCELLED.inc(operation=self.label)
+        elif exc_type is not None:
+            metrics.UPSTREAM_ERRORS.inc(upstream='openai', operation=self.label, reason=exc_type.__name__)
+
+        sample = {
+            'label': self.label,
+            'ok': exc_type is None,
+            'cancelled': cancelled,
+            'new_connection': connect_ms > 0,
+            'connect_ms': round(connect_ms, 2),
+            'model_ms': round((headers - sent) * 1000, 2) if sent and headers else None,
+            'first_token_ms': round((first_token - start) * 1000, 2) if first_token else None,
+            'total_ms': round((end - start) * 1000, 2),
+            'at': time.time(),
+        }
+        timing.update(sample)
+        with _latencies_lock:
+            _latencies.append(sample)
+
+
+def record_usage(label, usage):
+    """Tambah token count dari response.usage (prompt / completion) ke metrics"""
+    if usage is None:
+        return
+    for token_type in ('prompt', 'completion'):
+        tokens = getattr(usage, f'{token_type}_tokens', None)
+        if tokens:
+            OPENAI_TOKENS.inc(tokens, operation=label, type=token_type)
+
+
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def get_latency_stats():
+    """Ringkasan latency OpenAI calls terakhir: connection setup vs model time"""
+    with _latencies_lock:
+        samples = list(_latencies)
+
+    stats = {'calls': len(samples), 'new_connections': sum(1 for s in samples if s['new_connection'])}
+    for field in ('connect_ms', 'model_ms', 'first_token_ms', 'total_ms'):
+        values = sorted(s[field] for s in samples if s[field] is not None)
+        stats[field] = {
+            'avg': round(sum(values) / len(values), 2) if values else None,
+            'p50': _percentile(values, 50),
+            'p95': _percentile(values, 95),
+        }
+    stats['recent'] = samples[-10:]
+    return stats
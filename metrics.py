@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Metrics process-wide dalam Prometheus text exposition format (tanpa dependency)
+
+Counter dan Histogram di-update langsung di hot path (satu lock per metric);
+metric yang sudah punya counter sendiri (cache stats, pool, rate limiter)
+di-expose lewat callback yang dibaca saat /metrics di-scrape, jadi tidak ada
+double bookkeeping.
+"""
+
+import bisect
+import math
+import threading
+import time
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+# Detik; cukup lebar untuk route lokal (ms) sampai OpenAI completion (puluhan detik)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 'NaN'
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key, extra=()):
+        return list(zip(self.labelnames, key)) + list(extra)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.type_name}']
+        lines.extend(self._render_samples())
+        return lines
+
+
+class Counter(_Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self._labels(key))} {_format_value(value)}' for key, value in items]
+
+
+class Histogram(_Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        # Bucket pertama dengan bound >= value (le); index terakhir = +Inf
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][position] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels):
+        """Context manager: observe durasi block"""
+        return _Timer(self, labels)
+
+    def _render_samples(self):
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self._labels(key, [('le', _format_value(float(bound)))]))
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self._labels(key))
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class CallbackMetric(_Metric):
+    """Gauge / counter yang nilainya dibaca dari fn() saat scrape.
+    fn return iterable (labels dict, value); value None di-skip."""
+
+    def __init__(self, name, help_text, fn, type_name='gauge'):
+        super().__init__(name, help_text)
+        self.fn = fn
+        self.type_name = type_name
+
+    def _render_samples(self):
+        lines = []
+        for labels, value in self.fn():
+            if value is None:
+                continue
+            lines.append(f'{self.name}{_format_labels(sorted(labels.items()))} {_format_value(value)}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} sudah terdaftar")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                # Callback yang error tidak boleh menggagalkan seluruh scrape
+                continue
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+def counter(name, help_text, labelnames=()):
+    return REGISTRY.register(Counter(name, help_text, labelnames))
+
+
+def histogram(name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+    return REGISTRY.register(Histogram(name, help_text, labelnames, buckets))
+
+
+def callback(name, help_text, fn, type_name='gauge'):
+    return REGISTRY.register(CallbackMetric(name, help_text, fn, type_name))
+
+
+# Upstream calls (Kaito scrape, OpenAI) dipakai bersama oleh app.py dan llm_client.py
+UPSTREAM_LATENCY = histogram(
+    'yaps_upstream_request_duration_seconds', 'Latency call ke upstream', ('upstream', 'operation')
+)
+UPSTREAM_ERRORS = counter(
+    'yaps_upstream_errors_total', 'Call upstream yang gagal', ('upstream', 'operation', 'reason')
+)
+
+
+def render():
+    return REGISTRY.render()
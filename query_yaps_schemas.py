@@ -3,62 +3,28 @@
 Query YAPS schemas #525 and #546 from EAS GraphQL API
 """
 
-import requests
 import json
-
-# Base network GraphQL endpoint
-GRAPHQL_URL = "https://base.easscan.org/graphql"
-
-def query_graphql(query, variables=None):
-    """Execute GraphQL query"""
-    payload = {
-        "query": query,
-        "variables": variables or {}
-    }
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    response = requests.post(GRAPHQL_URL, json=payload, headers=headers)
-    return response.json()
+from abi_decoder import ABIDecodeError
+from eas import EASQueryError, fetch_schemas, get_decoder
+from http_client import EAS_GRAPHQL_URL, query_graphql
+from schema_registry import get_registry, print_schema
 
 def find_schemas_by_range():
-    """Find schemas by looking at all schemas and filtering by creation order"""
-    query = """
-    query GetAllSchemas {
-      schemata(orderBy: [{ id: asc }], take: 1000) {
-        id
-        schema
-        creator
-        txid
-        time
-        index
-      }
-    }
-    """
+    """Find schemas #525 and #546 by EAS index via the local schema registry"""
+    registry = get_registry()
+    registry.ensure_fresh()
+    print(f"Registry has {registry.count()} schemas")
     
-    result = query_graphql(query)
-    if 'data' in result and 'schemata' in result['data']:
-        schemas = result['data']['schemata']
-        print(f"Found {len(schemas)} schemas")
-        
-        # Look for schemas around position 525 and 546
-        target_positions = [525, 546]
-        for target in target_positions:
-            if target < len(schemas):
-                schema = schemas[target-1]  # Array is 0-indexed
-                print(f"\n=== Schema #{target} ===")
-                print(f"UID: {schema['id']}")
-                print(f"Schema: {schema['schema']}")
-                print(f"Creator: {schema['creator']}")
-                print(f"Time: {schema['time']}")
-                print(f"TxID: {schema['txid']}")
-    else:
-        print("Error querying schemas:", result)
+    target_positions = [525, 546]
+    for target in target_positions:
+        schema = registry.by_index(target)
+        if schema:
+            print_schema(schema, details=True)
+        else:
+            print(f"\n=== Schema #{target} not found ===")
 
-def query_attestations_by_schema_uid(schema_uid):
-    """Get attestations for a specific schema UID"""
+def fetch_attestations_by_schema_uid(schema_uid):
+    """Fetch recent attestations for a specific schema UID (raw GraphQL result)"""
     query = """
     query GetAttestationsBySchema($schemaId: String!) {
       attestations(
@@ -70,7 +36,6 @@ def query_attestations_by_schema_uid(schema_uid):
         attester  
         recipient
         data
-        decodedDataJson
         timeCreated
         revoked
       }
@@ -78,8 +43,10 @@ def query_attestations_by_schema_uid(schema_uid):
     """
     
     variables = {"schemaId": schema_uid}
-    result = query_graphql(query, variables)
-    
+    return query_graphql(query, variables)
+
+def print_attestations(schema_uid, result):
+    """Print the first attestations of a fetch_attestations_by_schema_uid() result"""
     if 'data' in result and 'attestations' in result['data']:
         attestations = result['data']['attestations']
         print(f"\n=== Found {len(attestations)} attestations for schema {schema_uid} ===")
@@ -92,50 +59,34 @@ def query_attestations_by_schema_uid(schema_uid):
             print(f"  Time: {attestation['timeCreated']}")
             print(f"  Revoked: {attestation['revoked']}")
             
-            if attestation['decodedDataJson']:
+            if attestation['data']:
                 try:
-                    decoded = json.loads(attestation['decodedDataJson'])
+                    decoded = get_decoder(schema_uid).decode(attestation['data'])
                     print(f"  Decoded Data: {json.dumps(decoded, indent=4)}")
-                except json.JSONDecodeError:
-                    print(f"  Decoded Data: {attestation['decodedDataJson']}")
+                except (ABIDecodeError, EASQueryError):
+                    print(f"  Raw Data: {attestation['data']}")
     else:
         print(f"Error querying attestations for {schema_uid}:", result)
 
+def query_attestations_by_schema_uid(schema_uid):
+    """Get attestations for a specific schema UID"""
+    print_attestations(schema_uid, fetch_attestations_by_schema_uid(schema_uid))
+
 def search_yaps_related():
-    """Search for YAPS-related schemas by looking at schema descriptions"""
-    query = """
-    query SearchSchemas {
-      schemata(take: 800) {
-        id
-        schema
-        creator
-        index
-      }
-    }
-    """
+    """Search for YAPS-related schemas through the registry's field-name index"""
+    registry = get_registry()
+    registry.ensure_fresh()
     
-    result = query_graphql(query)
-    if 'data' in result and 'schemata' in result['data']:
-        schemas = result['data']['schemata']
-        
-        # Look for potential YAPS schemas by checking schema content
-        yaps_candidates = []
-        for i, schema in enumerate(schemas):
-            schema_text = schema['schema'].lower()
-            # Look for score, yaps, lifetime, monthly keywords
-            if any(keyword in schema_text for keyword in ['score', 'yaps', 'lifetime', 'monthly', 'point', 'rating']):
-                yaps_candidates.append((i+1, schema))
-                
-        print(f"\n=== Found {len(yaps_candidates)} potential YAPS-related schemas ===")
-        for pos, schema in yaps_candidates:
-            print(f"\nSchema #{pos} (estimated)")
-            print(f"  UID: {schema['id']}")  
-            print(f"  Schema: {schema['schema']}")
-            print(f"  Creator: {schema['creator']}")
+    # Look for score, yaps, lifetime, monthly keywords in field names
+    yaps_candidates = registry.search_fields('score', 'yap', 'lifetime', 'monthly', 'point', 'rating')
+    
+    print(f"\n=== Found {len(yaps_candidates)} potential YAPS-related schemas ===")
+    for schema in yaps_candidates:
+        print_schema(schema)
 
 if __name__ == "__main__":
     print("=== Querying YAPS Schemas from EAS GraphQL ===")
-    print("Endpoint:", GRAPHQL_URL)
+    print("Endpoint:", EAS_GRAPHQL_URL)
     
     # Try multiple approaches
     print("\n1. Searching for YAPS-related schemas by content...")
@@ -152,5 +103,9 @@ if __name__ == "__main__":
     ]
     
     print("\n3. Querying YAPS attestations for algorithm analysis...")
-    for uid in yaps_schema_uids:
-        query_attestations_by_schema_uid(uid)
\ No newline at end of file
+    # Fetch all schemas concurrently, print in order
+    for uid, result, error in fetch_schemas(yaps_schema_uids, fetch_attestations_by_schema_uid):
+        if error is not None:
+            print(f"Error querying attestations for {uid}:", error)
+        else:
+            print_attestations(uid, result)
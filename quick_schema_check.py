@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
-import requests
-import json
+from abi_decoder import ABIDecodeError
+from eas import get_decoder
+from http_client import query_graphql
 
-GRAPHQL_URL = "https://base.easscan.org/graphql"
 SCHEMA_UID = "0xcb66276cf243e78fad68dd5e633f7bb56814b49ac9a91256615340591577a0e8"
 
 query = """
@@ -12,36 +12,32 @@ query GetAttestations($schemaId: String!) {
     take: 50,
     orderBy: [{ timeCreated: desc }]
   ) {
-    decodedDataJson
+    data
     timeCreated
   }
 }
 """
 
-result = requests.post(GRAPHQL_URL, json={"query": query, "variables": {"schemaId": SCHEMA_UID}}).json()
+result = query_graphql(query, {"schemaId": SCHEMA_UID})
 
 if 'data' in result and 'attestations' in result['data']:
     attestations = result['data']['attestations']
     print(f"✅ Found {len(attestations)} attestations\n")
     
     points_data = []
+    decoder = get_decoder(SCHEMA_UID)
     
     for att in attestations[:10]:
-        if att['decodedDataJson']:
+        if att['data']:
             try:
-                decoded = json.loads(att['decodedDataJson'])
-                data = {}
-                for field in decoded:
-                    name = field['name']
-                    value = field['value']['value'] if 'value' in field['value'] else field['value']
-                    data[name] = value
+                data = decoder.decode(att['data'])
                 
                 points_data.append(data)
                 print(f"🔸 {data.get('twitterUsername', 'Unknown')}")
                 print(f"   Twitter ID: {data.get('twitterUserId', 'N/A')}")
                 print(f"   YAP Points: {int(data.get('yapPoints', 0)):,}")
                 print(f"   Timestamp: {data.get('timestamp', 'N/A')}\n")
-            except:
+            except ABIDecodeError:
                 pass
     
     if points_data:
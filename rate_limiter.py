@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Adaptive client-side rate limiting untuk upstream yang men-throttle (easscan)
+
+AdaptiveLimiter menggabungkan token bucket (request per detik + burst) dengan
+concurrency limit. Keduanya diatur AIMD: setiap response sukses menaikkan
+rate dan limit sedikit (additive), setiap 429 / 5xx / timeout memotongnya
+setengah (multiplicative, maksimal sekali per cooldown window supaya satu
+burst error tidak langsung jatuh ke minimum). Retry-After dari server
+mem-pause semua caller. Hasilnya throughput bertahan dekat limit server
+tanpa error storm.
+"""
+
+import threading
+import time
+
+DECREASE_FACTOR = 0.5
+# Window di mana error berikutnya dianggap bagian dari burst yang sama
+DECREASE_COOLDOWN = 1.0
+MAX_RETRY_AFTER = 60.0
+
+
+class AdaptiveLimiter:
+    """Token bucket + AIMD concurrency limit, thread-safe"""
+
+    def __init__(self, max_rate, burst=None, max_concurrency=8, min_rate=0.5, min_concurrency=1,
+                 initial_concurrency=None):
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.rate = self.max_rate
+        self.burst = float(burst if burst is not None else max(1.0, max_rate))
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.concurrency = float(initial_concurrency or max_concurrency)
+
+        self._cond = threading.Condition()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self.in_flight = 0
+
+        self.acquired = 0
+        self.throttled = 0
+        self.decreases = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Blok sampai ada token dan slot concurrency"""
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    timeout = self._paused_until - now
+                elif self.in_flight >= int(self.concurrency):
+                    # Dibangunkan oleh release()
+                    timeout = None
+                elif self._tokens < 1:
+                    timeout = (1 - self._tokens) / self.rate
+                else:
+                    self._tokens -= 1
+                    self.in_flight += 1
+                    self.acquired += 1
+                    self.wait_seconds += now - started
+                    return
+                self._cond.wait(timeout)
+
+    def release(self, throttled=False, retry_after=None):
+        """Selesai satu request; throttled=True untuk 429 / 5xx / timeout"""
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                self.throttled += 1
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    self._last_decrease = now
+                    self.decreases += 1
+                    self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+                    self.concurrency = max(self.min_concurrency, self.concurrency * DECREASE_FACTOR)
+                    # Token yang sudah terkumpul dengan rate lama dibuang
+                    self._tokens = min(self._tokens, 1.0)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + min(retry_after, MAX_RETRY_AFTER))
+            else:
+                # Additive increase: ~+1 req/s per detik dan ~+1 slot per window sukses
+                self.rate = min(self.max_rate, self.rate + 1.0 / self.rate)
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1.0 / self.concurrency)
+            self._cond.notify_all()
+
+    def cancel(self):
+        """Lepas slot tanpa mengubah rate (request gagal karena sebab lain)"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                'rate': round(self.rate, 2),
+                'max_rate': self.max_rate,
+                'concurrency': round(self.concurrency, 2),
+                'max_concurrency': self.max_concurrency,
+                'in_flight': self.in_flight,
+                'acquired': self.acquired,
+                'throttled': self.throttled,
+                'decreases': self.decreases,
+                'wait_seconds': round(self.wait_seconds, 3),
+            }
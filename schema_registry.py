@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Persistent EAS schema registry (SQLite) dengan incremental refresh
+
+Schemata disimpan per UID dan per EAS `index` (nomor "Schema #517" di
+easscan), plus inverted index field name -> schema. Refresh hanya mengambil
+schemata dengan time >= high-water mark, jadi lookup seperti "schema #517"
+atau "schema yang punya yapScaledPoints" dijawab lokal tanpa menarik ribuan
+schemata setiap run.
+
+Usage:
+    python schema_registry.py refresh
+    python schema_registry.py index 517
+    python schema_registry.py field yapScaledPoints
+    python schema_registry.py search yap
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import eas
+from abi_decoder import ABIDecodeError, parse_schema
+from attestation_store import DEFAULT_DB_PATH
+
+# Umur maksimum registry sebelum ensure_fresh() melakukan refresh
+REGISTRY_TTL = int(os.getenv('SCHEMA_REGISTRY_TTL', '3600'))
+# Jarak minimum antar refresh yang dipicu lookup index yang belum dikenal
+# (index bisa datang dari request web, mis. /yaps/live?schema=999999)
+MISS_REFRESH_INTERVAL = int(os.getenv('SCHEMA_REGISTRY_MISS_INTERVAL', '60'))
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS schemata (
+    id TEXT PRIMARY KEY,
+    idx INTEGER,
+    schema TEXT NOT NULL,
+    creator TEXT,
+    txid TEXT,
+    time INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_schemata_index ON schemata (idx);
+CREATE TABLE IF NOT EXISTS schema_fields (
+    field_lower TEXT NOT NULL,
+    schema_id TEXT NOT NULL,
+    field_name TEXT NOT NULL,
+    field_type TEXT NOT NULL,
+    PRIMARY KEY (field_lower, schema_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS schema_registry_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    high_water INTEGER NOT NULL DEFAULT 0,
+    last_refreshed_at REAL
+);
+"""
+
+
+def _to_index(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _schema_from_row(row):
+    return {
+        'id': row['id'],
+        'index': row['idx'],
+        'schema': row['schema'],
+        'creator': row['creator'],
+        'txid': row['txid'],
+        'time': row['time'],
+    }
+
+
+class SchemaRegistry:
+    """SQLite-backed schema registry"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # Connection dipakai bersama oleh worker threads (eas.get_schema_definition
+        # dari poller / index refresh); semua akses ke self.conn lewat lock ini
+        self._lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA_SQL)
+        self._refresh_lock = threading.Lock()
+        self._last_miss_refresh = 0.0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # --- refresh ---
+
+    def state(self):
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM schema_registry_state WHERE id = 1").fetchone()
+        return dict(row) if row else None
+
+    def refresh(self, page_size=eas.DEFAULT_PAGE_SIZE):
+        """Incremental refresh: hanya schemata dengan time >= high-water"""
+        with self._refresh_lock:
+            state = self.state()
+            high_water = state['high_water'] if state else 0
+            # >= supaya schema dengan time sama yang masuk belakangan tidak terlewat
+            where = {"time": {"gte": high_water}} if high_water else None
+
+            added = 0
+            batch = []
+            for schema in eas.iter_schemata(where=where, page_size=page_size):
+                batch.append(schema)
+                if len(batch) >= page_size:
+                    added += self._commit_batch(batch)
+                    batch = []
+            added += self._commit_batch(batch)
+            return {'fetched': added, 'total': self.count()}
+
+    def ensure_fresh(self, max_age=REGISTRY_TTL):
+        """Refresh jika registry kosong atau lebih tua dari max_age detik"""
+        state = self.state()
+        if state is None or not state['last_refreshed_at'] or time.time() - state['last_refreshed_at'] > max_age:
+            self.refresh()
+
+    def _commit_batch(self, batch):
+        with self._lock, self.conn:
+            for schema in batch:
+                self._upsert(schema)
+            high_water = max((int(schema['time']) for schema in batch), default=0)
+            self.conn.execute(
+                """INSERT INTO schema_registry_state (id, high_water, last_refreshed_at) VALUES (1, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET
+                     high_water = MAX(high_water, excluded.high_water),
+                     last_refreshed_at = excluded.last_refreshed_at""",
+                (high_water, time.time())
+            )
+        return len(batch)
+
+    def _upsert(self, schema):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO schemata (id, idx, schema, creator, txid, time) VALUES (?, ?, ?, ?, ?, ?)",
+            (schema['id'], _to_index(schema.get('index')), schema['schema'], schema.get('creator'),
+             schema.get('txid'), int(schema['time']))
+        )
+        self.conn.execute("DELETE FROM schema_fields WHERE schema_id = ?", (schema['id'],))
+        try:
+            fields = parse_schema(schema['schema'])
+        except ABIDecodeError:
+            # Schema dengan syntax tidak standar tetap bisa di-lookup per UID/index
+            return
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO schema_fields (field_lower, schema_id, field_name, field_type) VALUES (?, ?, ?, ?)",
+            [(name.lower(), schema['id'], name, field_type) for name, field_type in fields]
+        )
+
+    # --- lookups ---
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM schemata").fetchone()[0]
+
+    def get(self, schema_uid):
+        """Schema berdasarkan UID, atau None"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM schemata WHERE id = ?", (schema_uid,)).fetchone()
+        return _schema_from_row(row) if row else None
+
+    def by_index(self, index, refresh_on_miss=True):
+        """Schema berdasarkan EAS index ("Schema #517"). Index di atas max yang dikenal
+        memicu refresh, maksimal sekali per MISS_REFRESH_INTERVAL detik"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM schemata WHERE idx = ?", (int(index),)).fetchone()
+            max_index = self.conn.execute("SELECT MAX(idx) FROM schemata").fetchone()[0] if row is None else None
+        if row is None and refresh_on_miss and (max_index is None or int(index) > max_index):
+            now = time.monotonic()
+            with self._lock:
+                due = now - self._last_miss_refresh >= MISS_REFRESH_INTERVAL
+                if due:
+                    self._last_miss_refresh = now
+            if due:
+                self.refresh()
+                return self.by_index(index, refresh_on_miss=False)
+        return _schema_from_row(row) if row else None
+
+    def with_field(self, field_name):
+        """Schemata yang punya field dengan nama persis ini (case-insensitive)"""
+        with self._lock:
+            rows = self.conn.execute(
+                """SELECT s.* FROM schema_fields f JOIN schemata s ON s.id = f.schema_id
+                   WHERE f.field_lower = ? ORDER BY s.idx""",
+                (field_name.lower(),)
+            ).fetchall()
+        return [_schema_from_row(row) for row in rows]
+
+    def search_fields(self, *keywords):
+        """Schemata yang punya field name mengandung salah satu keyword"""
+        if not keywords:
+            return []
+        clause = " OR ".join("f.field_lower LIKE ?" for _ in keywords)
+        with self._lock:
+            rows = self.conn.execute(
+                f"""SELECT DISTINCT s.* FROM schema_fields f JOIN schemata s ON s.id = f.schema_id
+                    WHERE {clause} ORDER BY s.idx""",
+                [f"%{keyword.lower()}%" for keyword in keywords]
+            ).fetchall()
+        return [_schema_from_row(row) for row in rows]
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def get_registry():
+    """Shared registry di DEFAULT_DB_PATH (lazy)"""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = SchemaRegistry()
+        return _default_registry
+
+
+def print_schema(schema, details=False):
+    """Print satu schema registry (dipakai juga oleh yaps CLI dan scripts)"""
+    print(f"\n📋 Schema #{schema['index']}")
+    print(f"   UID: {schema['id']}")
+    print(f"   Schema: {schema['schema']}")
+    print(f"   Creator: {schema['creator']}")
+    if details:
+        print(f"   Time: {schema['time']}")
+        print(f"   TxID: {schema['txid']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local EAS schema registry")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Path SQLite database")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('refresh', help="Incremental refresh dari base.easscan.org")
+    index_parser = sub.add_parser('index', help="Lookup schema berdasarkan EAS index")
+    index_parser.add_argument('index', type=int, nargs='+')
+    field_parser = sub.add_parser('field', help="Schemata dengan field name persis")
+    field_parser.add_argument('name')
+    search_parser = sub.add_parser('search', help="Schemata dengan field name mengandung keyword")
+    search_parser.add_argument('keywords', nargs='+')
+    args = parser.parse_args(argv)
+
+    registry = SchemaRegistry(args.db)
+    if args.command == 'refresh':
+        started = time.time()
+        result = registry.refresh()
+        print(f"✅ +{result['fetched']:,} schemata, {result['total']:,} total ({time.time() - started:.1f}s)")
+        return 0
+
+    registry.ensure_fresh()
+    if args.command == 'index':
+        schemas = [registry.by_index(index) for index in args.index]
+        for index, schema in zip(args.index, schemas):
+            if schema is None:
+                print(f"\n❌ Schema #{index} tidak ditemukan")
+        schemas = [schema for schema in schemas if schema]
+    elif args.command == 'field':
+        schemas = registry.with_field(args.name)
+    else:
+        schemas = registry.search_fields(*args.keywords)
+
+    for schema in schemas:
+        print_schema(schema)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
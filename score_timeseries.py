@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Per-user YAPS score time-series index
+
+Setiap attestation adalah snapshot points (yapScaledPoints / yapPoints) satu
+twitterUserId pada satu waktu. Index ini menyimpan per user dua array terurut
+(timestamp, points), jadi "points gained antara t1 dan t2" dan "daily delta
+30 hari terakhir" dijawab dengan binary search, tanpa scan ulang attestations.
+"""
+
+import bisect
+import time
+from array import array
+
+DAY = 86400
+# Field points yang dipakai, sesuai urutan prioritas (517: scaled, 525: raw)
+POINTS_FIELDS = ('yapScaledPoints', 'yapPoints')
+
+
+def snapshot(att, points_field=None):
+    """(twitterUserId, timestamp, points) dari satu attestation, atau None"""
+    fields = att.get('fields') or {}
+    user_id = fields.get('twitterUserId')
+    if user_id is None:
+        return None
+    if points_field is None:
+        points_field = next((name for name in POINTS_FIELDS if name in fields), None)
+    points = fields.get(points_field)
+    if points is None:
+        return None
+    # timestamp di data attestation = waktu snapshot; fallback ke timeCreated
+    timestamp = fields.get('timestamp') or att.get('timeCreated') or att.get('timestamp')
+    try:
+        return str(user_id), int(timestamp), int(points)
+    except (TypeError, ValueError):
+        return None
+
+
+class UserTimeSeriesIndex:
+    """twitterUserId -> (array timestamps, array points), terurut per timestamp"""
+
+    def __init__(self, points_field=None):
+        self.points_field = points_field
+        self.series = {}
+
+    def __len__(self):
+        return len(self.series)
+
+    def add(self, twitter_user_id, timestamp, points):
+        series = self.series.get(twitter_user_id)
+        if series is None:
+            series = self.series[twitter_user_id] = (array('q'), array('Q'))
+        timestamps, values = series
+        if not timestamps or timestamp >= timestamps[-1]:
+            # Stream oldest-first: append O(1)
+            timestamps.append(timestamp)
+            values.append(points)
+        else:
+            # Straggler out-of-order: insert O(n); stream besar lewat add_many
+            position = bisect.bisect_right(timestamps, timestamp)
+            timestamps.insert(position, timestamp)
+            values.insert(position, points)
+
+    def add_many(self, points):
+        """Tambah banyak (twitterUserId, timestamp, points) sekaligus, urutan input bebas.
+        Point dikumpulkan per user lalu di-sort sekali (newest-first = run terbalik, O(n)),
+        jadi build tidak O(n^2) seperti insert satu per satu."""
+        grouped = {}
+        for twitter_user_id, timestamp, value in points:
+            grouped.setdefault(twitter_user_id, []).append((timestamp, value))
+        for twitter_user_id, user_points in grouped.items():
+            user_points.sort(key=lambda point: point[0])
+            series = self.series.get(twitter_user_id)
+            if series is not None and series[0] and user_points[0][0] < series[0][-1]:
+                # Overlap dengan series lama: gabung lalu sort ulang (stable, data lama duluan)
+                user_points = list(zip(*series)) + user_points
+                user_points.sort(key=lambda point: point[0])
+                series = None
+            if series is None:
+                series = self.series[twitter_user_id] = (array('q'), array('Q'))
+            series[0].extend(timestamp for timestamp, _ in user_points)
+            series[1].extend(value for _, value in user_points)
+
+    def add_attestation(self, att):
+        """Tambah satu attestation (dict dengan 'fields'); revoked di-skip"""
+        if att.get('revoked'):
+            return False
+        point = snapshot(att, self.points_field)
+        if point is None:
+            return False
+        self.add(*point)
+        return True
+
+    @classmethod
+    def from_attestations(cls, attestations, points_field=None):
+        """Index dari iterable attestations (oldest-first maupun newest-first); revoked di-skip"""
+        index = cls(points_field)
+        points = (snapshot(att, points_field) for att in attestations if not att.get('revoked'))
+        index.add_many(point for point in points if point is not None)
+        return index
+
+    @classmethod
+    def build(cls, schema_uid, points_field=None, limit=None):
+        """Index dari stream attestations satu schema (local store jika sudah di-sync)"""
+        from attestation_store import iter_attestations
+        return cls.from_attestations(
+            iter_attestations(schema_uid, limit=limit, newest_first=False), points_field
+        )
+
+    # --- queries ---
+
+    def snapshots(self, twitter_user_id):
+        """List (timestamp, points) untuk satu user"""
+        series = self.series.get(str(twitter_user_id))
+        return list(zip(*series)) if series else []
+
+    def points_at(self, twitter_user_id, timestamp):
+        """Points snapshot terakhir pada/ sebelum timestamp (None jika belum ada)"""
+        series = self.series.get(str(twitter_user_id))
+        if not series:
+            return None
+        timestamps, values = series
+        position = bisect.bisect_right(timestamps, timestamp)
+        return values[position - 1] if position else None
+
+    def latest(self, twitter_user_id):
+        """(timestamp, points) terbaru, atau None"""
+        series = self.series.get(str(twitter_user_id))
+        if not series:
+            return None
+        return series[0][-1], series[1][-1]
+
+    def gained(self, twitter_user_id, t1, t2):
+        """Points gained antara t1 dan t2 (points kumulatif), atau None tanpa snapshot sampai t2.
+        Snapshot pertama hanya berarti attester mulai publish untuk user ini, bukan points = 0:
+        jika belum ada snapshot pada t1, baseline = snapshot pertama setelah t1."""
+        series = self.series.get(str(twitter_user_id))
+        if not series:
+            return None
+        timestamps, values = series
+        end = bisect.bisect_right(timestamps, t2)
+        if not end:
+            return None
+        start = bisect.bisect_right(timestamps, t1)
+        return values[end - 1] - values[start - 1 if start else 0]
+
+    def daily_deltas(self, twitter_user_id, days=30, now=None):
+        """List (tanggal UTC 'YYYY-MM-DD', delta points) untuk `days` hari terakhir (oldest first).
+        Hari sebelum snapshot pertama = None; hari snapshot pertama dihitung dari snapshot itu."""
+        if str(twitter_user_id) not in self.series:
+            return []
+        now = int(now if now is not None else time.time())
+        end_of_today = now - now % DAY + DAY
+        deltas = []
+        for offset in range(days, 0, -1):
+            day_end = end_of_today - (offset - 1) * DAY
+            # Snapshot tepat di tengah malam dihitung ke hari berikutnya
+            delta = self.gained(twitter_user_id, day_end - DAY - 1, day_end - 1)
+            deltas.append((time.strftime('%Y-%m-%d', time.gmtime(day_end - DAY)), delta))
+        return deltas
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Scoring konten (Kaito YAPS + Twitter algorithm) dari feature vector
+
+Dipakai app.py (/analyze, /generate) dan batch_scoring.py (worker process
+/analyze/batch); modul ini hanya bergantung pada features.py, jadi worker
+tidak perlu meng-import app.
+"""
+
+from features import extract_features
+
+
+def build_content_analysis(content, features=None):
+    """Full Kaito YAPS + Twitter algorithm analysis dari feature vector"""
+    if features is None:
+        features = extract_features(content)
+    
+    # === KAITO YAPS ANALYSIS ===
+    char_count = features['char_count']
+    optimal_length = 150 <= char_count <= 280
+    min_length = char_count >= 50
+    
+    # Crypto keywords detection
+    keyword_count = features['crypto_keyword_count']
+    has_crypto_focus = keyword_count >= 1
+    
+    # Keyword stuffing detection
+    keyword_stuffing = keyword_count > 5
+    
+    # Original insight
+    generic_count = features['generic_count']
+    is_original = generic_count < 2
+    
+    # 1. CONTENT OPTIMIZATION (30%)
+    content_opt_score = 0
+    if min_length: content_opt_score += 2
+    if optimal_length: content_opt_score += 3
+    if has_crypto_focus: content_opt_score += 3
+    if is_original: content_opt_score += 2
+    content_opt_score = min(10, content_opt_score)
+    
+    # 2. ENGAGEMENT STRATEGY (50%)
+    has_question = features['question_count'] > 0
+    has_data = features['has_digit']
+    has_cta = features['has_cta']
+    
+    engagement_score = 0
+    if has_question: engagement_score += 4
+    if has_data: engagement_score += 3
+    if has_cta: engagement_score += 3
+    engagement_score = min(10, engagement_score)
+    
+    # 3. CONTENT QUALITY (20%)
+    has_metrics = features['has_metrics']
+    has_analysis = features['word_count'] > 15
+    no_spam_pattern = not features['has_spam_pattern']
+    
+    quality_score = 0
+    if has_metrics: quality_score += 4
+    if has_analysis: quality_score += 3
+    if no_spam_pattern: quality_score += 3
+    quality_score = min(10, quality_score)
+    
+    # === TWITTER ALGORITHM ANALYSIS ===
+    # Based on Twitter's engagement weights
+    twitter_score = 0
+    twitter_factors = []
+    
+    # Reply potential (75x weight in Twitter algo)
+    if has_question:
+        twitter_score += 35
+        twitter_factors.append("✅ Question drives replies (75x Twitter weight)")
+    
+    # Conversation starter (27-30x weight)
+    if has_cta or has_question:
+        twitter_score += 25
+        twitter_factors.append("✅ Conversation starter (30x weight)")
+    
+    # Rich content (higher engagement)
+    if has_data or has_metrics:
+        twitter_score += 15
+        twitter_factors.append("✅ Data-rich content (better retention)")
+    
+    # Optimal length for engagement
+    if 50 <= char_count <= 280:
+        twitter_score += 15
+        twitter_factors.append("✅ Optimal length (not cut off)")
+    else:
+        twitter_factors.append("⚠️ Length not optimal for feed")
+    
+    # Recency/velocity potential (first 30 mins critical)
+    if not features['has_engagement_farming']:
+        twitter_score += 10
+        twitter_factors.append("✅ No engagement farming (avoid penalty)")
+    else:
+        twitter_score -= 20
+        twitter_factors.append("❌ Engagement farming detected (-74x penalty risk)")
+    
+    # Twitter penalties check
+    twitter_penalties = []
+    if keyword_stuffing:
+        twitter_score -= 15
+        twitter_penalties.append("⚠️ Keyword stuffing may trigger spam filter")
+    
+    if features['http_count'] > 1:
+        twitter_score -= 10
+        twitter_penalties.append("⚠️ Multiple links reduce reach by ~30%")
+    
+    if features['mention_count'] > 3:
+        twitter_score -= 10
+        twitter_penalties.append("⚠️ Too many mentions may reduce distribution")
+    
+    twitter_score = max(0, min(100, twitter_score))
+    
+    # === HIGH-SCORING CONTENT TYPES ===
+    terms = features['terms']
+    content_types = []
+    if 'tvl' in terms or 'revenue' in terms:
+        content_types.append("📊 Protocol analysis")
+    if has_metrics and ('vs' in terms or 'compare' in terms):
+        content_types.append("⚖️ Comparison analysis")
+    if 'airdrop' in terms and 'risk' in terms:
+        content_types.append("💰 Airdrop strategy")
+    if features['has_thread']:
+        content_types.append("🧵 Thread format")
+    
+    # === KAITO PENALTIES ===
+    kaito_penalties = []
+    if keyword_stuffing:
+        kaito_penalties.append("⚠️ Keyword stuffing detected")
+    if 'kaito' in terms and features['mention_count'] > 0:
+        kaito_penalties.append("⚠️ Avoid tagging Kaito")
+    if generic_count >= 3:
+        kaito_penalties.append("⚠️ Too many generic phrases")
+    if char_count < 50:
+        kaito_penalties.append("⚠️ Too short (min 50 chars)")
+    if not has_crypto_focus:
+        kaito_penalties.append("⚠️ No crypto-specific topic")
+    
+    # === OPTIMIZATION SUGGESTIONS ===
+    suggestions = []
+    if not has_question:
+        suggestions.append("💡 Add question untuk drive discussion (75x Twitter boost)")
+    if not has_data:
+        suggestions.append("💡 Include metrics/data untuk credibility")
+    if char_count < 150:
+        suggestions.append("💡 Expand to 150-280 chars (optimal range)")
+    if not content_types:
+        suggestions.append("💡 Try protocol deep-dive atau comparison format")
+    if not is_original:
+        suggestions.append("💡 Add personal analysis/unique insight")
+    if not has_cta:
+        suggestions.append("💡 Add call-to-action untuk conversation")
+    
+    # === WEIGHTED SCORES ===
+    kaito_total = (content_opt_score * 0.3) + (engagement_score * 0.5) + (quality_score * 0.2)
+    kaito_total = round(kaito_total, 1)
+    
+    # Estimated YAPS Points
+    estimated_yaps = int(kaito_total * 0.7 * 75)
+    
+    # Ratings
+    if kaito_total >= 9:
+        kaito_rating = "⭐⭐⭐⭐⭐ Excellent - High YAPS potential!"
+    elif kaito_total >= 7:
+        kaito_rating = "⭐⭐⭐⭐ Good - Solid content"
+    elif kaito_total >= 5:
+        kaito_rating = "⭐⭐⭐ Fair - Needs improvement"
+    else:
+        kaito_rating = "⭐⭐ Poor - Optimize further"
+    
+    if twitter_score >= 80:
+        twitter_rating = "🚀 Viral Potential - High engagement expected"
+    elif twitter_score >= 60:
+        twitter_rating = "📈 Good Reach - Above average distribution"
+    elif twitter_score >= 40:
+        twitter_rating = "📊 Moderate Reach - Standard distribution"
+    else:
+        twitter_rating = "📉 Low Reach - Needs optimization"
+    
+    return {
+        "kaito_yaps": {
+            "total_score": kaito_total,
+            "rating": kaito_rating,
+            "estimated_yaps": estimated_yaps,
+            "breakdown": {
+                "content_optimization": {
+                    "score": content_opt_score,
+                    "weight": "30%",
+                    "details": {
+                        "length": f"{char_count} chars" + (" ✅ optimal" if optimal_length else " ⚠️ adjust to 150-280"),
+                        "crypto_focus": "✅ Yes" if has_crypto_focus else "❌ No crypto topic",
+                        "originality": "✅ Original" if is_original else "⚠️ Too generic",
+                        "keywords": f"{keyword_count} keywords" + (" ✅" if 1 <= keyword_count <= 3 else " ⚠️")
+                    }
+                },
+                "engagement_strategy": {
+                    "score": engagement_score,
+                    "weight": "50%",
+                    "details": {
+                        "question": "✅ Yes" if has_question else "❌ No",
+                        "data_driven": "✅ Yes" if has_data else "❌ No data/metrics",
+                        "cta": "✅ Yes" if has_cta else "❌ No call-to-action"
+                    }
+                },
+                "content_quality": {
+                    "score": quality_score,
+                    "weight": "20%",
+                    "details": {
+                        "metrics": "✅ Includes metrics" if has_metrics else "❌ No specific metrics",
+                        "depth": "✅ Detailed analysis" if has_analysis else "⚠️ Surface-level",
+                        "spam_check": "✅ Clean" if no_spam_pattern else "⚠️ Spam pattern"
+                    }
+                }
+            },
+            "penalties": kaito_penalties if kaito_penalties else ["✅ No penalties detected"]
+        },
+        "twitter_algorithm": {
+            "score": twitter_score,
+            "rating": twitter_rating,
+            "engagement_factors": twitter_factors if twitter_factors else ["ℹ️ Basic content"],
+            "penalties": twitter_penalties if twitter_penalties else ["✅ No Twitter penalties"],
+            "algorithm_notes": [
+                "📊 Reply weight: 75x (most powerful)",
+                "🔄 Retweet weight: 10x",
+                "❤️ Like weight: 1x",
+                "⏰ First 30 mins critical for velocity",
+                "🚫 Avoid: keyword stuffing, external links, engagement farming"
+            ]
+        },
+        "content_types": content_types if content_types else ["ℹ️ Standard tweet format"],
+        "suggestions": suggestions if suggestions else ["✅ Content is well-optimized!"]
+    }
+
+
+def analyze_yaps_score(content, features=None):
+    """Simple scoring analysis untuk generate endpoint"""
+    if features is None:
+        features = extract_features(content)
+    
+    score = {
+        'crypto_relevance': 0,
+        'engagement_potential': 0,
+        'semantic_quality': 0,
+        'total': 0,
+        'feedback': []
+    }
+    
+    if features['char_count'] >= 50:
+        score['crypto_relevance'] += 3
+        score['feedback'].append('✅ Length optimal (50+ chars)')
+    
+    if features['has_yaps_crypto_keyword']:
+        score['crypto_relevance'] += 4
+        score['feedback'].append('✅ Crypto-relevant topics')
+    
+    if features['has_digit']:
+        score['crypto_relevance'] += 3
+        score['feedback'].append('✅ Contains data/metrics')
+    else:
+        score['feedback'].append('⚠️ Tidak ada data numerik')
+    
+    tags_count = features['mention_count']
+    if tags_count <= 2:
+        score['engagement_potential'] += 5
+        score['feedback'].append(f'✅ Tags optimal ({tags_count} tags)')
+    else:
+        score['engagement_potential'] += 2
+        score['feedback'].append(f'⚠️ Terlalu banyak tags ({tags_count})')
+    
+    if features['question_count']:
+        score['engagement_potential'] += 3
+        score['feedback'].append('✅ Ada question untuk engagement')
+    
+    if features['char_count'] <= 280:
+        score['engagement_potential'] += 2
+        score['feedback'].append('✅ Twitter-friendly length')
+    
+    if features['has_analytical_tone']:
+        score['semantic_quality'] += 3
+        score['feedback'].append('✅ Analytical tone')
+    
+    if not features['has_yaps_spam']:
+        score['semantic_quality'] += 4
+        score['feedback'].append('✅ Tidak ada spam phrases')
+    
+    if features['word_count'] > 15:
+        score['semantic_quality'] += 3
+        score['feedback'].append('✅ Depth content (15+ words)')
+    
+    score['total'] = score['crypto_relevance'] + score['engagement_potential'] + score['semantic_quality']
+    
+    if score['total'] >= 18:
+        score['rating'] = 'EXCELLENT (High YAPS potential)'
+    elif score['total'] >= 14:
+        score['rating'] = 'GOOD (Medium-High YAPS)'
+    elif score['total'] >= 10:
+        score['rating'] = 'FAIR (Medium YAPS)'
+    else:
+        score['rating'] = 'NEEDS IMPROVEMENT'
+    
+    return score
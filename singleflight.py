@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Single-flight request coalescing untuk upstream fetches (Kaito & EAS GraphQL)
+
+Concurrent callers dengan key yang sama menunggu satu call yang sedang berjalan
+dan menerima hasil (atau exception) yang sama, jadi burst N request = 1 network call.
+"""
+
+import json
+import threading
+
+
+class _Call:
+    """Satu call yang sedang in-flight"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicate identical in-flight calls berdasarkan key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """Jalankan fn sekali per key; caller lain dengan key sama ikut menunggu hasilnya"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self):
+        """Jumlah call yang benar-benar dieksekusi vs yang di-share"""
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'shared': self.shared,
+                'in_flight': len(self._calls),
+            }
+
+
+def request_key(url, query=None, variables=None):
+    """Key untuk upstream call: URL + query + variables (urutan key tidak berpengaruh)"""
+    return (url, query or "", json.dumps(variables or {}, sort_keys=True, default=str))
+
+
+# Shared instance untuk semua upstream fetch di proses ini
+upstream_flight = SingleFlight()
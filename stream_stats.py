@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+One-pass statistics untuk stream attestation yang panjang
+
+LogHistogram menyimpan count per bucket logaritmik (relative accuracy tetap,
+ala DDSketch), jadi percentile / tier boundary seluruh history schema bisa
+dihitung dalam O(n) dengan memory terbatas (~2.200 bucket untuk range uint64
+pada akurasi 1%). FrequentItems (Misra-Gries) menghitung value paling sering
+muncul dengan jumlah counter tetap.
+"""
+
+import math
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90, 95, 99)
+
+
+class LogHistogram:
+    """Fixed-bucket log histogram untuk value >= 0.
+
+    Value v > 0 masuk bucket ceil(log_gamma(v)); quantile dikembalikan sebagai
+    titik tengah bucket, jadi error relatifnya <= relative_accuracy.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value, count=1):
+        if value < 0:
+            raise ValueError("LogHistogram hanya untuk value >= 0")
+        if value == 0:
+            self.zero_count += count
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Gabungkan histogram lain dengan relative_accuracy yang sama"""
+        if other.gamma != self.gamma:
+            raise ValueError("relative_accuracy berbeda")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def _bucket_value(self, index):
+        value = 2 * self.gamma ** index / (self.gamma + 1)
+        return min(max(value, self.min), self.max)
+
+    def quantiles(self, qs):
+        """Beberapa quantile (0..1) dalam satu pass atas bucket yang terurut"""
+        if not self.count:
+            return [None for _ in qs]
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        results = [None] * len(qs)
+        pending = iter(order)
+        current = next(pending, None)
+
+        cumulative = self.zero_count
+        # rank 0-based sama dengan sorted(values)[int(q * (count - 1))]
+        while current is not None and int(qs[current] * (self.count - 1)) < cumulative:
+            results[current] = 0
+            current = next(pending, None)
+        for index in sorted(self.buckets):
+            if current is None:
+                break
+            cumulative += self.buckets[index]
+            while current is not None and int(qs[current] * (self.count - 1)) < cumulative:
+                results[current] = self._bucket_value(index)
+                current = next(pending, None)
+        return results
+
+    def quantile(self, q):
+        return self.quantiles([q])[0]
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+    def tiers(self, percentiles=DEFAULT_PERCENTILES):
+        """Tier boundaries: list (percentile, value)"""
+        return list(zip(percentiles, self.quantiles([p / 100 for p in percentiles])))
+
+
+class FrequentItems:
+    """Misra-Gries heavy hitters: paling banyak `capacity` counter.
+
+    Count yang dilaporkan bisa under-estimate paling banyak n / (capacity + 1);
+    item yang muncul lebih sering dari itu dijamin tetap tercatat.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counters = {}
+        self.total = 0
+
+    def add(self, item):
+        self.total += 1
+        counters = self.counters
+        if item in counters:
+            counters[item] += 1
+        elif len(counters) < self.capacity:
+            counters[item] = 1
+        else:
+            # Decrement semua counter; total decrement <= n, jadi amortized O(1)
+            for key in list(counters):
+                if counters[key] == 1:
+                    del counters[key]
+                else:
+                    counters[key] -= 1
+
+    def most_common(self, n=None):
+        ranked = sorted(self.counters.items(), key=lambda kv: kv[1], reverse=True)
+        return ranked if n is None else ranked[:n]
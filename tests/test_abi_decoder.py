@@ -0,0 +1,85 @@
+"""
+abi_decoder: static / dynamic field, dan data rusak selalu jadi ABIDecodeError
+"""
+
+import pytest
+
+from abi_decoder import ABIDecodeError, compile_schema, parse_schema
+
+
+def _word(value):
+    return format(value % (1 << 256), '064x')
+
+
+def _encode_string(text):
+    raw = text.encode().hex()
+    padded = raw + '0' * (-len(raw) % 64)
+    return _word(len(text.encode())) + padded
+
+
+STATIC_SCHEMA = 'uint64 twitterUserId,int256 delta,bool active,address wallet,bytes4 tag'
+DYNAMIC_SCHEMA = 'uint64 twitterUserId,string twitterUsername,uint256[] history'
+
+
+def test_static_schema_decodes_every_word():
+    data = '0x' + _word(1422186185196113922) + _word(-5) + _word(1) + _word(0xABCDEF) + 'deadbeef' + '0' * 56
+
+    assert compile_schema(STATIC_SCHEMA).decode(data) == {
+        'twitterUserId': 1422186185196113922,
+        'delta': -5,
+        'active': True,
+        'wallet': '0x' + '0' * 34 + 'abcdef',
+        'tag': '0xdeadbeef',
+    }
+
+
+def test_dynamic_string_and_array_follow_offsets():
+    # Head: 3 word; tail: string di offset 0x60, array setelahnya
+    string_tail = _encode_string('yapper_ü')
+    array_offset = 3 * 32 + len(string_tail) // 2
+    data = (_word(42) + _word(3 * 32) + _word(array_offset)
+            + string_tail + _word(2) + _word(100) + _word(250))
+
+    assert compile_schema(DYNAMIC_SCHEMA).decode_typed(data) == [
+        ('twitterUserId', 'uint64', 42),
+        ('twitterUsername', 'string', 'yapper_ü'),
+        ('history', 'uint256[]', [100, 250]),
+    ]
+
+
+@pytest.mark.parametrize('data', [
+    '',
+    '0x',
+    # Word terakhir terpotong
+    '0x' + _word(1) * 4 + _word(2)[:-2],
+    # Bukan hex
+    '0x' + 'zz' * 32 * 5,
+])
+def test_malformed_static_data(data):
+    with pytest.raises(ABIDecodeError):
+        compile_schema(STATIC_SCHEMA).decode(data)
+
+
+@pytest.mark.parametrize('data', [
+    # Offset string di luar data
+    _word(1) + _word(10 ** 6) + _word(3 * 32) + _word(0),
+    # Panjang string melebihi data
+    _word(1) + _word(3 * 32) + _word(4 * 32) + _word(500) + _word(0)[:8],
+    # Panjang array melebihi data
+    _word(1) + _word(3 * 32) + _word(4 * 32) + _word(0) + _word(9) + _word(1),
+    # Word offset terpotong
+    _word(1) + _word(3 * 32) + _word(3 * 32) + _word(1)[:30],
+])
+def test_malformed_dynamic_data(data):
+    with pytest.raises(ABIDecodeError):
+        compile_schema(DYNAMIC_SCHEMA).decode(data)
+
+
+@pytest.mark.parametrize('schema', ['uint256[3] scores', 'tuple t', 'string[] names', 'uint64'])
+def test_unsupported_schema(schema):
+    with pytest.raises(ABIDecodeError):
+        compile_schema(schema)
+
+
+def test_parse_schema():
+    assert parse_schema(' uint64 a , bytes32[] b') == [('a', 'uint64'), ('b', 'bytes32[]')]
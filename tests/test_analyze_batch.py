@@ -0,0 +1,60 @@
+"""
+/analyze/batch: parsing JSON / NDJSON / text/plain dan options dari query string
+"""
+
+import json
+
+import pytest
+
+import app as app_module
+
+TWEET = 'Monad TVL naik 45% dalam 30 hari. Kenapa? "Parallel EVM" baru kepakai kalau app-nya native.'
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def test_plain_text_lines_are_raw_strings(client):
+    response = client.post('/analyze/batch', data=f"{TWEET}\ngm\n\n", content_type='text/plain')
+
+    assert response.status_code == 200
+    assert len(response.json['results']) == 2
+    assert all(row is not None for row in response.json['results'])
+
+
+def test_ndjson_lines_are_decoded(client):
+    body = '\n'.join(json.dumps(item) for item in ({'content': TWEET}, 'gm', ''))
+    response = client.post('/analyze/batch', data=body, content_type='application/x-ndjson')
+
+    assert response.status_code == 200
+    assert len(response.json['results']) == 3
+    assert response.json['results'][2] is None
+
+
+def test_malformed_ndjson_is_400(client):
+    response = client.post('/analyze/batch', data='{"content": ', content_type='application/x-ndjson')
+
+    assert response.status_code == 400
+    assert response.json['error'] == 'Invalid JSON / NDJSON'
+
+
+def test_aggregate_query_option_applies_to_json_array(client):
+    response = client.post('/analyze/batch?aggregate=1', json=[TWEET, ''])
+
+    assert response.json['aggregate']['count'] == 2
+    assert response.json['aggregate']['scored'] == 1
+
+
+def test_body_option_overrides_query_string(client):
+    response = client.post('/analyze/batch?aggregate=1', json={'texts': [TWEET], 'aggregate': False})
+
+    assert response.status_code == 200
+    assert 'aggregate' not in response.json
+
+
+def test_non_list_body_is_400(client):
+    response = client.post('/analyze/batch', json={'texts': 'bukan list'})
+
+    assert response.status_code == 400
@@ -0,0 +1,88 @@
+"""
+/api/yaps: strong ETag hanya untuk body yang identik, umur data lewat header, 304 untuk If-None-Match
+"""
+
+import hashlib
+import json
+import time
+
+import pytest
+
+import app as app_module
+from yaps_index import UserScoreIndex
+
+SCHEMAS = {'517': {'attestation_id': '0xabc', 'time_created': 1700000000, 'points': 12.5, 'fields': {}}}
+
+
+def _fake_fetch(twitter_user_id):
+    body = json.dumps(SCHEMAS, sort_keys=True)
+    return {
+        'twitter_user_id': twitter_user_id,
+        'schemas': SCHEMAS,
+        'etag': hashlib.sha1(body.encode()).hexdigest(),
+        'fetched_at': time.time(),
+    }
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = UserScoreIndex({'517': '0xschema'})
+    monkeypatch.setattr(index, '_fetch', _fake_fetch)
+    monkeypatch.setattr(index, '_ensure_refresher', lambda: None)
+    monkeypatch.setattr(app_module, 'yaps_index', index)
+    return index
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.mark.parametrize('url', ['/api/yaps/42', '/api/yaps?ids=42,43'])
+def test_same_etag_means_same_body(client, index, url):
+    first = client.get(url)
+    index._entries.clear()
+    time.sleep(1.1)
+    second = client.get(url)
+
+    assert first.headers['ETag'] == second.headers['ETag']
+    assert not first.headers['ETag'].startswith('W/')
+    assert first.get_data() == second.get_data()
+    assert b'fetched_at' not in first.get_data()
+    assert 'Last-Modified' in second.headers and 'Age' in second.headers
+
+
+def test_if_none_match_returns_304(client, index):
+    etag = client.get('/api/yaps/42').headers['ETag']
+
+    response = client.get('/api/yaps/42', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.cache_control.max_age is not None
+
+
+def test_bulk_etag_changes_with_error_text(client, index, monkeypatch):
+    ok = client.get('/api/yaps?ids=42').headers['ETag']
+
+    def failing_fetch(twitter_user_id):
+        raise RuntimeError('easscan down')
+    monkeypatch.setattr(index, '_fetch', failing_fetch)
+    index._entries.clear()
+    failed = client.get('/api/yaps?ids=42')
+
+    assert failed.json['results']['42']['error'] == 'easscan down'
+    assert failed.headers['ETag'] != ok
+
+
+def test_background_refresh_counts_successes_and_errors(index, monkeypatch):
+    index._refreshing.update({'1', '2'})
+    index._refresh_background('1')
+
+    def failing_fetch(twitter_user_id):
+        raise RuntimeError('easscan down')
+    monkeypatch.setattr(index, '_fetch', failing_fetch)
+    index._refresh_background('2')
+
+    stats = index.stats()
+    assert (stats['refreshes'], stats['refresh_errors'], stats['refreshing']) == (1, 1, 0)
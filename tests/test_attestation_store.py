@@ -0,0 +1,59 @@
+"""
+attestation_store: schema yang sudah di-sync dibaca dari SQLite tanpa network
+"""
+
+import pytest
+
+import attestation_store
+import eas
+import http_client
+from analyze_yaps_algorithm import analyze_yaps_attestations
+from benchmarks.eas_fixtures import EASDataset
+from benchmarks.stubs import install_eas_standin
+from explore_new_schema import analyze_scoring_patterns
+
+SCHEMA_UID = eas.YAPS_SCHEMAS[517]
+
+
+@pytest.fixture
+def standin(monkeypatch, tmp_path):
+    monkeypatch.setattr(http_client, 'get_session', http_client.get_session)
+    monkeypatch.setattr(http_client, 'graphql_limiter', http_client.graphql_limiter)
+    standin = install_eas_standin(EASDataset.synthetic(attestations=2000, users=100))
+    store = attestation_store.AttestationStore(str(tmp_path / 'attestations.sqlite3'))
+    monkeypatch.setattr(attestation_store, '_default_store', store)
+    yield standin
+    store.close()
+
+
+def test_synced_schema_reads_without_network(standin):
+    attestation_store.get_store().sync(SCHEMA_UID)
+    # get_decoder di-cache; pastikan schema definition sudah diambil sebelum hitung request
+    eas.get_decoder(SCHEMA_UID)
+    before = standin.requests
+
+    atts = list(attestation_store.iter_attestations(SCHEMA_UID, fields=("id", "attester", "timeCreated", "fields")))
+    analyze_yaps_attestations(SCHEMA_UID)
+    analyze_scoring_patterns(SCHEMA_UID)
+
+    assert len(atts) == 2000
+    assert atts[0]['fields']['twitterUserId']
+    assert standin.requests == before
+
+
+def test_unsynced_schema_decodes_fields_from_network(standin):
+    atts = list(attestation_store.iter_attestations(SCHEMA_UID, fields=("id", "timeCreated", "fields"), limit=5))
+
+    assert len(atts) == 5
+    assert all(att['fields'] for att in atts)
+    assert standin.requests > 0
+
+
+def test_where_filter_goes_to_network(standin):
+    attestation_store.get_store().sync(SCHEMA_UID)
+    before = standin.requests
+
+    atts = list(attestation_store.iter_attestations(SCHEMA_UID, where={"revoked": {"equals": True}}))
+
+    assert atts and all(att['revoked'] for att in atts)
+    assert standin.requests > before
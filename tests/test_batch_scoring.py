@@ -0,0 +1,29 @@
+"""
+batch_scoring: path paralel (process pool, spawn) sama dengan path serial
+"""
+
+import batch_scoring
+
+TEXTS = [
+    "Monad TVL naik 45% dalam 30 hari. Kenapa parallel EVM penting? Thesis: DeFi native menang.",
+    "",
+    "gm",
+    "Polymarket volume $1.2B bulan ini, 3x dari Q1. Apa artinya untuk prediction markets?",
+] * 3
+
+
+def test_parallel_scores_match_serial(monkeypatch):
+    serial = batch_scoring.score_texts(TEXTS)
+
+    monkeypatch.setattr(batch_scoring, 'PARALLEL_THRESHOLD', 1)
+    monkeypatch.setattr(batch_scoring, 'WORKERS', 2)
+    monkeypatch.setattr(batch_scoring, 'CHUNK_SIZE', 4)
+    monkeypatch.setattr(batch_scoring, '_pool', None)
+    try:
+        parallel = batch_scoring.score_texts(TEXTS)
+        assert batch_scoring._pool._mp_context.get_start_method() == 'spawn'
+    finally:
+        batch_scoring._pool.shutdown()
+
+    assert parallel == serial
+    assert serial[1] is None and serial[0] is not None
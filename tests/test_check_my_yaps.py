@@ -0,0 +1,33 @@
+"""
+check_my_yaps: gained / daily deltas hanya untuk schema points kumulatif (#517)
+"""
+
+import check_my_yaps
+from score_timeseries import DAY
+
+USER_ID = '42'
+
+
+def _rows(points):
+    # Newest first, seperti iter_user_attestations
+    return [
+        {'id': f'0x{i}', 'timeCreated': 100 * DAY + i * DAY, 'revoked': False,
+         'fields': {'twitterUserId': USER_ID, 'yapScaledPoints': value, 'timestamp': 100 * DAY + i * DAY}}
+        for i, value in reversed(list(enumerate(points)))
+    ]
+
+
+def test_deltas_only_for_cumulative_schema(monkeypatch, capsys):
+    rows = {
+        check_my_yaps.DEFAULT_SCHEMAS["Schema #517 (Scaled Points)"]: _rows([1000, 1500, 2100]),
+        # Monthly: reset di tengah window
+        check_my_yaps.DEFAULT_SCHEMAS["Schema #546 (Monthly Points)"]: _rows([900, 950, 20]),
+    }
+    monkeypatch.setattr(check_my_yaps, 'iter_user_attestations', lambda schema_uid, user_id: rows[schema_uid])
+
+    check_my_yaps.check_yaps_score(USER_ID, days=7)
+    scaled, monthly = capsys.readouterr().out.split("Schema #546")
+
+    assert "Gained last 7 days: +1,100 (history starts" in scaled
+    assert "delta tidak dihitung" in monthly
+    assert "Gained" not in monthly and "-930" not in monthly
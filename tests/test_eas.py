@@ -0,0 +1,35 @@
+"""
+eas.iter_user_attestations: filter startsWith di server + guard decoded twitterUserId di client
+"""
+
+import eas
+
+SCHEMA_UID = eas.YAPS_SCHEMAS[517]
+USER_ID = 1422186185196113922
+
+
+def _data(*values):
+    return "0x" + "".join(format(value, '064x') for value in values)
+
+
+def test_guard_skips_rows_it_cannot_verify(monkeypatch):
+    prefix = eas.abi_uint_word(USER_ID)
+    rows = [
+        {'id': '0x1', 'data': _data(USER_ID, 5000, 10, 1700000000), 'timeCreated': 3, 'revoked': False},
+        # Data terpotong: gagal di-decode, twitterUserId tidak bisa dicek
+        {'id': '0x2', 'data': prefix + "00" * 8, 'timeCreated': 2, 'revoked': False},
+        # Server tidak menerapkan filter startsWith dengan benar: row milik user lain
+        {'id': '0x3', 'data': _data(USER_ID + 1, 1, 1, 1), 'timeCreated': 1, 'revoked': False},
+    ]
+    requests = []
+
+    def fake_query(query, variables=None):
+        requests.append(variables)
+        return {'data': {'attestations': rows}}
+    monkeypatch.setattr(eas, 'query_graphql', fake_query)
+
+    atts = list(eas.iter_user_attestations(SCHEMA_UID, USER_ID))
+
+    assert [att['id'] for att in atts] == ['0x1']
+    assert atts[0]['fields']['yapScaledPoints'] == 5000
+    assert requests[0]['where']['data'] == {'startsWith': prefix}
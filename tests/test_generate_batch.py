@@ -0,0 +1,47 @@
+"""
+/generate/batch: default concurrency cukup untuk batch "all" dalam ~satu round trip LLM
+"""
+
+import pytest
+
+import app as app_module
+import llm_client
+from benchmarks.stubs import StubOpenAI
+
+LLM_LATENCY = 0.3
+
+
+@pytest.fixture
+def client(monkeypatch):
+    stub = StubOpenAI(latency=LLM_LATENCY)
+    monkeypatch.setattr(llm_client, 'get_openai_client', lambda api_key: stub)
+    monkeypatch.setattr(app_module, 'fetch_kaito_projects', app_module.get_fallback_projects)
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    return app_module.app.test_client()
+
+
+def test_default_concurrency_follows_client_connection_limit():
+    assert app_module.GENERATE_BATCH_CONCURRENCY == llm_client.MAX_CONNECTIONS
+
+
+def test_all_batch_runs_in_one_round(client):
+    response = client.post('/generate/batch', json={'all': True})
+
+    expected = len(app_module.get_fallback_projects()) * len(app_module.PROMPT_TEMPLATES)
+    assert response.status_code == 200
+    assert response.json['total'] == expected and response.json['failed'] == 0
+    assert response.json['concurrency'] == expected
+    assert response.json['elapsed_ms'] < 2 * LLM_LATENCY * 1000
+    assert [r['index'] for r in response.json['results']] == list(range(expected))
+
+
+def test_request_concurrency_only_lowers_the_cap(client):
+    response = client.post('/generate/batch', json={'all': True, 'concurrency': 1000})
+    assert response.json['concurrency'] <= app_module.GENERATE_BATCH_CONCURRENCY
+
+    response = client.post('/generate/batch', json={
+        'items': [{'project': 'Monad', 'prompt_type': 'thesis'}, {'project': 'Nope', 'prompt_type': 'thesis'}],
+        'concurrency': 1
+    })
+    assert response.json['concurrency'] == 1
+    assert response.json['failed'] == 1
@@ -0,0 +1,47 @@
+"""
+/generate/stream: stream OpenAI di-close saat client disconnect di tengah streaming
+"""
+
+import pytest
+
+import app as app_module
+import llm_client
+from benchmarks.stubs import StubOpenAI
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    client = StubOpenAI()
+    monkeypatch.setattr(llm_client, 'get_openai_client', lambda api_key: client)
+    monkeypatch.setattr(app_module, 'fetch_kaito_projects', app_module.get_fallback_projects)
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    return client
+
+
+def _open_stream():
+    with app_module.app.test_request_context(
+        '/generate/stream', method='POST', json={'project': 'Monad', 'prompt_type': 'thesis'}
+    ):
+        response = app_module.generate_content_stream()
+    return iter(response.response)
+
+
+def test_disconnect_after_first_token_closes_stream(stub_client):
+    events = _open_stream()
+    assert next(events).startswith('event: start')
+    assert next(events).startswith('event: token')
+
+    events.close()
+
+    assert stub_client.chat.completions.last_stream.closed
+    sample = llm_client.get_latency_stats()['recent'][-1]
+    assert sample['label'] == 'generate_stream'
+    assert sample['cancelled'] and not sample['ok']
+    assert sample['first_token_ms'] is not None
+
+
+def test_completed_stream_is_closed(stub_client):
+    body = ''.join(_open_stream())
+
+    assert 'event: done' in body
+    assert stub_client.chat.completions.last_stream.closed
@@ -0,0 +1,99 @@
+"""
+fetch_kaito_projects: stale-while-revalidate, fallback di-cache, backoff setelah scrape gagal
+"""
+
+import threading
+import time
+
+import pytest
+
+import app as app_module
+
+PROJECTS = [{'name': 'Monad', 'mindshare': 'High', 'category': 'Layer 1'}]
+FRESH = [{'name': 'Base', 'mindshare': 'High', 'category': 'Layer 2'}]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = {
+        'projects': None, 'fetched_at': 0.0, 'failed_at': 0.0, 'fallback': False, 'refreshing': False,
+        'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'refresh_errors': 0,
+    }
+    assert cache.keys() == app_module._projects_cache.keys()
+    monkeypatch.setattr(app_module, '_projects_cache', cache)
+    monkeypatch.setattr(app_module, 'KAITO_CACHE_TTL', 60)
+    monkeypatch.setattr(app_module, 'KAITO_FAILURE_BACKOFF', 30)
+    return cache
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    calls = []
+    results = []
+
+    def scrape():
+        calls.append(threading.current_thread() is threading.main_thread())
+        return results.pop(0) if results else None
+    monkeypatch.setattr(app_module, 'scrape_kaito_projects', scrape)
+    return calls, results
+
+
+def _wait_refreshed(cache):
+    deadline = time.time() + 2
+    while cache['refreshing'] and time.time() < deadline:
+        time.sleep(0.01)
+    assert not cache['refreshing']
+
+
+def test_fresh_cache_hit_does_not_scrape(cache, scraper):
+    calls, results = scraper
+    results.append(PROJECTS)
+
+    assert app_module.fetch_kaito_projects() == PROJECTS
+    assert app_module.fetch_kaito_projects() == PROJECTS
+    assert len(calls) == 1
+    assert (cache['misses'], cache['hits']) == (1, 1)
+
+
+def test_stale_entry_is_served_while_refreshing_in_background(cache, scraper):
+    calls, results = scraper
+    results.extend([PROJECTS, FRESH])
+    app_module.fetch_kaito_projects()
+    cache['fetched_at'] -= 120
+
+    assert app_module.fetch_kaito_projects() == PROJECTS
+    _wait_refreshed(cache)
+
+    assert calls == [True, False]
+    assert cache['stale_hits'] == 1
+    assert app_module.fetch_kaito_projects() == FRESH
+
+
+def test_failed_cold_scrape_caches_fallback(cache, scraper):
+    calls, _ = scraper
+
+    assert app_module.fetch_kaito_projects() == app_module.get_fallback_projects()
+    assert cache['fallback'] and cache['refresh_errors'] == 1
+    # Fallback = data stale: request berikutnya tidak scrape inline, dan masih dalam backoff
+    assert app_module.fetch_kaito_projects() == app_module.get_fallback_projects()
+    assert len(calls) == 1
+
+
+def test_failed_refresh_keeps_old_data_and_backs_off(cache, scraper):
+    calls, results = scraper
+    results.append(PROJECTS)
+    app_module.fetch_kaito_projects()
+    cache['fetched_at'] -= 120
+
+    app_module.fetch_kaito_projects()
+    _wait_refreshed(cache)
+    assert cache['refresh_errors'] == 1
+
+    # Masih stale, tapi dalam KAITO_FAILURE_BACKOFF: tidak ada refresh baru
+    assert app_module.fetch_kaito_projects() == PROJECTS
+    assert len(calls) == 2 and not cache['refreshing']
+
+    cache['failed_at'] -= 60
+    app_module.fetch_kaito_projects()
+    _wait_refreshed(cache)
+    assert len(calls) == 3
@@ -0,0 +1,82 @@
+"""
+leaderboard: _RankedList dan rank / percentile / top dibandingkan dengan brute force
+"""
+
+import random
+
+import pytest
+
+import leaderboard
+from leaderboard import Leaderboard, _RankedList
+
+
+@pytest.fixture(autouse=True)
+def small_buckets(monkeypatch):
+    # Bucket kecil supaya split / hapus bucket kosong ikut teruji
+    monkeypatch.setattr(leaderboard, 'BUCKET_LOAD', 4)
+
+
+def test_ranked_list_matches_sorted_list():
+    rng = random.Random(3)
+    ranked, expected = _RankedList(), []
+    for _ in range(3000):
+        if expected and rng.random() < 0.4:
+            key = rng.choice(expected)
+            ranked.remove(key)
+            expected.remove(key)
+        else:
+            key = rng.randrange(500)
+            ranked.add(key)
+            expected.append(key)
+        expected.sort()
+
+        probe = rng.randrange(-10, 510)
+        assert ranked.count_less(probe) == sum(1 for k in expected if k < probe)
+    assert list(ranked) == expected
+    assert len(ranked) == len(expected)
+    for n in (0, 1, 7, len(expected), len(expected) + 5):
+        assert ranked.head(n) == expected[:n]
+
+
+@pytest.mark.parametrize('n', [0, -1, -5])
+def test_head_non_positive_is_empty(n):
+    ranked = _RankedList()
+    for key in range(50):
+        ranked.add(key)
+
+    assert ranked.head(n) == []
+
+
+def _attestation(att_id, user_id, timestamp, points, revoked=False):
+    return {'id': att_id, 'revoked': revoked, 'timeCreated': timestamp,
+            'fields': {'twitterUserId': user_id, 'timestamp': timestamp, 'yapScaledPoints': points}}
+
+
+def test_leaderboard_matches_brute_force():
+    rng = random.Random(11)
+    history = {}
+    board = Leaderboard('0xschema', resolve_previous=lambda user_id, exclude_id: next(
+        (att for att in reversed(history[user_id]) if att['id'] != exclude_id and not att['revoked']), None))
+
+    for i in range(1500):
+        user_id = str(rng.randrange(60))
+        if history.get(user_id) and rng.random() < 0.15:
+            # Revoke attestation terbaru user
+            latest = history[user_id][-1]
+            latest['revoked'] = True
+            board.revoke(latest['id'])
+            history[user_id].pop()
+            continue
+        att = _attestation(f"0x{i:04x}", user_id, 1000 + i, rng.randrange(50))
+        history.setdefault(user_id, []).append(att)
+        board.apply(att)
+
+    latest = {user_id: atts[-1]['fields']['yapScaledPoints'] for user_id, atts in history.items() if atts}
+    assert len(board) == len(latest)
+    for user_id, points in latest.items():
+        assert board.rank(user_id) == 1 + sum(1 for p in latest.values() if p > points)
+        assert board.percentile(user_id) == pytest.approx(
+            100.0 * sum(1 for p in latest.values() if p < points) / len(latest))
+    expected_top = sorted(latest.items(), key=lambda item: (-item[1], item[0]))[:10]
+    assert [(e['twitter_user_id'], e['points']) for e in board.top(10)] == expected_top
+    assert board.top(-5) == []
@@ -0,0 +1,17 @@
+"""
+llm_client: satu shared OpenAI client per API key, rebuild hanya saat key berubah
+"""
+
+import llm_client
+
+
+def test_client_reused_and_rebuilt_on_key_rotation(monkeypatch):
+    monkeypatch.setattr(llm_client, '_client_entry', None)
+
+    first = llm_client.get_openai_client('sk-first')
+    assert llm_client.get_openai_client('sk-first') is first
+
+    rotated = llm_client.get_openai_client('sk-rotated')
+    assert rotated is not first
+    assert rotated.api_key == 'sk-rotated'
+    assert llm_client._client_entry == (llm_client._key_hash('sk-rotated'), rotated)
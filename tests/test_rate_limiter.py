@@ -0,0 +1,81 @@
+"""
+rate_limiter: AIMD atas rate dan concurrency, cooldown per burst error, Retry-After pause
+"""
+
+import threading
+import time
+
+import pytest
+
+import rate_limiter
+from rate_limiter import AdaptiveLimiter
+
+
+def test_throttle_halves_rate_and_concurrency_once_per_burst():
+    limiter = AdaptiveLimiter(max_rate=100, max_concurrency=8)
+    for _ in range(3):
+        limiter.acquire()
+    for _ in range(3):
+        limiter.release(throttled=True)
+
+    stats = limiter.stats()
+    assert (stats['rate'], stats['concurrency']) == (50, 4)
+    assert (stats['throttled'], stats['decreases']) == (3, 1)
+
+
+def test_next_burst_after_cooldown_decreases_again(monkeypatch):
+    monkeypatch.setattr(rate_limiter, 'DECREASE_COOLDOWN', 0.0)
+    limiter = AdaptiveLimiter(max_rate=100, max_concurrency=8, min_rate=20, min_concurrency=3)
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release(throttled=True)
+
+    # Dibatasi min_rate / min_concurrency
+    assert (limiter.rate, limiter.concurrency) == (20, 3)
+
+
+def test_success_recovers_additively_up_to_max():
+    limiter = AdaptiveLimiter(max_rate=10, max_concurrency=4, initial_concurrency=1)
+    limiter.rate = 5
+    for _ in range(200):
+        limiter.acquire()
+        limiter.release()
+        limiter._tokens = limiter.burst
+
+    assert (limiter.rate, limiter.concurrency) == (10, 4)
+
+
+def test_token_bucket_limits_rate():
+    limiter = AdaptiveLimiter(max_rate=20, burst=1, max_concurrency=4)
+    started = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+        limiter.cancel()
+
+    # Token pertama dari burst, 4 berikutnya masing-masing ~1/20 detik
+    assert time.monotonic() - started == pytest.approx(0.2, abs=0.1)
+
+
+def test_concurrency_limit_blocks_until_release():
+    limiter = AdaptiveLimiter(max_rate=1000, max_concurrency=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire()
+        acquired.set()
+    threading.Thread(target=second, daemon=True).start()
+
+    assert not acquired.wait(0.1)
+    limiter.cancel()
+    assert acquired.wait(1)
+
+
+def test_retry_after_pauses_all_callers():
+    limiter = AdaptiveLimiter(max_rate=1000, max_concurrency=4)
+    limiter.acquire()
+    limiter.release(throttled=True, retry_after=0.3)
+
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.25
@@ -0,0 +1,47 @@
+"""
+schema_registry: lookup index / field name, dan satu format print untuk CLI dan scripts
+"""
+
+import pytest
+
+import schema_registry
+import yaps
+
+SCHEMA = {
+    'id': '0x' + '51' * 32,
+    'index': '517',
+    'schema': 'uint64 twitterUserId,uint256 yapScaledPoints,uint256 yap24HScaledPoints',
+    'creator': '0xdeee2a0118dE2515B22eDA764582dEA830C5432C',
+    'txid': '0x' + 'ab' * 32,
+    'time': 1700000000,
+}
+
+
+@pytest.fixture
+def registry(monkeypatch, tmp_path):
+    path = str(tmp_path / 'schemas.sqlite3')
+    registry = schema_registry.SchemaRegistry(path)
+    registry._commit_batch([SCHEMA])
+    monkeypatch.setattr(schema_registry, '_default_registry', registry)
+    yield path
+    registry.close()
+
+
+def test_lookups(registry):
+    registry = schema_registry.get_registry()
+
+    assert registry.by_index(517, refresh_on_miss=False)['id'] == SCHEMA['id']
+    assert [s['index'] for s in registry.with_field('twitteruserid')] == [517]
+    assert [s['index'] for s in registry.search_fields('24h')] == [517]
+    assert registry.search_fields('nope') == []
+
+
+def test_cli_and_registry_print_the_same_layout(registry, capsys):
+    assert yaps.main(['schemas', '--index', '517']) == 0
+    from_cli = capsys.readouterr().out
+
+    assert schema_registry.main(['--db', registry, 'index', '517']) == 0
+    from_registry = capsys.readouterr().out
+
+    assert from_cli == from_registry
+    assert f"UID: {SCHEMA['id']}" in from_cli
@@ -0,0 +1,71 @@
+"""
+score_timeseries: build dari stream newest-first / acak sama dengan insert satu per satu
+"""
+
+import random
+
+from score_timeseries import DAY, UserTimeSeriesIndex
+
+
+def _attestation(user_id, timestamp, points, revoked=False):
+    return {'revoked': revoked, 'fields': {'twitterUserId': user_id, 'timestamp': timestamp, 'yapScaledPoints': points}}
+
+
+def _brute_force(points):
+    index = UserTimeSeriesIndex()
+    for point in points:
+        index.add(*point)
+    return index
+
+
+def test_bulk_build_matches_incremental_insert():
+    rng = random.Random(7)
+    points = [(str(rng.randrange(20)), rng.randrange(0, 60 * DAY), rng.randrange(10 ** 6)) for _ in range(3000)]
+    # Timestamp unik supaya urutan tie tidak ambigu
+    points = list({(user, ts): (user, ts, value) for user, ts, value in points}.values())
+    rng.shuffle(points)
+
+    bulk = UserTimeSeriesIndex()
+    bulk.add_many(points[:1000])
+    bulk.add_many(points[1000:])
+
+    assert bulk.series == _brute_force(points).series
+
+
+def test_newest_first_attestations():
+    attestations = [_attestation('1', ts, ts * 10) for ts in range(1000, 0, -1)]
+    attestations.append(_attestation('1', 5000, 1, revoked=True))
+
+    index = UserTimeSeriesIndex.from_attestations(attestations)
+
+    assert index.latest('1') == (1000, 10000)
+    assert index.points_at('1', 500) == 5000
+    assert index.gained('1', 100, 200) == 1000
+    assert index.gained('2', 100, 200) is None
+
+
+def test_straggler_after_bulk_build():
+    index = UserTimeSeriesIndex.from_attestations([_attestation('1', ts, ts) for ts in (30, 10, 20)])
+    index.add('1', 15, 15)
+
+    assert index.snapshots('1') == [(10, 10), (15, 15), (20, 20), (30, 30)]
+
+
+def test_window_starting_before_first_snapshot_uses_first_snapshot_as_baseline():
+    # Attester mulai publish di hari ke-10 saat user sudah punya 50.000 points
+    start = 10 * DAY
+    index = UserTimeSeriesIndex.from_attestations([
+        _attestation('1', start + 3600, 50000),
+        _attestation('1', start + DAY + 3600, 50400),
+        _attestation('1', start + 2 * DAY + 3600, 51000),
+    ])
+    now = start + 2 * DAY + 3600
+
+    assert index.gained('1', now - 30 * DAY, now) == 1000
+    assert index.gained('1', 0, start) is None
+    assert index.daily_deltas('1', days=4, now=now) == [
+        ('1970-01-10', None),
+        ('1970-01-11', 0),
+        ('1970-01-12', 400),
+        ('1970-01-13', 600),
+    ]
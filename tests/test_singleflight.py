@@ -0,0 +1,72 @@
+"""
+singleflight: concurrent call dengan key sama = satu eksekusi, hasil / exception di-share
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from singleflight import SingleFlight, request_key
+
+CALLERS = 8
+
+
+def _wait_for_waiters(flight, key):
+    """Leader baru selesai setelah semua caller lain ikut menunggu"""
+    deadline = time.time() + 2
+    while flight._calls[key].waiters < CALLERS - 1 and time.time() < deadline:
+        time.sleep(0.005)
+
+
+def _burst(flight, key, fn):
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(flight.do, key, fn) for _ in range(CALLERS)]
+        return [f.exception() or f.result() for f in futures]
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        _wait_for_waiters(flight, 'kaito')
+        return {'projects': 20}
+
+    results = _burst(flight, 'kaito', fetch)
+
+    assert len(calls) == 1
+    assert all(result == {'projects': 20} for result in results)
+    assert flight.stats() == {'executed': 1, 'shared': CALLERS - 1, 'in_flight': 0}
+
+
+def test_exception_is_shared_and_next_call_runs_again():
+    flight = SingleFlight()
+
+    def failing():
+        _wait_for_waiters(flight, 'kaito')
+        raise RuntimeError('upstream down')
+
+    errors = _burst(flight, 'kaito', failing)
+    assert all(isinstance(e, RuntimeError) for e in errors)
+
+    # Key sudah dilepas: call berikutnya dieksekusi ulang
+    assert flight.do('kaito', lambda: 'ok') == 'ok'
+    assert flight.stats()['executed'] == 2
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+
+    assert [flight.do('k', lambda i=i: i) for i in range(3)] == [0, 1, 2]
+    assert flight.stats()['shared'] == 0
+
+
+@pytest.mark.parametrize('a, b, same', [
+    ({'x': 1, 'y': 2}, {'y': 2, 'x': 1}, True),
+    ({'x': 1}, {'x': 2}, False),
+    (None, {}, True),
+])
+def test_request_key_ignores_variable_order(a, b, same):
+    assert (request_key('u', 'q', a) == request_key('u', 'q', b)) is same
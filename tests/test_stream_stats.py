@@ -0,0 +1,69 @@
+"""
+stream_stats: LogHistogram quantile dalam relative accuracy, merge, dan FrequentItems (Misra-Gries)
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from stream_stats import FrequentItems, LogHistogram
+
+QS = [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+
+def _exact(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(5)
+    values = [int(rng.lognormvariate(12, 3)) for _ in range(20000)] + [0] * 500
+    histogram = LogHistogram(relative_accuracy=0.01)
+    for value in values:
+        histogram.add(value)
+
+    for q, estimate in zip(QS, histogram.quantiles(QS)):
+        assert estimate == pytest.approx(_exact(values, q), rel=0.01)
+    assert (histogram.min, histogram.max, histogram.count) == (min(values), max(values), len(values))
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+
+def test_merge_equals_single_histogram():
+    rng = random.Random(9)
+    values = [rng.randrange(1, 10 ** 9) for _ in range(5000)]
+    whole, left, right = LogHistogram(), LogHistogram(), LogHistogram()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 2 else right).add(value)
+    left.merge(right)
+
+    assert left.quantiles(QS) == whole.quantiles(QS)
+    assert (left.count, left.sum, left.min, left.max) == (whole.count, whole.sum, whole.min, whole.max)
+    with pytest.raises(ValueError):
+        left.merge(LogHistogram(relative_accuracy=0.05))
+
+
+def test_empty_and_negative():
+    histogram = LogHistogram()
+    assert histogram.median is None and histogram.mean is None
+    with pytest.raises(ValueError):
+        histogram.add(-1)
+
+
+def test_frequent_items_keeps_heavy_hitters_within_bound():
+    rng = random.Random(1)
+    stream = ['hot-a'] * 3000 + ['hot-b'] * 1500 + [f"cold-{rng.randrange(5000)}" for _ in range(10000)]
+    rng.shuffle(stream)
+    capacity = 50
+    items = FrequentItems(capacity=capacity)
+    for item in stream:
+        items.add(item)
+
+    exact = Counter(stream)
+    error_bound = len(stream) / (capacity + 1)
+    assert [item for item, _ in items.most_common(2)] == ['hot-a', 'hot-b']
+    assert len(items.counters) <= capacity
+    for item, count in items.counters.items():
+        assert exact[item] - error_bound <= count <= exact[item]
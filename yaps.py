@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+yaps - satu CLI untuk script analisis YAPS on-chain
+
+Usage:
+    python yaps.py schemas --index 517 546          # lookup via schema registry
+    python yaps.py schemas --field yapScaledPoints
+    python yaps.py schemas --search yap score
+    python yaps.py attestations --schema 525 --limit 20
+    python yaps.py check 1422186185196113922 --schema 517 --schema 546
+    python yaps.py analyze --schema 517 [--patterns]
+    python yaps.py leaderboard --schema 517 --top 20 --user 1422186185196113922
+    python yaps.py watch --schema 517 --user 1422186185196113922
+    python yaps.py profile                          # ringkasan parameter scoring
+
+Schema bisa ditulis sebagai UID (0x...), nomor (517) atau #517. Module berat
+(requests, script analisis) baru di-import di dalam subcommand yang memakainya,
+jadi --help dan lookup dari cache lokal start tanpa memuat HTTP stack.
+"""
+
+import argparse
+import sys
+
+
+def _resolve(values):
+    from eas import resolve_schema
+    return [resolve_schema(value) for value in values]
+
+
+def cmd_schemas(args):
+    from schema_registry import get_registry, print_schema
+
+    registry = get_registry()
+    if args.refresh:
+        result = registry.refresh()
+        print(f"✅ +{result['fetched']:,} schemata, {result['total']:,} total")
+    else:
+        registry.ensure_fresh()
+
+    schemas = []
+    for index in args.index or []:
+        schema = registry.by_index(index)
+        if schema is None:
+            print(f"❌ Schema #{index} tidak ditemukan")
+        else:
+            schemas.append(schema)
+    if args.field:
+        schemas.extend(registry.with_field(args.field))
+    if args.search:
+        schemas.extend(registry.search_fields(*args.search))
+    if not (args.index or args.field or args.search or args.refresh):
+        print(f"📦 {registry.count():,} schemata di registry")
+
+    for schema in schemas:
+        print_schema(schema)
+    return 0
+
+
+def cmd_attestations(args):
+    from attestation_store import get_store, iter_attestations
+
+    schema_uid = _resolve([args.schema])[0]
+    if args.sync:
+        result = get_store().sync(schema_uid)
+        print(f"✅ +{result['fetched']:,} new, {result['total']:,} total")
+
+    count = 0
+    for att in iter_attestations(schema_uid, limit=args.limit):
+        count += 1
+        print(f"\n🔹 {att['id'][:20]}...  timeCreated={att['timeCreated']}  revoked={att.get('revoked')}")
+        for name, value in att['fields'].items():
+            print(f"   • {name}: {value}")
+    print(f"\n✅ {count} attestation(s)")
+    return 0
+
+
+def cmd_check(args):
+    from check_my_yaps import DEFAULT_SCHEMAS, check_yaps_score
+
+    if args.schema:
+        schemas = {f"Schema {value}": uid for value, uid in zip(args.schema, _resolve(args.schema))}
+    else:
+        schemas = DEFAULT_SCHEMAS
+    check_yaps_score(args.twitter_user_id, schemas, days=args.days)
+    return 0
+
+
+def cmd_analyze(args):
+    schema_uid = _resolve([args.schema])[0]
+    if args.patterns:
+        from explore_new_schema import analyze_scoring_patterns
+        analyze_scoring_patterns(schema_uid)
+    else:
+        from analyze_yaps_algorithm import analyze_yaps_attestations
+        analyze_yaps_attestations(schema_uid, limit=args.limit)
+    return 0
+
+
+def cmd_leaderboard(args):
+    from leaderboard import main as leaderboard_main
+    argv = ['--schema', args.schema, '--top', str(args.top)]
+    argv += [value for user in args.user or [] for value in ('--user', user)]
+    argv += ['--sync'] if args.sync else []
+    return leaderboard_main(argv)
+
+
+def cmd_watch(args):
+    from live_tail import AttestationTail
+
+    tail = AttestationTail(_resolve(args.schema or ['517', '546', '525']), min_interval=args.interval)
+    subscriber = tail.subscribe()
+    print(f"👀 Watching {len(tail.schema_uids)} schema(s), Ctrl+C untuk berhenti")
+    while True:
+        event = subscriber.get()
+        if args.user and event.get('twitter_user_id') != args.user:
+            continue
+        delta = f"{event['delta']:+,}" if event.get('delta') is not None else "baru"
+        who = event.get('twitter_user_id', '-')
+        points = f"{event['points']:,}" if 'points' in event else '-'
+        print(f"🔔 {event['schema_uid'][:10]}... {who:<20} points={points:<16} delta={delta}")
+
+
+def cmd_profile(args):
+    from yaps_scoring_parameters import print_scoring_parameters
+    print_scoring_parameters()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='yaps', description="YAPS on-chain analysis tools")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    schemas = sub.add_parser('schemas', help="Lookup schemata via local schema registry")
+    schemas.add_argument('--index', type=int, nargs='+', help="EAS schema index (mis. 517 546)")
+    schemas.add_argument('--field', help="Schemata dengan field name persis")
+    schemas.add_argument('--search', nargs='+', help="Schemata dengan field name mengandung keyword")
+    schemas.add_argument('--refresh', action='store_true', help="Paksa incremental refresh")
+    schemas.set_defaults(func=cmd_schemas)
+
+    attestations = sub.add_parser('attestations', help="Attestations terbaru satu schema")
+    attestations.add_argument('--schema', default='525', help="Schema UID atau nomor (default 525)")
+    attestations.add_argument('--limit', type=int, default=20)
+    attestations.add_argument('--sync', action='store_true', help="Sync local store dulu")
+    attestations.set_defaults(func=cmd_attestations)
+
+    check = sub.add_parser('check', help="YAPS score satu Twitter user")
+    check.add_argument('twitter_user_id')
+    check.add_argument('--schema', action='append', help="Schema UID atau nomor; default 517 dan 546")
+    check.add_argument('--days', type=int, default=30, help="Jumlah hari untuk daily deltas (default 30)")
+    check.set_defaults(func=cmd_check)
+
+    analyze = sub.add_parser('analyze', help="Analisis distribusi scoring satu schema")
+    analyze.add_argument('--schema', default='517', help="Schema UID atau nomor (default 517)")
+    analyze.add_argument('--limit', type=int, help="Batasi ke N attestation terbaru (default seluruh history)")
+    analyze.add_argument('--patterns', action='store_true', help="Statistik semua field atas seluruh history schema")
+    analyze.set_defaults(func=cmd_analyze)
+
+    leaderboard = sub.add_parser('leaderboard', help="Top yappers, rank & percentile user")
+    leaderboard.add_argument('--schema', default='517', help="Schema UID atau nomor (default 517)")
+    leaderboard.add_argument('--top', type=int, default=20)
+    leaderboard.add_argument('--user', action='append', help="twitterUserId untuk rank & percentile")
+    leaderboard.add_argument('--sync', action='store_true', help="Incremental sync dulu")
+    leaderboard.set_defaults(func=cmd_leaderboard)
+
+    watch = sub.add_parser('watch', help="Live tail attestations baru (delta points per user)")
+    watch.add_argument('--schema', action='append', help="Schema UID atau nomor; default 517, 546, 525")
+    watch.add_argument('--user', help="Hanya tampilkan twitterUserId ini")
+    watch.add_argument('--interval', type=float, default=5, help="Interval poll minimum (detik)")
+    watch.set_defaults(func=cmd_watch)
+
+    profile = sub.add_parser('profile', help="Ringkasan parameter scoring YAPS")
+    profile.set_defaults(func=cmd_profile)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    from abi_decoder import ABIDecodeError
+    from eas import EASQueryError
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    except (EASQueryError, ABIDecodeError, OSError) as e:
+        # GraphQL / network error (requests.RequestException turunan OSError): pesan singkat
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
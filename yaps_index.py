@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+In-memory index latest YAPS points per twitterUserId untuk /api/yaps
+
+Entry per user berisi attestation non-revoked terbaru di setiap schema
+(#517/#546/#525) plus ETag. Entry fresh dijawab langsung dari memory; entry
+yang lewat TTL tetap diserve sambil di-refresh di background, dan refresher
+thread secara periodik me-refresh entry yang sering diakses sebelum expired.
+Miss dan refresh di-fetch dari easscan (server-side filter per user), satu
+fetch per user walaupun request concurrent; local attestation_store hanya
+dipakai sebagai fallback saat easscan tidak bisa dijangkau (store tidak di-sync
+oleh web app, jadi bisa tertinggal). Integer di `fields` dikirim sebagai string.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import eas
+from score_timeseries import snapshot
+from singleflight import SingleFlight
+
+INDEX_TTL = int(os.getenv('YAPS_INDEX_TTL', '300'))
+INDEX_MAX_ENTRIES = int(os.getenv('YAPS_INDEX_MAX_ENTRIES', '50000'))
+# Berapa entry hot yang di-refresh per putaran refresher
+REFRESH_BATCH = 200
+FETCH_WORKERS = 8
+# Hanya attestation valid terbaru yang dibutuhkan; revoked jarang, jadi page kecil cukup
+LOOKUP_PAGE_SIZE = 5
+
+
+def _first_valid(attestations):
+    for att in attestations:
+        if not att.get('revoked'):
+            return att
+    return None
+
+
+def _synced_store(schema_uid):
+    """Local store jika schema sudah pernah di-sync dan store bisa dibuka, selain itu None"""
+    try:
+        from attestation_store import get_store
+        store = get_store()
+        return store if store.is_synced(schema_uid) else None
+    except Exception:
+        return None
+
+
+def _latest_valid(schema_uid, twitter_user_id):
+    """Attestation non-revoked terbaru satu user di satu schema, atau None"""
+    try:
+        # Berhenti di row valid pertama: page berikutnya tidak pernah di-request
+        return _first_valid(eas.iter_user_attestations(schema_uid, twitter_user_id, page_size=LOOKUP_PAGE_SIZE))
+    except Exception:
+        # Cold start / easscan down: fallback ke local store (mungkin tertinggal)
+        store = _synced_store(schema_uid)
+        if store is None:
+            raise
+        return _first_valid(store.user_attestations(schema_uid, twitter_user_id))
+
+
+def _schema_summary(att):
+    if att is None:
+        return None
+    point = snapshot(att)
+    return {
+        'attestation_id': att['id'],
+        'time_created': int(att['timeCreated']),
+        'points': point[2] if point else None,
+        'fields': eas.json_safe_fields(att['fields']),
+    }
+
+
+class UserScoreIndex:
+    """TTL + LRU cache twitterUserId -> latest points per schema"""
+
+    def __init__(self, schemas, ttl=INDEX_TTL, max_entries=INDEX_MAX_ENTRIES):
+        # schemas: {label (mis. '517'): schema UID}
+        self.schemas = dict(schemas)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._refreshing = set()
+        self._flight = SingleFlight()
+        self._refresher = None
+        # Semua refresh (stale hit + refresher loop) lewat pool terbatas
+        self._executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="yaps-index-refresh")
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    # --- fetch ---
+
+    def _fetch(self, twitter_user_id):
+        schemas = {}
+        results = eas.fetch_schemas(
+            self.schemas.values(), lambda schema_uid: _latest_valid(schema_uid, twitter_user_id)
+        )
+        for label, (_, att, error) in zip(self.schemas, results):
+            if error is not None:
+                raise error
+            schemas[label] = _schema_summary(att)
+        body = json.dumps(schemas, sort_keys=True, default=str)
+        return {
+            'twitter_user_id': twitter_user_id,
+            'schemas': schemas,
+            'etag': hashlib.sha1(body.encode()).hexdigest(),
+            'fetched_at': time.time(),
+        }
+
+    def _load(self, twitter_user_id):
+        """Fetch + simpan satu entry (concurrent caller untuk user yang sama di-coalesce)"""
+        entry = self._flight.do(twitter_user_id, self._fetch, twitter_user_id)
+        with self._lock:
+            entry['accessed_at'] = self._entries.get(twitter_user_id, entry).get('accessed_at', time.time())
+            self._entries[twitter_user_id] = entry
+            self._entries.move_to_end(twitter_user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _refresh_background(self, twitter_user_id):
+        failed = True
+        try:
+            self._load(twitter_user_id)
+            failed = False
+        except Exception:
+            pass
+        finally:
+            # Dijalankan di banyak refresh thread: counter diupdate di bawah lock
+            with self._lock:
+                self._refreshing.discard(twitter_user_id)
+                if failed:
+                    self.refresh_errors += 1
+                else:
+                    self.refreshes += 1
+
+    # --- lookups ---
+
+    def get(self, twitter_user_id):
+        """Entry satu user (stale-while-revalidate); fetch sinkron hanya saat miss"""
+        twitter_user_id = str(twitter_user_id)
+        self._ensure_refresher()
+        with self._lock:
+            entry = self._entries.get(twitter_user_id)
+            if entry is not None:
+                self._entries.move_to_end(twitter_user_id)
+                entry['accessed_at'] = time.time()
+                if time.time() - entry['fetched_at'] < self.ttl:
+                    self.hits += 1
+                    return entry
+                # Stale: serve data lama, refresh di background
+                self.stale_hits += 1
+                if twitter_user_id not in self._refreshing:
+                    self._refreshing.add(twitter_user_id)
+                    self._executor.submit(self._refresh_background, twitter_user_id)
+                return entry
+            self.misses += 1
+        return self._load(twitter_user_id)
+
+    def get_many(self, twitter_user_ids):
+        """Entry beberapa user; miss di-fetch paralel. Return {id: entry atau {'error': ...}}"""
+        ids = list(dict.fromkeys(str(user_id) for user_id in twitter_user_ids))
+        results = {}
+
+        def lookup(user_id):
+            try:
+                return user_id, self.get(user_id)
+            except Exception as e:
+                return user_id, {'twitter_user_id': user_id, 'error': str(e)}
+
+        if len(ids) <= 1:
+            pairs = [lookup(user_id) for user_id in ids]
+        else:
+            with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(ids))) as executor:
+                pairs = list(executor.map(lookup, ids))
+        results.update(pairs)
+        return results
+
+    def max_age(self, entry):
+        """Sisa TTL entry dalam detik (untuk Cache-Control)"""
+        return max(0, int(self.ttl - (time.time() - entry['fetched_at'])))
+
+    # --- periodic refresh ---
+
+    def _ensure_refresher(self):
+        if self._refresher is not None:
+            return
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(target=self._refresh_loop, name="yaps-index-refresh", daemon=True)
+                self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(max(1, self.ttl / 2))
+            now = time.time()
+            with self._lock:
+                # Entry yang diakses dalam satu TTL terakhir dan sudah lewat setengah TTL
+                due = [user_id for user_id, entry in reversed(self._entries.items())
+                       if now - entry['accessed_at'] < self.ttl
+                       and now - entry['fetched_at'] >= self.ttl / 2
+                       and user_id not in self._refreshing][:REFRESH_BATCH]
+                self._refreshing.update(due)
+            if due:
+                list(self._executor.map(self._refresh_background, due))
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                'entries': len(self._entries),
+                'refreshing': len(self._refreshing),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+            }
+        stats['ttl'] = self.ttl
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['stale_hits']) / lookups, 4) if lookups else None
+        return stats
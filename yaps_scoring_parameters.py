@@ -4,125 +4,129 @@ YAPS Scoring Parameters - Complete Summary
 Based on: On-chain schema analysis + Official Kaito FAQ + Algorithm research
 """
 
-print("="*100)
-print("🎯 KAITO YAPS SCORING PARAMETERS - COMPLETE GUIDE")
-print("="*100)
-
-print("\n📊 SCHEMA STRUCTURE (On-Chain - Schema #525):")
-print("-"*100)
-print("Schema UID: 0xcb66276cf243e78fad68dd5e633f7bb56814b49ac9a91256615340591577a0e8")
-print("Created: 2025-01-05")
-print("Creator: 0xdeee2a0118dE2515B22eDA764582dEA830C5432C")
-print("\nFields:")
-print("  • uint64 twitterUserId      - Twitter user identifier")
-print("  • string twitterUsername    - Twitter handle")
-print("  • uint64 yapPoints          - Total YAPS points earned")
-print("  • uint64 timestamp          - Last update timestamp")
-
-print("\n\n🧮 SCORING ALGORITHM - 3 CORE FACTORS:")
-print("="*100)
-
-print("\n1️⃣  CRYPTO RELEVANCE (Content Quality)")
-print("-"*100)
-print("Weight: ~30% (estimated)")
-print("\nParameters:")
-print("  ✓ Topic Relevance:")
-print("    - Crypto-specific discussions (DeFi, L2, protocols, trading)")
-print("    - Technical depth vs superficial mentions")
-print("    - No overweighting for specific projects/mentions")
-print("  ✓ Original Content:")
-print("    - LLM-based plagiarism detection")
-print("    - Unique insights vs. news aggregation")
-print("    - Quality > Quantity philosophy")
-print("  ✓ Insightfulness:")
-print("    - Data-backed analysis")
-print("    - Educational value")
-print("    - Depth of discussion")
-print("\nThresholds:")
-print("  • Minimum: 50+ characters (estimated)")
-print("  • Spam filter: LLM-based low-effort content exclusion")
-print("  • Keyword stuffing: Penalized by AI detection")
-
-print("\n2️⃣  REPUTATION-WEIGHTED ENGAGEMENT (50% weight - MOST IMPORTANT)")
-print("-"*100)
-print("Weight: ~50% (confirmed as primary factor)")
-print("\nSmart Followers System:")
-print("  ✓ Definition:")
-print("    - CT accounts with HIGHEST inter-following ratios")
-print("    - Dynamically maintained through algorithms")
-print("    - Objective, data-driven selection")
-print("  ✓ Engagement Types:")
-print("    - Likes, retweets, replies (reputation-weighted)")
-print("    - Meaningful interactions > raw impressions")
-print("    - Influence-based scoring (not raw follower count)")
-print("\nTime Window:")
-print("  • Rolling window per tweet: ~7 days contribution period")
-print("  • Mimics 24-hour timeline decay pattern")
-print("  • Recent activity weighted more heavily")
-print("\nThreshold:")
-print("  • Minimum cumulative eligible engagement required")
-print("  • Below threshold = 0 points awarded")
-print("  • Reputation-weighted impact > raw metrics")
-
-print("\n3️⃣  SEMANTIC ANALYSIS (Content Intelligence)")
-print("-"*100)
-print("Weight: ~20% (estimated)")
-print("\nAI Evaluation:")
-print("  ✓ LLM-based scoring:")
-print("    - Multi-language support (no English bias)")
-print("    - Context understanding")
-print("    - Cultural nuance recognition")
-print("  ✓ Quality Metrics:")
-print("    - Original research/insights")
-print("    - Technical accuracy")
-print("    - Discussion depth")
-print("    - Educational contribution")
-print("\nPenalties:")
-print("  • Low-effort memes without context")
-print("  • Spam/repetitive posting")
-print("  • Buzzword stuffing without substance")
-print("  • Copy-paste content")
-
-print("\n\n⚙️  SYSTEM MECHANICS:")
-print("="*100)
-
-print("\n📅 Time Windows:")
-print("  • Update Frequency: Hourly for referral points")
-print("  • Rolling Periods: 24h, 48h, 7d, 30d, 3m, 6m, 12m")
-print("  • Tweet Contribution: 7-day earning window per tweet")
-print("  • Lag: Rolling window (not instant) for fair evaluation")
-
-print("\n🎲 Daily Distribution:")
-print("  • Total Daily Pool: ~24,000 YAPS across all users")
-print("  • Distribution: Based on relative performance")
-print("  • Competition: Zero-sum game among participants")
-
-print("\n🛡️  Anti-Gaming Measures:")
-print("  ✓ AI Spam Detection:")
-print("    - LLM-based content quality filter")
-print("    - Pattern recognition for bot behavior")
-print("    - Shadow ban mechanism for farming")
-print("  ✓ Reputation System:")
-print("    - Smart Followers weighting prevents fake engagement")
-print("    - Inter-following ratio analysis")
-print("    - Quality over quantity enforcement")
-print("  ✓ Threshold System:")
-print("    - Minimum engagement requirements")
-print("    - Below threshold = 0 points")
-
-print("\n👥 User Tiers (Estimated):")
-print("  • Yapper: 0 - 1M points")
-print("  • Emerging CT: 1M - 15M points")
-print("  • Inner Circle: 15M+ points")
-
-print("\n🔒 Referral System:")
-print("  • Referral points awarded when referee earns first YAPS")
-print("  • Update frequency: Hourly")
-print("  • Total YAPS = Earned YAPS + Referral YAPS")
-
-print("\n\n💡 PRACTICAL SCORING FORMULA (Reverse-Engineered):")
-print("="*100)
-print("""
+
+def print_scoring_parameters():
+    """Print ringkasan lengkap parameter scoring YAPS"""
+
+    print("="*100)
+    print("🎯 KAITO YAPS SCORING PARAMETERS - COMPLETE GUIDE")
+    print("="*100)
+
+    print("\n📊 SCHEMA STRUCTURE (On-Chain - Schema #525):")
+    print("-"*100)
+    print("Schema UID: 0xcb66276cf243e78fad68dd5e633f7bb56814b49ac9a91256615340591577a0e8")
+    print("Created: 2025-01-05")
+    print("Creator: 0xdeee2a0118dE2515B22eDA764582dEA830C5432C")
+    print("\nFields:")
+    print("  • uint64 twitterUserId      - Twitter user identifier")
+    print("  • string twitterUsername    - Twitter handle")
+    print("  • uint64 yapPoints          - Total YAPS points earned")
+    print("  • uint64 timestamp          - Last update timestamp")
+
+    print("\n\n🧮 SCORING ALGORITHM - 3 CORE FACTORS:")
+    print("="*100)
+
+    print("\n1️⃣  CRYPTO RELEVANCE (Content Quality)")
+    print("-"*100)
+    print("Weight: ~30% (estimated)")
+    print("\nParameters:")
+    print("  ✓ Topic Relevance:")
+    print("    - Crypto-specific discussions (DeFi, L2, protocols, trading)")
+    print("    - Technical depth vs superficial mentions")
+    print("    - No overweighting for specific projects/mentions")
+    print("  ✓ Original Content:")
+    print("    - LLM-based plagiarism detection")
+    print("    - Unique insights vs. news aggregation")
+    print("    - Quality > Quantity philosophy")
+    print("  ✓ Insightfulness:")
+    print("    - Data-backed analysis")
+    print("    - Educational value")
+    print("    - Depth of discussion")
+    print("\nThresholds:")
+    print("  • Minimum: 50+ characters (estimated)")
+    print("  • Spam filter: LLM-based low-effort content exclusion")
+    print("  • Keyword stuffing: Penalized by AI detection")
+
+    print("\n2️⃣  REPUTATION-WEIGHTED ENGAGEMENT (50% weight - MOST IMPORTANT)")
+    print("-"*100)
+    print("Weight: ~50% (confirmed as primary factor)")
+    print("\nSmart Followers System:")
+    print("  ✓ Definition:")
+    print("    - CT accounts with HIGHEST inter-following ratios")
+    print("    - Dynamically maintained through algorithms")
+    print("    - Objective, data-driven selection")
+    print("  ✓ Engagement Types:")
+    print("    - Likes, retweets, replies (reputation-weighted)")
+    print("    - Meaningful interactions > raw impressions")
+    print("    - Influence-based scoring (not raw follower count)")
+    print("\nTime Window:")
+    print("  • Rolling window per tweet: ~7 days contribution period")
+    print("  • Mimics 24-hour timeline decay pattern")
+    print("  • Recent activity weighted more heavily")
+    print("\nThreshold:")
+    print("  • Minimum cumulative eligible engagement required")
+    print("  • Below threshold = 0 points awarded")
+    print("  • Reputation-weighted impact > raw metrics")
+
+    print("\n3️⃣  SEMANTIC ANALYSIS (Content Intelligence)")
+    print("-"*100)
+    print("Weight: ~20% (estimated)")
+    print("\nAI Evaluation:")
+    print("  ✓ LLM-based scoring:")
+    print("    - Multi-language support (no English bias)")
+    print("    - Context understanding")
+    print("    - Cultural nuance recognition")
+    print("  ✓ Quality Metrics:")
+    print("    - Original research/insights")
+    print("    - Technical accuracy")
+    print("    - Discussion depth")
+    print("    - Educational contribution")
+    print("\nPenalties:")
+    print("  • Low-effort memes without context")
+    print("  • Spam/repetitive posting")
+    print("  • Buzzword stuffing without substance")
+    print("  • Copy-paste content")
+
+    print("\n\n⚙️  SYSTEM MECHANICS:")
+    print("="*100)
+
+    print("\n📅 Time Windows:")
+    print("  • Update Frequency: Hourly for referral points")
+    print("  • Rolling Periods: 24h, 48h, 7d, 30d, 3m, 6m, 12m")
+    print("  • Tweet Contribution: 7-day earning window per tweet")
+    print("  • Lag: Rolling window (not instant) for fair evaluation")
+
+    print("\n🎲 Daily Distribution:")
+    print("  • Total Daily Pool: ~24,000 YAPS across all users")
+    print("  • Distribution: Based on relative performance")
+    print("  • Competition: Zero-sum game among participants")
+
+    print("\n🛡️  Anti-Gaming Measures:")
+    print("  ✓ AI Spam Detection:")
+    print("    - LLM-based content quality filter")
+    print("    - Pattern recognition for bot behavior")
+    print("    - Shadow ban mechanism for farming")
+    print("  ✓ Reputation System:")
+    print("    - Smart Followers weighting prevents fake engagement")
+    print("    - Inter-following ratio analysis")
+    print("    - Quality over quantity enforcement")
+    print("  ✓ Threshold System:")
+    print("    - Minimum engagement requirements")
+    print("    - Below threshold = 0 points")
+
+    print("\n👥 User Tiers (Estimated):")
+    print("  • Yapper: 0 - 1M points")
+    print("  • Emerging CT: 1M - 15M points")
+    print("  • Inner Circle: 15M+ points")
+
+    print("\n🔒 Referral System:")
+    print("  • Referral points awarded when referee earns first YAPS")
+    print("  • Update frequency: Hourly")
+    print("  • Total YAPS = Earned YAPS + Referral YAPS")
+
+    print("\n\n💡 PRACTICAL SCORING FORMULA (Reverse-Engineered):")
+    print("="*100)
+    print("""
 YAPS = (Content_Quality × Smart_Engagement × Semantic_Score) × Base_Multiplier × Time_Decay
 
 Where:
@@ -137,9 +141,9 @@ Threshold Check:
       YAPS = 0  (No points awarded)
 """)
 
-print("\n\n🎯 CONTENT CREATION CHECKLIST:")
-print("="*100)
-print("""
+    print("\n\n🎯 CONTENT CREATION CHECKLIST:")
+    print("="*100)
+    print("""
 BEFORE POSTING:
   ☑ Crypto-focused topic (DeFi, L2, protocols, market analysis)
   ☑ Original insight (not copy-paste)
@@ -169,7 +173,11 @@ AVOID (Penalties):
   ❌ Spam posting
 """)
 
-print("\n" + "="*100)
-print("✨ Key Insight: Engagement from Smart Followers = 50% of your score")
-print("   Better to have 1 post engaged by 10 influencers than 10 posts with no engagement!")
-print("="*100)
+    print("\n" + "="*100)
+    print("✨ Key Insight: Engagement from Smart Followers = 50% of your score")
+    print("   Better to have 1 post engaged by 10 influencers than 10 posts with no engagement!")
+    print("="*100)
+
+
+if __name__ == "__main__":
+    print_scoring_parameters()